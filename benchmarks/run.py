@@ -0,0 +1,458 @@
+"""
+Benchmarks for the Israel School Holidays integration.
+
+Drives the integration's runtime paths against synthetic datasets of 10 to
+10,000 holiday rows spread over ten academic years:
+
+- dataset load and compilation (shards, holiday index, per-day calendar)
+- index and calendar lookups over a multi-year sweep of dates
+- SchoolHolidaysCoordinator._calculate_status and full coordinator refreshes
+- range queries (service evaluation, calendar timelines)
+- the state properties of the sensor and binary sensor entities
+- refresh fan-out and memory per entry for many config entries sharing one
+  engine, with and without per-entry overrides
+- remote dataset fetches, conditional revalidation and the offline cache,
+  against a local HTTP server (see StandInDatasetServer)
+
+Results are written as JSON (see --output) so they can be compared from
+release to release. Requires Home Assistant to be installed
+(pip install homeassistant); hass and the config entries are replaced by
+the stand-ins in standin.py.
+
+Usage:
+    python benchmarks/run.py [--sizes 10 100 1000 10000] [--entries 1 10 100]
+                             [--output benchmarks/results.json] [--quick]
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import gc
+import json
+import platform
+import statistics
+import sys
+import tempfile
+import time
+import tracemalloc
+from datetime import date, datetime, timedelta, timezone
+from pathlib import Path
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import aiohttp  # noqa: E402
+
+from homeassistant.util import dt as dt_util  # noqa: E402
+
+from custom_components.school_holidays.binary_sensor import (  # noqa: E402
+    SchoolHolidaysBinarySensor,
+    SchoolHolidaysProfileBinarySensor,
+)
+from custom_components.school_holidays.compiled_calendar import (  # noqa: E402
+    CompiledCalendar,
+)
+from custom_components.school_holidays.const import (  # noqa: E402
+    CONF_OVERRIDES,
+    CONF_PROFILES,
+    COUNTDOWN_SENSOR_TYPES,
+    DOMAIN,
+    LEVEL_ELEMENTARY,
+    LEVEL_HIGH,
+    VERSION,
+)
+from custom_components.school_holidays.coordinator import (  # noqa: E402
+    SchoolHolidaysCoordinator,
+)
+from custom_components.school_holidays.dataset import (  # noqa: E402
+    DATASET_SCHEMA_VERSION,
+    HolidayDataset,
+    academic_year,
+)
+from custom_components.school_holidays.engine import SchoolHolidaysEngine  # noqa: E402
+from custom_components.school_holidays.remote import RemoteDatasetSource  # noqa: E402
+from custom_components.school_holidays.sensor import (  # noqa: E402
+    SchoolHolidaysCountdownSensor,
+    SchoolHolidaysSensor,
+)
+
+from standin import (  # noqa: E402
+    StandInConfigEntry,
+    StandInDatasetServer,
+    StandInHass,
+    synthetic_rows,
+    write_shards,
+)
+
+# Within the years the dataset loads (see supported_years)
+FIRST_YEAR = academic_year(date.today()) - 5
+YEARS = 10
+SWEEP_START = date(FIRST_YEAR, 9, 1)
+SWEEP_END = date(FIRST_YEAR + YEARS, 8, 31)
+
+PROFILES_OPTION = {
+    "sector": {
+        "name": "Sector",
+        "level": LEVEL_ELEMENTARY,
+        "add": [{"start": f"{FIRST_YEAR + 1}-11-02", "end": f"{FIRST_YEAR + 1}-11-04"}],
+        "remove": [{"start": f"{FIRST_YEAR + 2}-03-10"}],
+    },
+    "council": {"level": LEVEL_HIGH},
+}
+
+
+def _overrides_option(seed: int) -> List[Dict[str, Any]]:
+    """Return a few overrides that differ between entries."""
+    day = SWEEP_START + timedelta(days=seed % 3000)
+    return [
+        {"start": day.isoformat(), "type": "strike"},
+        {"start": (day + timedelta(days=40)).isoformat(), "type": "school_day"},
+    ]
+
+
+def _stats(samples: List[float]) -> Dict[str, Any]:
+    """Summarize timings given in seconds, in microseconds."""
+    ordered = sorted(samples)
+    return {
+        "count": len(ordered),
+        "mean_us": round(statistics.fmean(ordered) * 1e6, 3),
+        "median_us": round(statistics.median(ordered) * 1e6, 3),
+        "p95_us": round(ordered[min(len(ordered) - 1, int(len(ordered) * 0.95))] * 1e6, 3),
+        "min_us": round(ordered[0] * 1e6, 3),
+        "total_ms": round(sum(ordered) * 1e3, 3),
+    }
+
+
+def _measure(func: Callable[[Any], Any], arguments: List[Any]) -> Dict[str, Any]:
+    """Time one call of a function per argument."""
+    clock = time.perf_counter
+    samples = []
+    for argument in arguments:
+        begin = clock()
+        func(argument)
+        samples.append(clock() - begin)
+    return _stats(samples)
+
+
+async def _ameasure(
+    func: Callable[[Any], Awaitable[Any]], arguments: List[Any]
+) -> Dict[str, Any]:
+    """Time one awaited call of a coroutine function per argument."""
+    clock = time.perf_counter
+    samples = []
+    for argument in arguments:
+        begin = clock()
+        await func(argument)
+        samples.append(clock() - begin)
+    return _stats(samples)
+
+
+def _sweep(step: int) -> List[date]:
+    """Return every step-th day of the benchmarked academic years."""
+    days = (SWEEP_END - SWEEP_START).days + 1
+    return [SWEEP_START + timedelta(days=offset) for offset in range(0, days, step)]
+
+
+async def _create_engine(hass: StandInHass, directory: Path) -> SchoolHolidaysEngine:
+    """Create an engine reading the synthetic shards of a directory."""
+    engine = SchoolHolidaysEngine(hass, "")
+    # The engine owns its dataset; point it at the synthetic shards
+    engine._dataset = HolidayDataset(hass, directory)
+    await engine.async_setup()
+    return engine
+
+
+async def _create_coordinators(
+    hass: StandInHass, engine: SchoolHolidaysEngine, count: int, overrides: bool
+) -> List[SchoolHolidaysCoordinator]:
+    """Set up coordinators the way async_setup_entry does, and refresh them."""
+    coordinators = []
+    for number in range(count):
+        options: Dict[str, Any] = {CONF_PROFILES: PROFILES_OPTION}
+        if overrides:
+            options[CONF_OVERRIDES] = _overrides_option(number)
+        entry = StandInConfigEntry(f"entry_{number}", options)
+        coordinator = SchoolHolidaysCoordinator(hass, entry, engine)
+        engine.async_attach(coordinator)
+        await coordinator.async_refresh()
+        hass.data.setdefault(DOMAIN, {})[entry.entry_id] = coordinator
+        coordinators.append(coordinator)
+    return coordinators
+
+
+def _release(
+    hass: StandInHass, engine: SchoolHolidaysEngine, coordinators: List[SchoolHolidaysCoordinator]
+) -> None:
+    """Detach coordinators from the engine, cancelling its timers."""
+    for coordinator in coordinators:
+        engine.async_detach(coordinator)
+        hass.data.get(DOMAIN, {}).pop(coordinator.entry.entry_id, None)
+
+
+def _entity_properties(coordinator: SchoolHolidaysCoordinator) -> Dict[str, Callable[[Any], Any]]:
+    """Return functions reading the state properties of every entity type."""
+    entry = coordinator.entry
+    summary = SchoolHolidaysSensor(coordinator, "summary", entry)
+    countdowns = [
+        SchoolHolidaysCountdownSensor(coordinator, sensor_type, entry)
+        for sensor_type in COUNTDOWN_SENSOR_TYPES
+    ]
+    binaries = [
+        SchoolHolidaysBinarySensor(coordinator, sensor_type, entry)
+        for sensor_type in ("elementary_vacation", "high_vacation")
+    ]
+    profiles = [
+        SchoolHolidaysProfileBinarySensor(coordinator, profile, entry)
+        for profile in coordinator.options.profiles
+    ]
+    return {
+        "sensor_summary_state": lambda _: (
+            summary.name, summary.native_value, summary.extra_state_attributes
+        ),
+        "sensor_countdown_state": lambda _: [
+            (sensor.name, sensor.native_value) for sensor in countdowns
+        ],
+        "binary_sensor_state": lambda _: [
+            (sensor.name, sensor.is_on, sensor.extra_state_attributes) for sensor in binaries
+        ],
+        "profile_binary_sensor_state": lambda _: [
+            (sensor.name, sensor.is_on, sensor.extra_state_attributes) for sensor in profiles
+        ],
+    }
+
+
+async def bench_dataset(
+    hass: StandInHass, rows: int, workdir: Path, repeat: int
+) -> List[Dict[str, Any]]:
+    """Benchmark compilation, lookups, status and entity paths for one dataset size."""
+    results: List[Dict[str, Any]] = []
+
+    def record(name: str, stats: Dict[str, Any], **extra: Any) -> None:
+        results.append({"benchmark": name, "rows": rows, **extra, **stats})
+
+    directory = workdir / f"rows-{rows}"
+    years = write_shards(
+        directory, synthetic_rows(rows, FIRST_YEAR, YEARS), DATASET_SCHEMA_VERSION
+    )
+
+    begin = time.perf_counter()
+    engine = await _create_engine(hass, directory)
+    await engine.async_ensure_years(years)
+    record(
+        "dataset_load_compile",
+        _stats([time.perf_counter() - begin]),
+        segments=len(engine.holiday_index),
+        rejected=len(engine.rejected_rows),
+    )
+
+    index = engine.holiday_index
+    record(
+        "calendar_compile",
+        _measure(lambda friday: CompiledCalendar(index, friday), [True, False] * repeat),
+    )
+
+    every_day = _sweep(1)
+    record("index_lookup", _measure(index.lookup, every_day * repeat))
+    calendar = engine.calendar_for(True)
+    record("calendar_status_for", _measure(calendar.status_for, every_day * repeat))
+
+    record(
+        "calendar_timeline_month",
+        _measure(
+            lambda day: calendar.timeline(LEVEL_HIGH).between(day, day + timedelta(days=30)),
+            _sweep(30) * repeat,
+        ),
+    )
+
+    coordinators = await _create_coordinators(hass, engine, 1, overrides=False)
+    coordinator = coordinators[0]
+    weekly = _sweep(7)
+    record(
+        "coordinator_calculate_status",
+        await _ameasure(coordinator._calculate_status, weekly * repeat),
+    )
+
+    async def evaluate_year(start: date) -> None:
+        await coordinator.async_evaluate_range(start, start + timedelta(days=364))
+
+    record(
+        "coordinator_evaluate_range_year",
+        await _ameasure(evaluate_year, [SWEEP_START] * repeat),
+    )
+
+    async def refresh(_: Any) -> None:
+        coordinator.async_invalidate_status()
+        await coordinator.async_refresh()
+
+    record("coordinator_refresh", await _ameasure(refresh, list(range(20 * repeat))))
+
+    for name, read in _entity_properties(coordinator).items():
+        record(name, _measure(read, list(range(1000 * repeat))))
+
+    _release(hass, engine, coordinators)
+    return results
+
+
+async def bench_fan_out(
+    hass: StandInHass, rows: int, entries: int, overrides: bool, workdir: Path, repeat: int
+) -> List[Dict[str, Any]]:
+    """Benchmark refresh fan-out and memory for many entries sharing one engine."""
+    directory = workdir / f"rows-{rows}"
+    years = write_shards(
+        directory, synthetic_rows(rows, FIRST_YEAR, YEARS), DATASET_SCHEMA_VERSION
+    )
+    engine = await _create_engine(hass, directory)
+    await engine.async_ensure_years(years)
+    extra = {"rows": rows, "entries": entries, "overrides": overrides}
+
+    # Build the shared calendar and its tables first, so that only what
+    # each entry adds is counted
+    shared = engine.calendar_for(True)
+    for level in (LEVEL_ELEMENTARY, LEVEL_HIGH):
+        shared.timeline(level)
+        shared.countdowns(level)
+
+    # Memory first, on its own: tracing slows everything down
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    coordinators = await _create_coordinators(hass, engine, entries, overrides)
+    gc.collect()
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    results = [{
+        "benchmark": "memory_per_entry",
+        **extra,
+        "bytes_per_entry": round((after - before) / entries),
+    }]
+
+    async def refresh_all(_: Any) -> None:
+        for coordinator in coordinators:
+            coordinator.async_invalidate_status()
+        await asyncio.gather(*(coordinator.async_refresh() for coordinator in coordinators))
+
+    results.append({
+        "benchmark": "refresh_fan_out",
+        **extra,
+        **await _ameasure(refresh_all, list(range(5 * repeat))),
+    })
+    results.append({
+        "benchmark": "engine_schedule",
+        **extra,
+        **_measure(lambda _: engine.async_schedule(), list(range(5 * repeat))),
+    })
+
+    _release(hass, engine, coordinators)
+    return results
+
+
+async def bench_remote(hass: StandInHass, rows: int, repeat: int) -> List[Dict[str, Any]]:
+    """
+    Benchmark the remote dataset source against a local server, then offline.
+
+    Raises:
+        RuntimeError: If conditional requests are not answered from the
+            client's copy, or the cached copy is not used once offline
+    """
+    results: List[Dict[str, Any]] = []
+
+    def record(name: str, stats: Dict[str, Any]) -> None:
+        results.append({"benchmark": name, "rows": rows, **stats})
+
+    dataset = [
+        row for year_rows in synthetic_rows(rows, FIRST_YEAR, YEARS).values() for row in year_rows
+    ]
+    server = StandInDatasetServer(dataset)
+    url = await server.async_start()
+    async with aiohttp.ClientSession() as session:
+        source = RemoteDatasetSource(hass, url, session)
+
+        async def fetch(_: Any) -> None:
+            # Without a copy the request is unconditional
+            source.rows = None
+            await source.async_revalidate()
+
+        record("remote_fetch", await _ameasure(fetch, list(range(5 * repeat))))
+        revalidations = 20 * repeat
+        record(
+            "remote_revalidate_not_modified",
+            await _ameasure(lambda _: source.async_revalidate(), list(range(revalidations))),
+        )
+        if server.not_modified != revalidations:
+            raise RuntimeError("conditional requests were not answered with 304")
+
+        await server.async_stop()
+        offline = RemoteDatasetSource(hass, url, session)
+        record(
+            "remote_load_cached",
+            await _ameasure(lambda _: offline.async_load_cached(), list(range(5 * repeat))),
+        )
+        if offline.rows != dataset or await offline.async_revalidate():
+            raise RuntimeError("the cached dataset is not used offline")
+    return results
+
+
+async def async_main(args: argparse.Namespace) -> Dict[str, Any]:
+    """Run every benchmark and return the report."""
+    dt_util.set_default_time_zone(dt_util.get_time_zone("Asia/Jerusalem"))
+    repeat = 1 if args.quick else 3
+    results: List[Dict[str, Any]] = []
+
+    with tempfile.TemporaryDirectory(prefix="school_holidays_bench_") as workdir:
+        hass = StandInHass(asyncio.get_running_loop(), Path(workdir) / "config")
+        for rows in args.sizes:
+            print(f"dataset: {rows} rows", file=sys.stderr)
+            results.extend(await bench_dataset(hass, rows, Path(workdir), repeat))
+            results.extend(await bench_remote(hass, rows, repeat))
+        for entries in args.entries:
+            for overrides in (False, True):
+                print(f"fan-out: {entries} entries, overrides={overrides}", file=sys.stderr)
+                results.extend(
+                    await bench_fan_out(
+                        hass, args.fan_out_rows, entries, overrides, Path(workdir), repeat
+                    )
+                )
+
+    return {
+        "metadata": {
+            "integration_version": VERSION,
+            "python": platform.python_version(),
+            "implementation": platform.python_implementation(),
+            "platform": platform.platform(),
+            "created": datetime.now(timezone.utc).isoformat(),
+            "quick": args.quick,
+        },
+        "results": results,
+    }
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    """Parse the arguments, run the benchmarks and write the report."""
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument(
+        "--sizes", type=int, nargs="+", default=[10, 100, 1000, 10000],
+        help="dataset sizes in holiday rows",
+    )
+    parser.add_argument(
+        "--entries", type=int, nargs="+", default=[1, 10, 100],
+        help="numbers of config entries for the fan-out benchmarks",
+    )
+    parser.add_argument(
+        "--fan-out-rows", type=int, default=1000,
+        help="dataset size used by the fan-out benchmarks",
+    )
+    parser.add_argument(
+        "--output", type=Path, default=Path(__file__).parent / "results.json",
+        help="JSON report path",
+    )
+    parser.add_argument("--quick", action="store_true", help="run each measurement once")
+    args = parser.parse_args(argv)
+
+    report = asyncio.run(async_main(args))
+    args.output.write_text(json.dumps(report, indent=2), encoding="utf-8")
+    print(f"Wrote {len(report['results'])} results to {args.output}", file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,225 @@
+"""
+Lightweight stand-ins for the Home Assistant objects the integration uses.
+
+The benchmarks import the real integration and the real Home Assistant
+helpers (DataUpdateCoordinator, event tracking, dt_util), but run them
+against these minimal objects instead of a booted Home Assistant instance,
+so that timings measure the integration rather than the core's startup.
+Executor jobs run inline, to keep thread hand-offs out of the timings.
+The remote dataset is served by a local HTTP stand-in, so no benchmark
+needs network access.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import json
+import random
+import socket
+from datetime import date, timedelta
+from email.utils import formatdate
+from pathlib import Path
+from types import SimpleNamespace
+from typing import Any, Callable, Dict, List, Optional, Set, Tuple
+
+from aiohttp import web
+
+from homeassistant.core import CoreState
+
+# Summaries of synthetic rows; repeated summaries let adjacent rows merge
+_SUMMARIES = [f"Synthetic holiday {number}" for number in range(40)]
+
+
+class StandInBus:
+    """Event bus that counts fired events instead of dispatching them."""
+
+    def __init__(self) -> None:
+        """Initialize the counter."""
+        self.fired = 0
+
+    def async_fire(self, event_type: str, event_data: Dict[str, Any] = None) -> None:
+        """Count an event."""
+        self.fired += 1
+
+    def async_listen_once(self, event_type: str, listener: Callable) -> Callable[[], None]:
+        """Ignore a listener (the stand-in never stops)."""
+        return lambda: None
+
+
+class StandInHass:
+    """The subset of HomeAssistant used by the integration's runtime paths."""
+
+    def __init__(self, loop: asyncio.AbstractEventLoop, config_dir: Path) -> None:
+        """
+        Initialize the stand-in.
+
+        Args:
+            loop: Running event loop, used for tasks and timers
+            config_dir: Directory that Stores write to
+        """
+        self.loop = loop
+        self.data: Dict[str, Any] = {}
+        self.bus = StandInBus()
+        self.state = CoreState.running
+        self.config = SimpleNamespace(
+            config_dir=str(config_dir),
+            path=lambda *parts: str(Path(config_dir, *parts)),
+        )
+        self._background: Set[asyncio.Task] = set()
+
+    async def async_add_executor_job(self, target: Callable, *args: Any) -> Any:
+        """Run an executor job inline."""
+        return target(*args)
+
+    def async_run_hass_job(self, hassjob, *args: Any) -> Any:
+        """Run a job fired by a timer."""
+        result = hassjob.target(*args)
+        if asyncio.iscoroutine(result):
+            return self.async_create_task(result)
+        return result
+
+    def async_create_task(self, target, name: str = None, eager_start: bool = True):
+        """Schedule a coroutine on the loop."""
+        return self.loop.create_task(target)
+
+    def async_create_background_task(self, target, name: str, eager_start: bool = True):
+        """Schedule a coroutine on the loop, keeping a reference until it is done."""
+        task = self.loop.create_task(target)
+        self._background.add(task)
+        task.add_done_callback(self._background.discard)
+        return task
+
+
+class StandInConfigEntry:
+    """The subset of ConfigEntry read by the coordinator and the entities."""
+
+    def __init__(self, entry_id: str, options: Dict[str, Any]) -> None:
+        """
+        Initialize the entry.
+
+        Args:
+            entry_id: Unique entry ID
+            options: Entry options (see the CONF_* constants)
+        """
+        self.entry_id = entry_id
+        self.title = "Israel School Holidays"
+        self.data: Dict[str, Any] = {}
+        self.options = dict(options)
+        self._on_unload: List[Callable[[], None]] = []
+
+    def async_on_unload(self, func: Callable[[], None]) -> None:
+        """Keep an unload callback."""
+        self._on_unload.append(func)
+
+    def unload(self) -> None:
+        """Run the unload callbacks."""
+        while self._on_unload:
+            self._on_unload.pop()()
+
+
+class StandInDatasetServer:
+    """Local HTTP server publishing a holiday dataset like the remote source."""
+
+    def __init__(self, rows: List[Dict[str, Any]]) -> None:
+        """
+        Initialize the server without starting it.
+
+        Args:
+            rows: Holiday rows served as a JSON list
+        """
+        self.requests = 0
+        self.not_modified = 0
+        self._runner: Optional[web.AppRunner] = None
+        self.url = ""
+        self.publish(rows)
+
+    def publish(self, rows: List[Dict[str, Any]]) -> None:
+        """Replace the served rows, with a new ETag and Last-Modified."""
+        self._body = json.dumps(rows, ensure_ascii=False).encode()
+        self._etag = f'"{hashlib.sha1(self._body, usedforsecurity=False).hexdigest()}"'
+        self._last_modified = formatdate(usegmt=True)
+
+    async def _handle(self, request: web.Request) -> web.Response:
+        """Serve the dataset, or 304 if the client's copy is current."""
+        self.requests += 1
+        headers = {"ETag": self._etag, "Last-Modified": self._last_modified}
+        if request.headers.get("If-None-Match") == self._etag:
+            self.not_modified += 1
+            return web.Response(status=304, headers=headers)
+        return web.Response(body=self._body, content_type="application/json", headers=headers)
+
+    async def async_start(self) -> str:
+        """Start listening on a free local port and return the dataset URL."""
+        app = web.Application()
+        app.router.add_get("/data.json", self._handle)
+        self._runner = web.AppRunner(app)
+        await self._runner.setup()
+        sock = socket.socket()
+        sock.bind(("127.0.0.1", 0))
+        await web.SockSite(self._runner, sock).start()
+        self.url = f"http://127.0.0.1:{sock.getsockname()[1]}/data.json"
+        return self.url
+
+    async def async_stop(self) -> None:
+        """Stop the server; fetches fail from then on, as when offline."""
+        if self._runner is not None:
+            await self._runner.cleanup()
+            self._runner = None
+
+
+def synthetic_rows(
+    count: int, first_year: int, years: int, seed: int = 0
+) -> Dict[int, List[Dict[str, Any]]]:
+    """
+    Generate holiday rows spread over a number of academic years.
+
+    Rows last 1 to 14 days, may overlap, and a share of them are high
+    school only or carry a priority, so the index has to resolve overlaps.
+
+    Args:
+        count: Total number of rows
+        first_year: First academic year
+        years: Number of academic years
+        seed: Random seed, so every run measures the same data
+
+    Returns:
+        The rows of every academic year
+    """
+    generator = random.Random(seed)
+    by_year: Dict[int, List[Dict[str, Any]]] = {
+        year: [] for year in range(first_year, first_year + years)
+    }
+    for number in range(count):
+        year = first_year + number % years
+        start = date(year, 9, 1) + timedelta(days=generator.randrange(350))
+        end = start + timedelta(days=generator.randrange(14))
+        row: Dict[str, Any] = {
+            "START": start.isoformat(),
+            "END": end.isoformat(),
+            "SUMMARY": generator.choice(_SUMMARIES),
+        }
+        if generator.random() < 0.2:
+            row["HIGH"] = "True"
+        if generator.random() < 0.1:
+            row["PRIORITY"] = generator.randrange(1, 4)
+        by_year[year].append(row)
+    return by_year
+
+
+def write_shards(
+    directory: Path, rows_by_year: Dict[int, List[Dict[str, Any]]], schema: int
+) -> Tuple[int, ...]:
+    """
+    Write one JSON Lines shard per academic year, in the bundled data format.
+
+    Returns:
+        The academic years written
+    """
+    directory.mkdir(parents=True, exist_ok=True)
+    for year, rows in rows_by_year.items():
+        with (directory / f"holidays-{year}.jsonl").open("w", encoding="utf-8") as shard:
+            shard.write(json.dumps({"schema": schema, "academic_year": year}) + "\n")
+            for row in rows:
+                shard.write(json.dumps(row, ensure_ascii=False) + "\n")
+    return tuple(rows_by_year)
@@ -5,15 +5,43 @@ This integration provides sensors to indicate whether it is a school holiday
 in Israel for elementary and high schools, based on static local data.
 """
 
+import secrets
+
 from homeassistant.core import HomeAssistant
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import Platform
+from homeassistant.helpers import config_validation as cv
+from homeassistant.helpers.typing import ConfigType
 
-from .const import DOMAIN
-from .coordinator import SchoolHolidaysCoordinator
+from .const import DOMAIN, CONF_ICS_TOKEN
+from .coordinator import SchoolHolidaysCoordinator, SchoolHolidaysOptions
+from .engine import async_get_engine, async_release_engine
+from .ics import SchoolHolidaysIcsView
+from .services import async_setup_services
+from .snapshot import StatusSnapshotStore
+from .websocket_api import async_setup_websocket_api
 
 # Supported platforms provided by this integration
-PLATFORMS = [Platform.BINARY_SENSOR, Platform.SENSOR]
+PLATFORMS = [Platform.BINARY_SENSOR, Platform.CALENDAR, Platform.SENSOR]
+
+CONFIG_SCHEMA = cv.config_entry_only_config_schema(DOMAIN)
+
+
+async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
+    """
+    Set up the Israel School Holidays integration.
+
+    Args:
+        hass: Home Assistant core instance.
+        config: Configuration from configuration.yaml (unused).
+
+    Registers the integration services, the iCalendar feed view and the
+    websocket commands once, independent of config entries.
+    """
+    async_setup_services(hass)
+    async_setup_websocket_api(hass)
+    hass.http.register_view(SchoolHolidaysIcsView(hass))
+    return True
 
 
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
@@ -28,12 +56,37 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
         True if setup was successful.
 
     This function:
-    - Creates the SchoolHolidaysCoordinator instance.
+    - Creates the secret token of the entry's iCalendar feeds on first setup.
+    - Gets the engine shared by every entry using the same dataset URL
+      (created by the first such entry, loaded on first use; see engine.py).
+    - Creates the SchoolHolidaysCoordinator view for this entry. If the
+      status saved by the last refresh is valid for today it is restored
+      and the real calculation runs in the background, so startup does not
+      wait for the dataset; otherwise the single initial refresh runs before
+      any platform is set up.
     - Stores it in hass.data for access by other components.
     - Forwards the config entry setup to the supported platforms.
-    - Listens for option changes to reload the integration if needed.
+    - Listens for option changes to apply them in place, or reload if needed.
+    - Releases the engine when the entry unloads; the last entry shuts it down.
     """
-    coordinator = SchoolHolidaysCoordinator(hass, entry)
+    if CONF_ICS_TOKEN not in entry.data:
+        hass.config_entries.async_update_entry(
+            entry, data={**entry.data, CONF_ICS_TOKEN: secrets.token_urlsafe(24)}
+        )
+
+    options = SchoolHolidaysOptions.from_entry(entry)
+    engine = async_get_engine(hass, options.data_url)
+    coordinator = SchoolHolidaysCoordinator(hass, entry, engine)
+    engine.async_attach(coordinator)
+    entry.async_on_unload(lambda: async_release_engine(hass, engine, coordinator))
+
+    if await coordinator.async_restore_snapshot():
+        entry.async_create_background_task(
+            hass, coordinator.async_refresh(), f"{DOMAIN} startup refresh"
+        )
+    else:
+        # One initial calculation shared by every platform
+        await coordinator.async_config_entry_first_refresh()
 
     # Store coordinator in hass.data
     hass.data.setdefault(DOMAIN, {})
@@ -42,8 +95,8 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     # Forward setup to each supported platform
     await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
 
-    # Listen for option changes and reload integration if necessary
-    entry.async_on_unload(entry.add_update_listener(async_reload_entry))
+    # Listen for option changes and apply them without reloading when possible
+    entry.async_on_unload(entry.add_update_listener(async_options_updated))
 
     return True
 
@@ -71,16 +124,40 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     return unload_ok
 
 
-async def async_reload_entry(hass: HomeAssistant, entry: ConfigEntry) -> None:
+async def async_remove_entry(hass: HomeAssistant, entry: ConfigEntry) -> None:
     """
-    Reload the Israel School Holidays integration.
+    Clean up after a removed config entry.
 
     Args:
         hass: Home Assistant core instance.
-        entry: Configuration entry to reload.
+        entry: Configuration entry that was removed.
+
+    Deletes the entry's persisted status snapshot.
+    """
+    await StatusSnapshotStore(hass, entry).async_remove()
+
+
+async def async_options_updated(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """
+    Apply changed options of the Israel School Holidays integration.
 
-    This function is triggered when options of the config entry change.
-    It first unloads the entry and then sets it up again.
+    Args:
+        hass: Home Assistant core instance.
+        entry: Configuration entry whose options changed.
+
+    Language, Friday-rule, profile and override changes only affect computed
+    values and names, so they are applied to the running coordinator in place
+    (overrides only recompile the days they cover). The entry is
+    reloaded only when the enabled school levels change which entities exist,
+    or when the dataset URL moves the entry to another shared engine.
+    Reloading through Home Assistant runs the entry's unload callbacks, so the
+    previous update listener and transition timer are released first.
     """
-    await async_unload_entry(hass, entry)
-    await async_setup_entry(hass, entry)
+    coordinator: SchoolHolidaysCoordinator = hass.data[DOMAIN][entry.entry_id]
+    options = SchoolHolidaysOptions.from_entry(entry)
+
+    if options.reload_key != coordinator.options.reload_key:
+        await hass.config_entries.async_reload(entry.entry_id)
+        return
+
+    await coordinator.async_apply_options(options)
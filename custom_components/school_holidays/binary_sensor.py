@@ -2,7 +2,8 @@
 Binary sensor platform for the Israel School Holidays integration.
 
 This platform creates binary sensors indicating whether it is a school holiday
-in Israel for elementary and high schools based on the coordinator's data.
+in Israel for elementary and high schools based on the coordinator's data,
+and one binary sensor per configured school profile.
 """
 
 import logging
@@ -18,10 +19,10 @@ from homeassistant.helpers.entity import DeviceInfo
 from .const import (
     DOMAIN,
     BINARY_SENSOR_TYPES,
-    ENTITY_NAMES,
-    VERSION,
+    PROFILE_SENSOR_ICON,
 )
 from .coordinator import SchoolHolidaysCoordinator
+from .profiles import Profile
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -40,16 +41,13 @@ async def async_setup_entry(
         async_add_entities: Callback function to add entities.
 
     This function:
-    - Retrieves the coordinator from hass.data.
-    - Ensures the coordinator has loaded data initially.
+    - Retrieves the coordinator from hass.data (already refreshed during entry setup).
     - Creates binary sensor entities for elementary and high school vacations if enabled.
+    - Creates one binary sensor entity per school profile.
     - Adds the entities to Home Assistant.
     """
     coordinator: SchoolHolidaysCoordinator = hass.data[DOMAIN][entry.entry_id]
 
-    # Ensure the coordinator has the initial data loaded
-    await coordinator.async_config_entry_first_refresh()
-
     entities = []
 
     if coordinator.elementary_enabled:
@@ -58,6 +56,11 @@ async def async_setup_entry(
     if coordinator.high_enabled:
         entities.append(SchoolHolidaysBinarySensor(coordinator, "high_vacation", entry))
 
+    entities.extend(
+        SchoolHolidaysProfileBinarySensor(coordinator, profile, entry)
+        for profile in coordinator.options.profiles
+    )
+
     async_add_entities(entities)
 
 
@@ -69,6 +72,9 @@ class SchoolHolidaysBinarySensor(CoordinatorEntity, BinarySensorEntity):
     for elementary or high schools.
     """
 
+    # Volatile attributes that should not create new recorder rows
+    _unrecorded_attributes = frozenset({"last_update", "language"})
+
     def __init__(
         self,
         coordinator: SchoolHolidaysCoordinator,
@@ -88,11 +94,8 @@ class SchoolHolidaysBinarySensor(CoordinatorEntity, BinarySensorEntity):
         self._entry = entry
         self._coordinator = coordinator
 
-        # Set sensor attributes based on language and type
-        language = coordinator.language
-        entity_names = ENTITY_NAMES.get(language, ENTITY_NAMES["he"])
+        # Set sensor attributes based on type; names come from the coordinator
         self.entity_id = f"binary_sensor.{sensor_type}"
-        self._attr_name = entity_names[sensor_type]
         self._attr_unique_id = f"{entry.entry_id}_{sensor_type}"
         self._attr_icon = BINARY_SENSOR_TYPES[sensor_type]["icon"]
         self._attr_device_class = BINARY_SENSOR_TYPES[sensor_type]["device_class"]
@@ -100,9 +103,7 @@ class SchoolHolidaysBinarySensor(CoordinatorEntity, BinarySensorEntity):
     @property
     def name(self) -> str:
         """Return the sensor name according to the current language."""
-        language = self._coordinator.language
-        entity_names = ENTITY_NAMES.get(language, ENTITY_NAMES["he"])
-        return entity_names[self._sensor_type]
+        return self._coordinator.descriptions.names[self._sensor_type]
 
     @property
     def device_info(self) -> DeviceInfo:
@@ -111,16 +112,7 @@ class SchoolHolidaysBinarySensor(CoordinatorEntity, BinarySensorEntity):
 
         This allows Home Assistant to group sensors under a common device.
         """
-        language = self._coordinator.language
-        entity_names = ENTITY_NAMES.get(language, ENTITY_NAMES["he"])
-        return DeviceInfo(
-            identifiers={(DOMAIN, self._entry.entry_id)},
-            name=entity_names["device_name"],
-            manufacturer="Yuval Mejahez",
-            model="School Calendar Tracker",
-            sw_version=VERSION,
-            configuration_url="https://github.com/rt400/School-Vacation",
-        )
+        return self._coordinator.descriptions.device_info
 
     @property
     def is_on(self) -> Optional[bool]:
@@ -148,7 +140,7 @@ class SchoolHolidaysBinarySensor(CoordinatorEntity, BinarySensorEntity):
             return {}
         return {
             "summary": self.coordinator.data.get("summary"),
-            "last_update": self.coordinator.data.get("last_update"),
+            "last_update": self._coordinator.last_update.isoformat(),
             "sensor_type": self._sensor_type,
             "language": self._coordinator.language,
         }
@@ -157,3 +149,88 @@ class SchoolHolidaysBinarySensor(CoordinatorEntity, BinarySensorEntity):
     def available(self) -> bool:
         """Return True if the entity is currently available."""
         return self.coordinator.last_update_success
+
+
+class SchoolHolidaysProfileBinarySensor(CoordinatorEntity, BinarySensorEntity):
+    """Binary sensor telling whether a school profile is on vacation today."""
+
+    _unrecorded_attributes = frozenset({"last_update", "language"})
+
+    def __init__(
+        self,
+        coordinator: SchoolHolidaysCoordinator,
+        profile: Profile,
+        entry: ConfigEntry
+    ) -> None:
+        """
+        Initialize the profile binary sensor.
+
+        Args:
+            coordinator: The data coordinator instance.
+            profile: The school profile this sensor reports on.
+            entry: Configuration entry for this integration.
+        """
+        super().__init__(coordinator)
+        self._profile_key = profile.key
+        self._entry = entry
+        self._coordinator = coordinator
+
+        self.entity_id = f"binary_sensor.school_profile_{profile.key}"
+        self._attr_unique_id = f"{entry.entry_id}_profile_{profile.key}"
+        self._attr_icon = PROFILE_SENSOR_ICON
+
+    @property
+    def _profile(self) -> Optional[Profile]:
+        """Return the current definition of the profile."""
+        for profile in self._coordinator.options.profiles:
+            if profile.key == self._profile_key:
+                return profile
+        return None
+
+    @property
+    def name(self) -> str:
+        """Return the sensor name according to the current language."""
+        profile = self._profile
+        return self._coordinator.descriptions.names["profile_vacation"].format(
+            profile.name if profile else self._profile_key
+        )
+
+    @property
+    def device_info(self) -> DeviceInfo:
+        """Return information about the device this sensor belongs to."""
+        return self._coordinator.descriptions.device_info
+
+    @property
+    def is_on(self) -> Optional[bool]:
+        """Return True if the profile is on vacation today."""
+        if not self.coordinator.data:
+            return None
+        status = self.coordinator.data.get("profiles", {}).get(self._profile_key)
+        return status["vacation"] if status else None
+
+    @property
+    def extra_state_attributes(self) -> dict:
+        """
+        Return additional state attributes for the sensor.
+
+        Attributes include:
+        - summary: Description of the profile's day
+        - level: School level the profile follows
+        - last_update: Timestamp of last data update
+        - language: Current language of the integration
+        """
+        if not self.coordinator.data:
+            return {}
+        status = self.coordinator.data.get("profiles", {}).get(self._profile_key) or {}
+        profile = self._profile
+        return {
+            "summary": status.get("summary"),
+            "level": profile.level if profile else None,
+            "last_update": self._coordinator.last_update.isoformat(),
+            "language": self._coordinator.language,
+        }
+
+    @property
+    def available(self) -> bool:
+        """Return True if the entity is currently available."""
+        return self.coordinator.last_update_success
@@ -0,0 +1,135 @@
+"""
+Calendar platform for the Israel School Holidays integration.
+
+Creates one calendar entity per enabled school level. Events come from the
+coordinator's compiled vacation timeline, so a month view is answered with a
+range query instead of rescanning the holiday data.
+"""
+
+import logging
+from datetime import datetime, timedelta
+from typing import List, Optional
+
+from homeassistant.components.calendar import CalendarEntity, CalendarEvent
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.entity_platform import AddEntitiesCallback
+from homeassistant.helpers.update_coordinator import CoordinatorEntity
+from homeassistant.helpers.entity import DeviceInfo
+from homeassistant.util import dt as dt_util
+
+from .const import (
+    DOMAIN,
+    CALENDAR_TYPES,
+    LEVEL_ELEMENTARY,
+    LEVEL_HIGH,
+)
+from .compiled_calendar import VacationEvent
+from .coordinator import SchoolHolidaysCoordinator
+
+_LOGGER = logging.getLogger(__name__)
+
+
+async def async_setup_entry(
+    hass: HomeAssistant,
+    entry: ConfigEntry,
+    async_add_entities: AddEntitiesCallback,
+) -> None:
+    """
+    Set up Israel School Holidays calendars from a config entry.
+
+    Args:
+        hass: Home Assistant core instance.
+        entry: Configuration entry for this integration.
+        async_add_entities: Callback function to add entities.
+    """
+    coordinator: SchoolHolidaysCoordinator = hass.data[DOMAIN][entry.entry_id]
+
+    enabled_levels = {
+        LEVEL_ELEMENTARY: coordinator.elementary_enabled,
+        LEVEL_HIGH: coordinator.high_enabled,
+    }
+    async_add_entities(
+        SchoolHolidaysCalendar(coordinator, calendar_type, entry)
+        for calendar_type, calendar_info in CALENDAR_TYPES.items()
+        if enabled_levels[calendar_info["level"]]
+    )
+
+
+def _to_calendar_event(event: VacationEvent) -> CalendarEvent:
+    """Convert a vacation event to an all-day calendar event."""
+    return CalendarEvent(
+        start=event.start,
+        end=event.end + timedelta(days=1),
+        summary=event.summary,
+    )
+
+
+class SchoolHolidaysCalendar(CoordinatorEntity, CalendarEntity):
+    """Calendar of the vacations of one school level."""
+
+    def __init__(
+        self,
+        coordinator: SchoolHolidaysCoordinator,
+        calendar_type: str,
+        entry: ConfigEntry
+    ) -> None:
+        """
+        Initialize the calendar entity.
+
+        Args:
+            coordinator: The coordinator instance providing data updates
+            calendar_type: Type of calendar ("elementary_calendar" or "high_calendar")
+            entry: The associated config entry
+        """
+        super().__init__(coordinator)
+        self._calendar_type = calendar_type
+        self._level = CALENDAR_TYPES[calendar_type]["level"]
+        self._entry = entry
+        self._coordinator = coordinator
+
+        self.entity_id = f"calendar.{calendar_type}"
+        self._attr_unique_id = f"{entry.entry_id}_{calendar_type}"
+        self._attr_icon = CALENDAR_TYPES[calendar_type]["icon"]
+
+    @property
+    def name(self) -> str:
+        """Return the calendar name according to the selected language."""
+        return self._coordinator.descriptions.names[self._calendar_type]
+
+    @property
+    def device_info(self) -> DeviceInfo:
+        """Return information about the device this calendar belongs to."""
+        return self._coordinator.descriptions.device_info
+
+    @property
+    def event(self) -> Optional[CalendarEvent]:
+        """Return the current or next upcoming vacation."""
+        upcoming = self._coordinator.next_event(self._level, dt_util.now().date())
+        return _to_calendar_event(upcoming) if upcoming else None
+
+    async def async_get_events(
+        self,
+        hass: HomeAssistant,
+        start_date: datetime,
+        end_date: datetime,
+    ) -> List[CalendarEvent]:
+        """
+        Return the vacations overlapping a time range.
+
+        Args:
+            hass: Home Assistant core instance.
+            start_date: Start of the requested range.
+            end_date: End of the requested range.
+        """
+        start = dt_util.as_local(start_date).date()
+        end = dt_util.as_local(end_date).date()
+        await self._coordinator.async_ensure_range(start, end)
+
+        timeline = self._coordinator.calendar.timeline(self._level)
+        return [_to_calendar_event(event) for event in timeline.between(start, end)]
+
+    @property
+    def available(self) -> bool:
+        """Return True if the calendar is available."""
+        return self.coordinator.last_update_success
@@ -0,0 +1,553 @@
+"""
+Compiled per-day calendar for the Israel School Holidays integration.
+
+The holiday index and the weekday rules (high schools closed on Fridays,
+everyone off on Saturdays) are evaluated once for every day of the loaded
+range and stored as one small integer per day. Each code points into a side
+table of interned statuses, so answering "is this date a vacation?" is a
+single array index.
+
+Overrides entered by the user (see overrides.py) are applied on top of the
+rules. Changing them recompiles only the days they cover.
+
+For calendar views, the holidays of each school level are also turned into a
+sorted timeline of vacation events, queried by range with a bisect. Countdown
+values (school days until summer, days left in a break, days until the next
+break) come from cumulative-count arrays, so each one is a subtraction.
+"""
+
+from __future__ import annotations
+
+from array import array
+from bisect import bisect_left, bisect_right
+from datetime import date, timedelta
+from typing import Dict, List, NamedTuple, Optional, Tuple
+
+from .const import HEBREW_TEXTS, LEVEL_HIGH
+from .holiday_index import HolidayIndex, HolidayRecord
+from .overrides import Override, overrides_by_day
+
+
+# Weekday rules alone change the status at least once a week
+_WEEKDAY_RULE_PERIOD = 7
+
+# Days off from the weekday rules alone, which only extend vacation events
+_RULE_SUMMARIES = frozenset({HEBREW_TEXTS["sabbath"], HEBREW_TEXTS["no_classes_high"]})
+
+# A break at least this long is the summer vacation
+SUMMER_MIN_DAYS = 30
+
+_NO_BREAK = -1
+
+
+class DayStatus(NamedTuple):
+    """Vacation status of a single day."""
+
+    elementary_vacation: bool
+    high_vacation: bool
+    summary: str
+
+
+class VacationEvent(NamedTuple):
+    """A continuous vacation of one school level (end is inclusive)."""
+
+    start: date
+    end: date
+    summary: str
+
+
+class VacationTimeline:
+    """Sorted, non-overlapping vacation events of one school level."""
+
+    def __init__(self, events: List[VacationEvent]) -> None:
+        """Index the events by their last day."""
+        self._events = events
+        self._ends = [event.end for event in events]
+
+    def __len__(self) -> int:
+        """Return the number of events."""
+        return len(self._events)
+
+    def between(self, start: date, end: date) -> List[VacationEvent]:
+        """
+        Return the events overlapping a date range (both ends inclusive).
+
+        The cost is a bisect plus the number of events returned.
+        """
+        position = bisect_left(self._ends, start)
+        found = []
+        while position < len(self._events) and self._events[position].start <= end:
+            found.append(self._events[position])
+            position += 1
+        return found
+
+    def next_event(self, day: date) -> Optional[VacationEvent]:
+        """Return the event in progress on a date, or the next one after it."""
+        position = bisect_left(self._ends, day)
+        return self._events[position] if position < len(self._events) else None
+
+
+class Transition(NamedTuple):
+    """A day on which a school level's vacation starts or ends."""
+
+    day: date
+    level: str
+    vacation: bool
+    summary: str
+
+
+class Countdown(NamedTuple):
+    """Countdown values of one school level for a day (None if unknown)."""
+
+    school_days_until_summer: Optional[int]
+    vacation_days_left: Optional[int]
+    days_until_next_vacation: Optional[int]
+
+
+class CountdownTable:
+    """
+    Cumulative-count arrays answering countdown questions for one level.
+
+    A break is a run of consecutive vacation events; ordinary weekends on
+    their own are not breaks. For every compiled day the table keeps the
+    number of school days before it and the bounds of the break in progress
+    or the next break (and the next summer break).
+    """
+
+    __slots__ = ("_origin", "_school_before", "_break_start", "_break_end", "_summer_start")
+
+    def __init__(self, calendar: CompiledCalendar, level: str) -> None:
+        """Build the arrays from a compiled calendar."""
+        first_day, last_day = calendar.first_day, calendar.last_day
+        self._origin = first_day.toordinal() if first_day else 0
+        self._school_before = array("i", [0])
+        self._break_start = array("i")
+        self._break_end = array("i")
+        self._summer_start = array("i")
+        if first_day is None or last_day is None:
+            return
+
+        school_before = self._school_before
+        count = 0
+        for status in calendar.evaluate_range(first_day, last_day):
+            count += not is_vacation(status, level)
+            school_before.append(count)
+
+        breaks: List[List[int]] = []
+        for event in calendar.timeline(level).between(first_day, last_day):
+            start = event.start.toordinal() - self._origin
+            end = event.end.toordinal() - self._origin
+            if breaks and breaks[-1][1] + 1 >= start:
+                breaks[-1][1] = max(breaks[-1][1], end)
+            else:
+                breaks.append([start, end])
+        summers = [bounds for bounds in breaks if bounds[1] - bounds[0] + 1 >= SUMMER_MIN_DAYS]
+
+        current = summer = 0
+        for offset in range(len(school_before) - 1):
+            while current < len(breaks) and breaks[current][1] < offset:
+                current += 1
+            while summer < len(summers) and summers[summer][1] < offset:
+                summer += 1
+            if current < len(breaks):
+                self._break_start.append(breaks[current][0])
+                self._break_end.append(breaks[current][1])
+            else:
+                self._break_start.append(_NO_BREAK)
+                self._break_end.append(_NO_BREAK)
+            self._summer_start.append(summers[summer][0] if summer < len(summers) else _NO_BREAK)
+
+    def countdown(self, day: date) -> Countdown:
+        """Return the countdown values for a date."""
+        offset = day.toordinal() - self._origin
+        if not 0 <= offset < len(self._break_start):
+            return Countdown(None, None, None)
+
+        school_days = None
+        summer_start = self._summer_start[offset]
+        if summer_start != _NO_BREAK:
+            summer_start = max(summer_start, offset)
+            school_days = self._school_before[summer_start] - self._school_before[offset]
+
+        break_start, break_end = self._break_start[offset], self._break_end[offset]
+        if break_start == _NO_BREAK:
+            return Countdown(school_days, 0, None)
+        if break_start <= offset:
+            return Countdown(school_days, break_end - offset + 1, 0)
+        return Countdown(school_days, 0, break_start - offset)
+
+
+def is_vacation(status: DayStatus, level: str) -> bool:
+    """Return True if a status is a vacation for the given school level."""
+    return status.high_vacation if level == LEVEL_HIGH else status.elementary_vacation
+
+
+def evaluate_day(
+    day: date, holiday: Optional[HolidayRecord], friday_high: bool
+) -> DayStatus:
+    """
+    Apply the holiday and weekday rules to a single day.
+
+    Args:
+        day: Date being evaluated
+        holiday: Holiday record covering the date, if any
+        friday_high: Whether high schools are closed on Fridays
+
+    Returns:
+        DayStatus for the date
+    """
+    if holiday is not None:
+        if holiday.high_only:
+            return DayStatus(False, True, HEBREW_TEXTS["big_vacation_high"])
+        return DayStatus(True, True, holiday.summary)
+
+    weekday = day.isoweekday()
+
+    # Friday special case for high school
+    if weekday == 5 and friday_high:
+        return DayStatus(False, True, HEBREW_TEXTS["no_classes_high"])
+
+    # Saturday (sabbath)
+    if weekday == 6:
+        return DayStatus(True, True, HEBREW_TEXTS["sabbath"])
+
+    # Default: school day
+    return DayStatus(False, False, HEBREW_TEXTS["school_day"])
+
+
+class CompiledCalendar:
+    """Array-backed calendar holding one status code per day."""
+
+    def __init__(
+        self,
+        index: HolidayIndex,
+        friday_high: bool,
+        overrides: Tuple[Override, ...] = (),
+    ) -> None:
+        """
+        Evaluate every day covered by the index or the overrides.
+
+        Args:
+            index: Compiled holiday index
+            friday_high: Whether high schools are closed on Fridays
+            overrides: User overrides, applied in order after the rules
+        """
+        self.friday_high = friday_high
+        self.overrides = overrides
+        # Increased whenever statuses change in place (see update_overrides)
+        self.revision = 0
+        self._index = index
+        self._override_days = overrides_by_day(overrides)
+        self._timelines: Dict[str, VacationTimeline] = {}
+        self._countdowns: Dict[str, CountdownTable] = {}
+        self._statuses: List[DayStatus] = []
+        self._interned: Dict[DayStatus, int] = {}
+        self._origin = 0
+        self._codes = array("B")
+        self._transitions: List[int] = []
+
+        bounds = [
+            ordinal
+            for ordinal in (
+                index.first_day.toordinal() if index.first_day else None,
+                index.last_day.toordinal() if index.last_day else None,
+                *((min(self._override_days), max(self._override_days)) if overrides else ()),
+            )
+            if ordinal is not None
+        ]
+        if not bounds:
+            return
+
+        first, last = min(bounds), max(bounds)
+        codes = [self._intern(self._evaluate(ordinal)) for ordinal in range(first, last + 1)]
+        self._origin = first
+        self._codes = array("B" if len(self._statuses) <= 0x100 else "H", codes)
+        self._build_transitions()
+
+    @property
+    def index(self) -> HolidayIndex:
+        """Return the holiday index the calendar was compiled from."""
+        return self._index
+
+    def _evaluate(self, ordinal: int) -> DayStatus:
+        """Apply the holiday and weekday rules, then the overrides, to a day."""
+        day = date.fromordinal(ordinal)
+        status = evaluate_day(day, self._index.lookup(day), self.friday_high)
+        for override in self._override_days.get(ordinal, ()):
+            status = override.apply(status)
+        return status
+
+    def _intern(self, status: DayStatus) -> int:
+        """Return the code of a status, adding it to the side table if new."""
+        code = self._interned.get(status)
+        if code is None:
+            code = self._interned[status] = len(self._statuses)
+            self._statuses.append(status)
+            if code == 0x100 and self._codes.typecode == "B":
+                self._codes = array("H", self._codes)
+        return code
+
+    def update_overrides(self, overrides: Tuple[Override, ...]) -> None:
+        """
+        Replace the overrides, recompiling only the days whose overrides changed.
+
+        Only the transitions within the changed span are recomputed; the
+        timelines and countdown tables are rebuilt lazily on next use.
+
+        Args:
+            overrides: The new user overrides
+        """
+        previous, current = self._override_days, overrides_by_day(overrides)
+        self.overrides = overrides
+        self._override_days = current
+        changed = {
+            ordinal
+            for ordinal in previous.keys() | current.keys()
+            if previous.get(ordinal) != current.get(ordinal)
+        }
+        if not changed:
+            return
+
+        self.revision += 1
+        self._timelines.clear()
+        self._countdowns.clear()
+        first, last = min(changed), max(changed)
+        end = self._origin + len(self._codes)
+
+        if not self._codes or first < self._origin or last >= end:
+            # The span leaves the table: grow it, then redo the transitions
+            new_first = min(first, self._origin) if self._codes else first
+            new_last = max(last, end - 1) if self._codes else last
+            codes = [
+                self._intern(self._evaluate(ordinal))
+                if not self._origin <= ordinal < end or ordinal in changed
+                else self._codes[ordinal - self._origin]
+                for ordinal in range(new_first, new_last + 1)
+            ]
+            self._origin = new_first
+            self._codes = array(self._codes.typecode, codes)
+            self._transitions = []
+            self._build_transitions()
+            return
+
+        for ordinal in changed:
+            self._codes[ordinal - self._origin] = self._intern(self._evaluate(ordinal))
+
+        # Splice the transitions of the changed span (and the day after it)
+        left = bisect_left(self._transitions, first)
+        right = bisect_right(self._transitions, last + 1)
+        self._transitions[left:right] = [
+            ordinal
+            for ordinal in range(first, last + 2)
+            if self.status_for(date.fromordinal(ordinal))
+            != self.status_for(date.fromordinal(ordinal - 1))
+        ]
+
+    def _build_transitions(self) -> None:
+        """Record every ordinal whose status differs from the previous day."""
+        origin, end = self._origin, self._origin + len(self._codes)
+        transitions = self._transitions
+
+        if self.status_for(date.fromordinal(origin - 1)) != self._statuses[self._codes[0]]:
+            transitions.append(origin)
+        for offset in range(1, len(self._codes)):
+            if self._codes[offset] != self._codes[offset - 1]:
+                transitions.append(origin + offset)
+        if self.status_for(date.fromordinal(end)) != self._statuses[self._codes[-1]]:
+            transitions.append(end)
+
+    def __len__(self) -> int:
+        """Return the number of compiled days."""
+        return len(self._codes)
+
+    @property
+    def first_day(self) -> Optional[date]:
+        """Return the first compiled day."""
+        return date.fromordinal(self._origin) if self._codes else None
+
+    @property
+    def last_day(self) -> Optional[date]:
+        """Return the last compiled day."""
+        if not self._codes:
+            return None
+        return date.fromordinal(self._origin + len(self._codes) - 1)
+
+    def status_for(self, day: date) -> DayStatus:
+        """
+        Return the vacation status of a date.
+
+        Dates outside the compiled range only have weekday rules applied.
+        """
+        offset = day.toordinal() - self._origin
+        if 0 <= offset < len(self._codes):
+            return self._statuses[self._codes[offset]]
+        return evaluate_day(day, None, self.friday_high)
+
+    def evaluate_range(self, start: date, end: date) -> List[DayStatus]:
+        """
+        Return the status of every day in a range (both ends inclusive).
+
+        The compiled part of the range is read as one slice of the code
+        array; only days outside it have the weekday rules applied.
+        """
+        first, last = start.toordinal(), end.toordinal()
+        if last < first:
+            return []
+        table_first = max(first, self._origin)
+        table_last = min(last, self._origin + len(self._codes) - 1)
+        if not self._codes or table_first > table_last:
+            return [
+                evaluate_day(date.fromordinal(ordinal), None, self.friday_high)
+                for ordinal in range(first, last + 1)
+            ]
+
+        statuses = self._statuses
+        return [
+            *(
+                evaluate_day(date.fromordinal(ordinal), None, self.friday_high)
+                for ordinal in range(first, table_first)
+            ),
+            *(
+                statuses[code]
+                for code in self._codes[table_first - self._origin:table_last - self._origin + 1]
+            ),
+            *(
+                evaluate_day(date.fromordinal(ordinal), None, self.friday_high)
+                for ordinal in range(table_last + 1, last + 1)
+            ),
+        ]
+
+    def upcoming_transitions(
+        self, day: date, levels: Tuple[str, ...], limit: int
+    ) -> List[Transition]:
+        """
+        Return the next vacation starts/ends of the given levels after a date.
+
+        Transitions are read from the vacation timelines, so ordinary
+        weekends are not transitions and back-to-back vacation events are one
+        break. An end is reported on the first school day after the break,
+        with the summary of the vacation that ended.
+
+        Args:
+            day: Date to search forward from
+            levels: School levels to report
+            limit: Maximum number of transitions to return
+        """
+        one_day = timedelta(days=1)
+        found: List[Transition] = []
+        for level in levels:
+            timeline = self.timeline(level)
+            reported = 0
+            event = timeline.next_event(day)
+            while event is not None and reported < limit:
+                first = event
+                following = timeline.next_event(event.end + one_day)
+                while following is not None and following.start == event.end + one_day:
+                    event = following
+                    following = timeline.next_event(event.end + one_day)
+                if first.start > day:
+                    found.append(Transition(first.start, level, True, first.summary))
+                    reported += 1
+                found.append(Transition(event.end + one_day, level, False, event.summary))
+                reported += 1
+                event = following
+        # The sort is stable, so levels keep their order on the same day
+        found.sort(key=lambda transition: transition.day)
+        return found[:limit]
+
+    def next_transition(self, day: date) -> Optional[date]:
+        """
+        Return the first day after the given date whose status differs.
+
+        Args:
+            day: Date to search forward from
+
+        Returns:
+            The date of the next status change, or None if none is found
+        """
+        ordinal = day.toordinal()
+        if self._codes and self._origin - 1 <= ordinal < self._origin + len(self._codes):
+            position = bisect_right(self._transitions, ordinal)
+            if position < len(self._transitions):
+                return date.fromordinal(self._transitions[position])
+
+        # Outside the compiled range only the weekday rules apply
+        current = self.status_for(day)
+        probe = day
+        for _ in range(_WEEKDAY_RULE_PERIOD):
+            probe += timedelta(days=1)
+            if self.status_for(probe) != current:
+                return probe
+        return None
+
+    def timeline(self, level: str) -> VacationTimeline:
+        """Return the vacation events of a school level, building them once."""
+        timeline = self._timelines.get(level)
+        if timeline is None:
+            timeline = self._timelines[level] = VacationTimeline(self._build_events(level))
+        return timeline
+
+    def countdowns(self, level: str) -> CountdownTable:
+        """Return the countdown table of a school level, building it once."""
+        table = self._countdowns.get(level)
+        if table is None:
+            table = self._countdowns[level] = CountdownTable(self, level)
+        return table
+
+    def _build_events(self, level: str) -> List[VacationEvent]:
+        """
+        Turn the vacation days of a school level into vacation events.
+
+        Days off from the weekday rules alone (Saturdays, and Fridays for
+        high schools when configured) that touch a holiday or an override are
+        included in it, and consecutive days with the same summary are
+        merged. Ordinary weekends on their own are not events.
+        """
+        events: List[VacationEvent] = []
+        if not self._codes:
+            return events
+
+        index = self._index
+        # First day and summary of the event being built; the summary stays
+        # None while the run of vacation days only holds rule days
+        start: Optional[int] = None
+        summary: Optional[str] = None
+
+        def close(last: int) -> None:
+            if start is not None and summary is not None:
+                events.append(
+                    VacationEvent(date.fromordinal(start), date.fromordinal(last), summary)
+                )
+
+        # The weekday rules can extend an event up to a week past the table
+        first = self._origin - _WEEKDAY_RULE_PERIOD
+        last = self._origin + len(self._codes) + _WEEKDAY_RULE_PERIOD
+        for ordinal in range(first, last):
+            day = date.fromordinal(ordinal)
+            status = self.status_for(day)
+            if not is_vacation(status, level):
+                close(ordinal - 1)
+                start = summary = None
+                continue
+
+            overrides = self._override_days.get(ordinal)
+            record = None if overrides else index.lookup(day)
+            if overrides:
+                day_summary: Optional[str] = overrides[-1].summary
+            elif record is not None and (not record.high_only or level == LEVEL_HIGH):
+                day_summary = record.summary
+            elif status.summary not in _RULE_SUMMARIES:
+                day_summary = status.summary
+            else:
+                day_summary = None
+
+            if start is None:
+                start = ordinal
+            if day_summary is None or day_summary == summary:
+                continue
+            if summary is not None:
+                close(ordinal - 1)
+                start = ordinal
+            summary = day_summary
+        close(last - 1)
+        return events
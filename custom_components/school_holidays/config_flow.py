@@ -11,6 +11,7 @@ import voluptuous as vol
 
 from homeassistant import config_entries
 from homeassistant.data_entry_flow import FlowResult
+from homeassistant.helpers.selector import ObjectSelector
 
 from .const import (
     DOMAIN,
@@ -18,12 +19,24 @@ from .const import (
     CONF_HIGH_SCHOOL,
     CONF_FRIDAY_HIGH_SCHOOL,
     CONF_LANGUAGE,
+    CONF_UPDATE_INTERVAL,
+    CONF_DATA_URL,
+    CONF_PROFILES,
+    CONF_OVERRIDES,
     DEFAULT_ELEMENTARY_SCHOOL,
     DEFAULT_HIGH_SCHOOL,
     DEFAULT_FRIDAY_HIGH_SCHOOL,
     DEFAULT_LANGUAGE,
+    DEFAULT_UPDATE_INTERVAL,
+    DEFAULT_DATA_URL,
     LANGUAGE_OPTIONS,
+    CONF_ICS_TOKEN,
+    LEVEL_ELEMENTARY,
+    LEVEL_HIGH,
 )
+from .ics import ics_path
+from .overrides import overrides_to_option, parse_overrides
+from .profiles import parse_profiles, profiles_to_option
 
 # Schema used in the initial configuration step
 STEP_USER_DATA_SCHEMA = vol.Schema({
@@ -31,6 +44,11 @@ STEP_USER_DATA_SCHEMA = vol.Schema({
     vol.Optional(CONF_ELEMENTARY_SCHOOL, default=DEFAULT_ELEMENTARY_SCHOOL): bool,
     vol.Optional(CONF_HIGH_SCHOOL, default=DEFAULT_HIGH_SCHOOL): bool,
     vol.Optional(CONF_FRIDAY_HIGH_SCHOOL, default=DEFAULT_FRIDAY_HIGH_SCHOOL): bool,
+    vol.Optional(CONF_UPDATE_INTERVAL, default=DEFAULT_UPDATE_INTERVAL): vol.All(
+        vol.Coerce(int), vol.Range(min=1, max=168)
+    ),
+    # Suggested rather than defaulted, so that clearing it selects bundled data only
+    vol.Optional(CONF_DATA_URL, description={"suggested_value": DEFAULT_DATA_URL}): str,
 })
 
 
@@ -58,6 +76,8 @@ class ConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
                 data_schema=STEP_USER_DATA_SCHEMA,
             )
 
+        # An empty field is left out of the input; store it as bundled data only
+        user_input.setdefault(CONF_DATA_URL, "")
         # Create the config entry with user input
         return self.async_create_entry(title="Israel School Holidays", data=user_input)
 
@@ -99,13 +119,29 @@ class OptionsFlowHandler(config_entries.OptionsFlow):
         Returns:
             FlowResult: Either shows the options form or updates the entry.
         """
+        errors: Dict[str, str] = {}
         if user_input is not None:
-            # Update options and finish flow
-            return self.async_create_entry(title="", data=user_input)
+            try:
+                profiles = parse_profiles(user_input.get(CONF_PROFILES) or {})
+            except vol.Invalid:
+                errors[CONF_PROFILES] = "invalid_profiles"
+            try:
+                overrides = parse_overrides(user_input.get(CONF_OVERRIDES) or [])
+            except vol.Invalid:
+                errors[CONF_OVERRIDES] = "invalid_overrides"
+            if not errors:
+                # An empty field is left out of the input; store it as bundled data only
+                user_input.setdefault(CONF_DATA_URL, "")
+                # Store profiles and overrides normalized, with ISO dates
+                user_input[CONF_PROFILES] = profiles_to_option(profiles)
+                user_input[CONF_OVERRIDES] = overrides_to_option(overrides)
+                return self.async_create_entry(title="", data=user_input)
 
         # Show options form with current or default values
         return self.async_show_form(
             step_id="init",
+            errors=errors,
+            description_placeholders={"ics_paths": self._ics_paths()},
             data_schema=vol.Schema({
                 vol.Optional(
                     CONF_LANGUAGE,
@@ -135,5 +171,45 @@ class OptionsFlowHandler(config_entries.OptionsFlow):
                         self.config_entry.data.get(CONF_FRIDAY_HIGH_SCHOOL, DEFAULT_FRIDAY_HIGH_SCHOOL)
                     ),
                 ): bool,
+                vol.Optional(
+                    CONF_UPDATE_INTERVAL,
+                    default=self.config_entry.options.get(
+                        CONF_UPDATE_INTERVAL,
+                        self.config_entry.data.get(CONF_UPDATE_INTERVAL, DEFAULT_UPDATE_INTERVAL)
+                    ),
+                ): vol.All(vol.Coerce(int), vol.Range(min=1, max=168)),
+                vol.Optional(
+                    CONF_DATA_URL,
+                    description={
+                        "suggested_value": self.config_entry.options.get(
+                            CONF_DATA_URL, self.config_entry.data.get(CONF_DATA_URL, "")
+                        )
+                    },
+                ): str,
+                vol.Optional(
+                    CONF_PROFILES,
+                    default=self.config_entry.options.get(CONF_PROFILES, {}),
+                ): ObjectSelector(),
+                vol.Optional(
+                    CONF_OVERRIDES,
+                    default=self.config_entry.options.get(CONF_OVERRIDES, []),
+                ): ObjectSelector(),
             }),
         )
+
+    def _ics_paths(self) -> str:
+        """
+        Return the iCalendar feed paths of the entry, one per line.
+
+        The paths carry the entry's secret token, so they are shown here
+        rather than in entity attributes.
+        """
+        token = self.config_entry.data.get(CONF_ICS_TOKEN)
+        if not token:
+            return "-"
+        language = self.config_entry.options.get(
+            CONF_LANGUAGE, self.config_entry.data.get(CONF_LANGUAGE, DEFAULT_LANGUAGE)
+        )
+        return "\n".join(
+            f"- `{ics_path(token, level, language)}`" for level in (LEVEL_ELEMENTARY, LEVEL_HIGH)
+        )
@@ -3,18 +3,29 @@
 DOMAIN = "school_holidays"
 VERSION = "3.1.0"
 
+# hass.data[DOMAIN] key of the shared engines, by dataset URL
+DATA_ENGINES = "engines"
+
 # Configuration keys
 CONF_ELEMENTARY_SCHOOL = "elementary_school"
 CONF_HIGH_SCHOOL = "high_school"
 CONF_FRIDAY_HIGH_SCHOOL = "friday_high_school"
 CONF_UPDATE_INTERVAL = "update_interval"
 CONF_LANGUAGE = "language"
+CONF_DATA_URL = "data_url"
+CONF_PROFILES = "profiles"
+CONF_OVERRIDES = "overrides"
+
+# Config entry data key of the secret token in the iCalendar feed URLs
+CONF_ICS_TOKEN = "ics_token"
 
 # Default values
 DEFAULT_ELEMENTARY_SCHOOL = True
 DEFAULT_HIGH_SCHOOL = True
 DEFAULT_FRIDAY_HIGH_SCHOOL = True
 DEFAULT_LANGUAGE = "he"
+DEFAULT_UPDATE_INTERVAL = 24  # hours
+DEFAULT_DATA_URL = "https://raw.githubusercontent.com/rt400/School-Vacation/master/data.json"
 
 # Language options
 LANGUAGE_OPTIONS = {
@@ -22,46 +33,54 @@ LANGUAGE_OPTIONS = {
     "en": "English"
 }
 
-# Holidays data (static)
-HOLIDAYS_DATA = [
-    {"START": "2025-07-01", "END": "2025-08-31", "SUMMARY": "חופשת קיץ"},
-    {"START": "2025-09-22", "END": "2025-09-24", "SUMMARY": "ראש השנה"},
-    {"START": "2025-10-01", "END": "2025-10-02", "SUMMARY": "יום הכיפורים"},
-    {"START": "2025-10-03", "END": "2025-10-05", "SUMMARY": "ימי חופשה בין יום הכיפורים לחג סוכות"},
-    {"START": "2025-10-06", "END": "2025-10-14", "SUMMARY": "חג סוכות"},
-    {
-        "START": "2025-10-15",
-        "END": "2025-10-15",
-        "HIGH": "True",
-        "SUMMARY": "אסרו חג סוכות הוא יום לימודים בגני הילדים, בתי הספר היסודיים וחטיבות הביניים ויום חופש בחטיבות העליונות ובתיכונים."
-    },
-    {"START": "2025-12-16", "END": "2025-12-22", "SUMMARY": "חג החנוכה"},
-    {"START": "2026-03-03", "END": "2026-03-04", "SUMMARY": "חופשת חג פורים"},
-    {"START": "2026-03-24", "END": "2026-04-08", "SUMMARY": "חופשת חג הפסח"},
-    {"START": "2026-04-22", "END": "2026-04-22", "SUMMARY": "יום העצמאות"},
-    {
-        "START": "2026-05-05",
-        "END": "2026-05-05",
-        "HIGH": "True",
-        "SUMMARY": "ל\"ג בעומר הוא יום לימודים בגני הילדים, בתי הספר היסודיים וחטיבות הביניים, ויום חופש בחטיבות העליונות ובתיכונים (כיתות י'-יב')"
-    },
-    {"START": "2026-05-21", "END": "2026-05-22", "SUMMARY": "חג השבועות"},
-    {"START": "2026-06-19", "END": "2026-06-30", "SUMMARY": "חופשת קיץ תיכון", "HIGH": "True"},
-    {"START": "2026-07-01", "END": "2026-08-31", "SUMMARY": "חופשת קיץ"},
-]
-
 # Entity names by language
 ENTITY_NAMES = {
     "he": {
         "summary": "סטטוס חופשת בתי ספר",
         "elementary_vacation": "חופש בית ספר יסודי",
         "high_vacation": "חופש בית ספר על יסודי",
+        "elementary_calendar": "לוח חופשות בית ספר יסודי",
+        "high_calendar": "לוח חופשות בית ספר על יסודי",
+        "elementary_school_days_until_summer": "ימי לימודים עד החופש הגדול - יסודי",
+        "elementary_vacation_days_left": "ימי חופשה שנותרו - יסודי",
+        "elementary_days_until_next_vacation": "ימים עד החופשה הבאה - יסודי",
+        "high_school_days_until_summer": "ימי לימודים עד החופש הגדול - על יסודי",
+        "high_vacation_days_left": "ימי חופשה שנותרו - על יסודי",
+        "high_days_until_next_vacation": "ימים עד החופשה הבאה - על יסודי",
+        "profile_vacation": "חופש בית ספר - {}",
+        "refresh_duration": "משך עדכון",
+        "compile_duration": "משך טעינת נתונים",
+        "wake_drift": "איחור עדכון חצות",
+        "status_lookups": "בדיקות סטטוס",
+        "refresh_errors": "שגיאות עדכון",
+        "elementary_vacation_days": "ימי חופשה - יסודי",
+        "elementary_school_days": "ימי לימודים - יסודי",
+        "high_vacation_days": "ימי חופשה - על יסודי",
+        "high_school_days": "ימי לימודים - על יסודי",
         "device_name": "חופשות בתי ספר בישראל",
     },
     "en": {
         "summary": "School Status",
         "elementary_vacation": "Elementary School Vacation",
         "high_vacation": "High School Vacation",
+        "elementary_calendar": "Elementary School Vacations",
+        "high_calendar": "High School Vacations",
+        "elementary_school_days_until_summer": "Elementary School Days Until Summer",
+        "elementary_vacation_days_left": "Elementary Vacation Days Left",
+        "elementary_days_until_next_vacation": "Elementary Days Until Next Vacation",
+        "high_school_days_until_summer": "High School Days Until Summer",
+        "high_vacation_days_left": "High School Vacation Days Left",
+        "high_days_until_next_vacation": "High School Days Until Next Vacation",
+        "profile_vacation": "School Vacation - {}",
+        "refresh_duration": "Refresh Duration",
+        "compile_duration": "Dataset Compile Duration",
+        "wake_drift": "Midnight Wake Drift",
+        "status_lookups": "Status Lookups",
+        "refresh_errors": "Refresh Errors",
+        "elementary_vacation_days": "Elementary Vacation Days",
+        "elementary_school_days": "Elementary School Days",
+        "high_vacation_days": "High School Vacation Days",
+        "high_school_days": "High School Days",
         "device_name": "Israel School Holidays",
     },
 }
@@ -71,20 +90,93 @@ SENSOR_TYPES = {
     "summary": {"icon": "mdi:school", "device_class": None}
 }
 
+# Diagnostic sensors (disabled by default); values come from metrics.py
+METRIC_SENSOR_TYPES = {
+    "refresh_duration": {"icon": "mdi:timer-outline", "unit": "ms"},
+    "compile_duration": {"icon": "mdi:database-cog-outline", "unit": "ms"},
+    "wake_drift": {"icon": "mdi:clock-alert-outline", "unit": "s"},
+    "status_lookups": {"icon": "mdi:magnify", "unit": None},
+    "refresh_errors": {"icon": "mdi:alert-circle-outline", "unit": None},
+}
+
+# School levels
+LEVEL_ELEMENTARY = "elementary"
+LEVEL_HIGH = "high"
+
+# Countdown sensors; "counter" is a field of compiled_calendar.Countdown
+COUNTDOWN_SENSOR_TYPES = {
+    f"{level}_{counter}": {"icon": icon, "level": level, "counter": counter}
+    for level in (LEVEL_ELEMENTARY, LEVEL_HIGH)
+    for counter, icon in (
+        ("school_days_until_summer", "mdi:calendar-end"),
+        ("vacation_days_left", "mdi:beach"),
+        ("days_until_next_vacation", "mdi:calendar-arrow-right"),
+    )
+}
+
+CALENDAR_TYPES = {
+    "elementary_calendar": {"icon": "mdi:calendar-star", "level": LEVEL_ELEMENTARY},
+    "high_calendar": {"icon": "mdi:calendar-star-outline", "level": LEVEL_HIGH},
+}
+
 BINARY_SENSOR_TYPES = {
     "elementary_vacation": {"icon": "mdi:school", "device_class": None},
     "high_vacation": {"icon": "mdi:school-outline", "device_class": None},
 }
 
+# Binary sensors of the school profiles (see profiles.py)
+PROFILE_SENSOR_ICON = "mdi:account-school"
+
 # Status text constants
 HEBREW_TEXTS = {
     "big_vacation_high": "חופש גדול - על יסודי",
     "sabbath": "יום שבת",
     "no_classes_high": "אין לימודים - על יסודי",
     "school_day": "יום לימודים",
+    "extra_vacation": "יום חופש נוסף",
+    "makeup_day": "יום השלמת לימודים",
+    "strike": "שביתה - אין לימודים",
     "error": "שגיאה",
 }
 
+# Bus events fired when a school level's vacation starts or ends
+EVENT_VACATION_STARTED = f"{DOMAIN}_vacation_started"
+EVENT_VACATION_ENDED = f"{DOMAIN}_vacation_ended"
+UPCOMING_TRANSITIONS = 5
+
+# Academic years the dataset loads or generates, around the current one
+SUPPORTED_YEARS_BEFORE = 10
+SUPPORTED_YEARS_AFTER = 10
+
+# Status grids (websocket month/year views) kept in memory per entry
+GRID_CACHE_SIZE = 24
+
+# Services
+SERVICE_EVALUATE_DATES = "evaluate_dates"
+ATTR_CONFIG_ENTRY_ID = "config_entry_id"
+ATTR_DATES = "dates"
+ATTR_START_DATE = "start_date"
+ATTR_END_DATE = "end_date"
+MAX_EVALUATE_DAYS = 3660  # about ten years
+
+SERVICE_ADD_OVERRIDE = "add_override"
+SERVICE_REMOVE_OVERRIDE = "remove_override"
+ATTR_TYPE = "type"
+ATTR_LEVEL = "level"
+ATTR_SUMMARY = "summary"
+
+SERVICE_IMPORT_STATISTICS = "import_statistics"
+ATTR_START_YEAR = "start_year"
+ATTR_END_YEAR = "end_year"
+MAX_IMPORT_YEARS = 20
+
+# Override layers (see overrides.py)
+OVERRIDE_VACATION = "vacation"
+OVERRIDE_SCHOOL_DAY = "school_day"
+OVERRIDE_STRIKE = "strike"
+OVERRIDE_TYPES = (OVERRIDE_VACATION, OVERRIDE_SCHOOL_DAY, OVERRIDE_STRIKE)
+OVERRIDE_LEVEL_ALL = "all"
+
 # Error messages
 ERROR_CANNOT_CONNECT = "cannot_connect"
 ERROR_INVALID_DATA = "invalid_data"
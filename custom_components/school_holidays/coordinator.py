@@ -1,20 +1,29 @@
 """
 Data coordinator for Israel School Holidays.
 
-This module manages local school holiday data for Israel.
+Every config entry has a coordinator that applies the entry's options to the
+holiday data compiled by the shared engine (see engine.py).
 Updates are performed:
 - Immediately when Home Assistant starts or restarts
-- Daily at 12:00 AM
+- At midnight (Home Assistant timezone) of the next day whose status changes,
+  by the engine's single timer
 """
 
+import asyncio
 import logging
-from datetime import datetime, date
-from typing import Dict, List, Any
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from datetime import datetime, date, timedelta
+from typing import Callable, Dict, List, Any, Optional, Tuple
 
-from homeassistant.core import HomeAssistant
+import voluptuous as vol
+
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.helpers.update_coordinator import DataUpdateCoordinator
-from homeassistant.helpers.event import async_track_time_change
+from homeassistant.helpers import device_registry as dr
+from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
+from homeassistant.util import dt as dt_util
 
 from .const import (
     DOMAIN,
@@ -22,79 +31,380 @@ from .const import (
     CONF_HIGH_SCHOOL,
     CONF_FRIDAY_HIGH_SCHOOL,
     CONF_LANGUAGE,
+    CONF_UPDATE_INTERVAL,
+    CONF_DATA_URL,
+    CONF_PROFILES,
+    CONF_OVERRIDES,
+    DEFAULT_ELEMENTARY_SCHOOL,
+    DEFAULT_HIGH_SCHOOL,
+    DEFAULT_FRIDAY_HIGH_SCHOOL,
+    DEFAULT_LANGUAGE,
+    DEFAULT_UPDATE_INTERVAL,
     HEBREW_TEXTS,
-    HOLIDAYS_DATA,
+    COUNTDOWN_SENSOR_TYPES,
+    EVENT_VACATION_STARTED,
+    EVENT_VACATION_ENDED,
+    LEVEL_ELEMENTARY,
+    LEVEL_HIGH,
+    UPCOMING_TRANSITIONS,
+    GRID_CACHE_SIZE,
 )
+from .compiled_calendar import CompiledCalendar, VacationEvent
+from .dataset import academic_year
+from .descriptions import SchoolHolidaysDescriptions, build_descriptions
+from .engine import SchoolHolidaysEngine
+from .holiday_index import HolidayIndex, RejectedRow
+from .metrics import RefreshMetrics
+from .overrides import Override, parse_overrides
+from .profiles import Profile, ProfileTable, parse_profiles
+from .snapshot import StatusSnapshot, StatusSnapshotStore
 
 _LOGGER = logging.getLogger(__name__)
 
+
+@dataclass(frozen=True, slots=True)
+class SchoolHolidaysOptions:
+    """Effective options of a config entry (options override initial data)."""
+
+    elementary_enabled: bool
+    high_enabled: bool
+    friday_high_enabled: bool
+    language: str
+    update_interval: int
+    data_url: str
+    profiles: Tuple[Profile, ...]
+    overrides: Tuple[Override, ...]
+
+    @classmethod
+    def from_entry(cls, entry: ConfigEntry) -> "SchoolHolidaysOptions":
+        """Resolve the options of a config entry once."""
+        def get(key: str, default: Any) -> Any:
+            return entry.options.get(key, entry.data.get(key, default))
+
+        try:
+            profiles = parse_profiles(get(CONF_PROFILES, {}), skip_unsupported=True)
+        except vol.Invalid as err:
+            _LOGGER.warning("Ignoring invalid school profiles: %s", err)
+            profiles = ()
+        try:
+            overrides = parse_overrides(get(CONF_OVERRIDES, []), skip_unsupported=True)
+        except vol.Invalid as err:
+            _LOGGER.warning("Ignoring invalid calendar overrides: %s", err)
+            overrides = ()
+
+        return cls(
+            elementary_enabled=get(CONF_ELEMENTARY_SCHOOL, DEFAULT_ELEMENTARY_SCHOOL),
+            high_enabled=get(CONF_HIGH_SCHOOL, DEFAULT_HIGH_SCHOOL),
+            friday_high_enabled=get(CONF_FRIDAY_HIGH_SCHOOL, DEFAULT_FRIDAY_HIGH_SCHOOL),
+            language=get(CONF_LANGUAGE, DEFAULT_LANGUAGE),
+            update_interval=get(CONF_UPDATE_INTERVAL, DEFAULT_UPDATE_INTERVAL),
+            # Entries created before the option existed keep the bundled data
+            data_url=get(CONF_DATA_URL, ""),
+            profiles=profiles,
+            overrides=overrides,
+        )
+
+    @property
+    def entity_set(self) -> Tuple[bool, bool]:
+        """Return the options that decide which entities exist."""
+        return (self.elementary_enabled, self.high_enabled)
+
+    @property
+    def reload_key(self) -> Tuple[Any, ...]:
+        """Return the options that cannot be applied without a reload."""
+        return (*self.entity_set, self.data_url, *(p.key for p in self.profiles))
+
+
 class SchoolHolidaysCoordinator(DataUpdateCoordinator):
-    """Coordinator that handles Israel school holiday data using local data only."""
+    """Coordinator that handles Israel school holiday data.
 
-    def __init__(self, hass: HomeAssistant, entry: ConfigEntry) -> None:
+    A thin view on the shared engine: the holiday data, compiled calendars
+    and timers belong to the engine, the coordinator only applies the options
+    of its config entry.
+    """
+
+    def __init__(
+        self, hass: HomeAssistant, entry: ConfigEntry, engine: SchoolHolidaysEngine
+    ) -> None:
         """
         Initialize the coordinator.
 
         Args:
             hass: Home Assistant instance
             entry: Config entry containing user options
+            engine: Shared engine of the entry's dataset URL
         """
         self.hass = hass
         self.entry = entry
+        self.engine = engine
+        self.options = SchoolHolidaysOptions.from_entry(entry)
+
+        # Entity names and device info, built once per language
+        self._descriptions = build_descriptions(entry.entry_id)
+        self.descriptions: SchoolHolidaysDescriptions = self._descriptions_for(
+            self.options.language
+        )
 
         super().__init__(
             hass,
             _LOGGER,
             name=DOMAIN,
             update_interval=None,  # No automatic updates besides scheduled
+            always_update=False,  # Only notify entities when the status changes
         )
 
-        self._school_data: List[Dict[str, Any]] = HOLIDAYS_DATA
         self._last_update: datetime = datetime.now()
+        # Day of the current data, to detect vacation starts/ends
+        self._data_day: Optional[date] = None
+        # Entities that need a refresh at every midnight (countdowns)
+        self._daily_listeners = 0
+
+        # Calendar of the entry's overrides, patched in place when they change
+        self._override_calendar: Optional[CompiledCalendar] = None
+        # Profiles evaluated together, rebuilt when the calendar or profiles change
+        self._profile_table: Optional[ProfileTable] = None
+
+        # Single-flight status calculation shared by refreshes for the same day
+        self._status_day: Optional[date] = None
+        self._status_task: Optional[asyncio.Task] = None
+
+        # Last status persisted for instant startup, and the snapshot the
+        # data was restored from until the first real calculation
+        self._snapshot_store = StatusSnapshotStore(hass, entry)
+        self._restored: Optional[StatusSnapshot] = None
+
+        # Status grids by (start, end), valid for one calendar version
+        self._grids: OrderedDict[Tuple[date, date], List[Dict[str, Any]]] = OrderedDict()
+        self._grids_version: Optional[Tuple[Any, ...]] = None
+
+        # Refresh timings, lookup and error counts, and the diagnostic
+        # sensors to update after every refresh
+        self.metrics = RefreshMetrics()
+        self._metrics_listeners: List[Callable[[], None]] = []
+
+    @property
+    def last_update(self) -> datetime:
+        """Return when the status was last recalculated."""
+        return self._last_update
 
-        # Immediate refresh on HA start/restart
-        self.hass.async_create_task(self.async_refresh())
+    @property
+    def school_data(self) -> List[Dict[str, Any]]:
+        """Return the raw holiday rows loaded so far."""
+        return self.engine.school_data
+
+    @property
+    def loaded_years(self) -> List[int]:
+        """Return the academic years loaded from the dataset."""
+        return self.engine.loaded_years
+
+    @property
+    def generated_years(self) -> List[int]:
+        """Return the academic years generated from the Hebrew calendar."""
+        return self.engine.generated_years
+
+    @property
+    def rejected_rows(self) -> List[RejectedRow]:
+        """Return the dataset rows rejected at load time."""
+        return self.engine.rejected_rows
 
-        # Schedule daily refresh at 12:00 AM
-        async_track_time_change(
-            self.hass,
-            self._daily_refresh_callback,
-            hour=0,
-            minute=0,
-            second=0,
+    @property
+    def holiday_index(self) -> HolidayIndex:
+        """Return the compiled holiday index."""
+        return self.engine.holiday_index
+
+    @property
+    def calendar(self) -> CompiledCalendar:
+        """
+        Return the compiled per-day calendar of the entry.
+
+        Without overrides this is the engine's shared calendar for the
+        entry's Friday rule. With overrides the entry has its own calendar;
+        it is rebuilt when the dataset or the Friday rule changes, and only
+        the days whose overrides changed are recompiled otherwise.
+        """
+        friday_high = self.options.friday_high_enabled
+        overrides = self.options.overrides
+        if not overrides:
+            self._override_calendar = None
+            return self.engine.calendar_for(friday_high)
+
+        calendar = self._override_calendar
+        if (
+            calendar is None
+            or calendar.index is not self.engine.holiday_index
+            or calendar.friday_high != friday_high
+        ):
+            calendar = self._override_calendar = CompiledCalendar(
+                self.engine.holiday_index, friday_high, overrides
+            )
+        elif calendar.overrides != overrides:
+            calendar.update_overrides(overrides)
+        return calendar
+
+    @property
+    def calendar_version(self) -> Tuple[Any, ...]:
+        """
+        Return a value that changes whenever the entry's calendar changes.
+
+        Covers the dataset, the Friday rule and the overrides, so anything
+        rendered from the calendar can be cached until it differs.
+        """
+        calendar = self.calendar
+        return (
+            self.engine.version, calendar.friday_high, calendar.overrides, calendar.revision
         )
 
+    @property
+    def profile_table(self) -> ProfileTable:
+        """Return the compiled table of the entry's profiles."""
+        calendar = self.calendar
+        table = self._profile_table
+        if (
+            table is None
+            or table.calendar is not calendar
+            or table.revision != calendar.revision
+            or table.profiles != self.options.profiles
+        ):
+            table = self._profile_table = ProfileTable(calendar, self.options.profiles)
+        return table
+
     @property
     def elementary_enabled(self) -> bool:
         """Return True if elementary school vacation checks are enabled."""
-        return self.entry.options.get(
-            CONF_ELEMENTARY_SCHOOL,
-            self.entry.data.get(CONF_ELEMENTARY_SCHOOL, True)
-        )
+        return self.options.elementary_enabled
 
     @property
     def high_enabled(self) -> bool:
         """Return True if high school vacation checks are enabled."""
-        return self.entry.options.get(
-            CONF_HIGH_SCHOOL,
-            self.entry.data.get(CONF_HIGH_SCHOOL, True)
-        )
+        return self.options.high_enabled
 
     @property
     def friday_high_enabled(self) -> bool:
         """Return True if Fridays are considered vacation for high school."""
-        return self.entry.options.get(
-            CONF_FRIDAY_HIGH_SCHOOL,
-            self.entry.data.get(CONF_FRIDAY_HIGH_SCHOOL, True)
-        )
+        return self.options.friday_high_enabled
+
+    @property
+    def enabled_levels(self) -> Tuple[str, ...]:
+        """Return the enabled school levels."""
+        levels = ()
+        if self.elementary_enabled:
+            levels += (LEVEL_ELEMENTARY,)
+        if self.high_enabled:
+            levels += (LEVEL_HIGH,)
+        return levels
 
     @property
     def language(self) -> str:
         """Return the selected language for holiday descriptions."""
-        return self.entry.options.get(
-            CONF_LANGUAGE,
-            self.entry.data.get(CONF_LANGUAGE, "he")
-        )
+        return self.options.language
+
+    def _descriptions_for(self, language: str) -> SchoolHolidaysDescriptions:
+        """Return the prebuilt descriptions for a language (Hebrew fallback)."""
+        return self._descriptions.get(language, self._descriptions["he"])
+
+    async def async_ensure_range(self, start: date, end: date) -> None:
+        """
+        Make sure the dataset covers a date range before it is queried.
+
+        Loads any missing academic-year shards and recompiles if needed.
+        """
+        await self.engine.async_ensure_range(start, end)
+
+    async def async_evaluate_dates(self, dates: List[date]) -> List[Dict[str, Any]]:
+        """
+        Return the vacation status of arbitrary dates.
+
+        Args:
+            dates: Dates to evaluate
+        """
+        if not dates:
+            return []
+        await self.async_ensure_range(min(dates), max(dates))
+        self.metrics.lookups += len(dates)
+        status_for = self.calendar.status_for
+        return [{"date": day.isoformat(), **status_for(day)._asdict()} for day in dates]
+
+    async def async_evaluate_range(self, start: date, end: date) -> List[Dict[str, Any]]:
+        """
+        Return the vacation status of every day in a range, in one pass.
+
+        Args:
+            start: First day of the range
+            end: Last day of the range (inclusive)
+        """
+        await self.async_ensure_range(start, end)
+        self.metrics.lookups += (end - start).days + 1
+        return [
+            {"date": date.fromordinal(ordinal).isoformat(), **status._asdict()}
+            for ordinal, status in enumerate(
+                self.calendar.evaluate_range(start, end), start.toordinal()
+            )
+        ]
+
+    async def async_status_grid(self, start: date, end: date) -> List[Dict[str, Any]]:
+        """
+        Return the status of every day in a range, cached in memory.
+
+        The most recently used grids are kept until the dataset, the Friday
+        rule or the overrides change the calendar (see calendar_version).
+
+        Args:
+            start: First day of the range
+            end: Last day of the range (inclusive)
+        """
+        await self.async_ensure_range(start, end)
+        version = self.calendar_version
+        if version != self._grids_version:
+            self._grids.clear()
+            self._grids_version = version
+
+        key = (start, end)
+        grid = self._grids.get(key)
+        if grid is not None:
+            self._grids.move_to_end(key)
+            return grid
+        grid = self._grids[key] = await self.async_evaluate_range(start, end)
+        if len(self._grids) > GRID_CACHE_SIZE:
+            self._grids.popitem(last=False)
+        return grid
+
+    async def async_apply_options(self, options: SchoolHolidaysOptions) -> None:
+        """
+        Apply changed options in place and push a single update.
+
+        Only options that keep the same set of entities and dataset are
+        applied here; enabling or disabling a school level or changing the
+        dataset URL requires a reload.
+
+        Args:
+            options: The new effective options of the entry
+        """
+        previous = self.options
+        self.options = options
+        self.async_invalidate_status()
+
+        if options.language != previous.language:
+            self.descriptions = self._descriptions_for(options.language)
+            self._async_update_device_name()
+
+        if options.update_interval != previous.update_interval:
+            self.engine.async_update_revalidation()
+
+        # Push unconditionally: a language change alters names, not the data
+        try:
+            data = await self._async_update_data()
+        except UpdateFailed as err:
+            self.async_set_update_error(err)
+            return
+        self.async_set_updated_data(data)
+
+    @callback
+    def _async_update_device_name(self) -> None:
+        """Rename the device to match the selected language."""
+        device_registry = dr.async_get(self.hass)
+        device = device_registry.async_get_device(identifiers={(DOMAIN, self.entry.entry_id)})
+        if device is not None:
+            device_registry.async_update_device(device.id, name=self.descriptions.device_name)
 
     async def _async_update_data(self) -> Dict[str, Any]:
         """
@@ -105,33 +415,119 @@ class SchoolHolidaysCoordinator(DataUpdateCoordinator):
             - elementary_vacation (bool)
             - high_vacation (bool)
             - summary (str)
-            - last_update (ISO string)
-            - raw_data (list of all holiday entries)
+            - one value per COUNTDOWN_SENSOR_TYPES key (int or None)
+            - profiles (vacation flag and summary by profile key)
+            - upcoming_transitions (list of the next vacation starts/ends)
+
+            The refresh time is kept out of the payload so that unchanged
+            results do not notify the entities; see last_update. The full
+            dataset is not part of the payload; it is available on demand
+            through the config entry diagnostics.
+
+        Raises:
+            UpdateFailed: If the status cannot be calculated; the error is
+                counted by type in the metrics and the previous data is kept
         """
+        started = time.perf_counter()
         self._last_update = datetime.now()
         _LOGGER.info("Updating school holiday status at %s", self._last_update.isoformat())
+        today = dt_util.now().date()
         try:
-            status = await self._calculate_status()
-            return {
+            status = await self._async_status_for(today)
+            data = {
                 "elementary_vacation": status.get("elementary_vacation", False),
                 "high_vacation": status.get("high_vacation", False),
                 "summary": status.get("summary", HEBREW_TEXTS["school_day"]),
-                "last_update": self._last_update.isoformat(),
-                "raw_data": self._school_data
+                **{key: status.get(key) for key in COUNTDOWN_SENSOR_TYPES},
+                "upcoming_transitions": status.get("upcoming_transitions", []),
+                "profiles": status.get("profiles", {}),
             }
+            self._fire_transition_events(today, data)
+            self._restored = None
+            self._snapshot_store.async_save(
+                StatusSnapshot(
+                    today,
+                    data,
+                    {
+                        level: self.calendar.timeline(level).next_event(today)
+                        for level in self.enabled_levels
+                    },
+                )
+            )
+            return data
         except Exception as err:
-            _LOGGER.error("Error calculating school holidays data: %s", err)
-            return {
-                "elementary_vacation": False,
-                "high_vacation": False,
-                "summary": HEBREW_TEXTS["school_day"],
-                "last_update": self._last_update.isoformat(),
-                "raw_data": self._school_data
-            }
+            self.metrics.add_error(err)
+            raise UpdateFailed(f"Error calculating school holidays data: {err}") from err
+        finally:
+            self.metrics.refresh_ms.add((time.perf_counter() - started) * 1000)
+            self.engine.async_schedule()
+            for update_callback in list(self._metrics_listeners):
+                update_callback()
 
-    async def _calculate_status(self) -> Dict[str, Any]:
+    async def async_restore_snapshot(self) -> bool:
         """
-        Determine the current vacation status for today.
+        Restore the data saved by the last refresh if it is valid for today.
+
+        The entities then have a state before the dataset is loaded; the
+        next refresh replaces the restored data (and only notifies the
+        entities if it differs).
+
+        Returns:
+            True if a snapshot was restored
+        """
+        today = dt_util.now().date()
+        snapshot = await self._snapshot_store.async_load(today)
+        if snapshot is None:
+            return False
+        self._restored = snapshot
+        self._data_day = today
+        self.async_set_updated_data(snapshot.data)
+        _LOGGER.debug("Restored school holiday status of %s from the snapshot", today)
+        return True
+
+    def next_event(self, level: str, day: date) -> Optional[VacationEvent]:
+        """
+        Return the current or next vacation of a school level.
+
+        Answered from the restored snapshot until the first real calculation.
+
+        Args:
+            level: School level
+            day: Date to search from
+        """
+        restored = self._restored
+        if restored is not None and restored.day == day and level in restored.events:
+            return restored.events[level]
+        return self.calendar.timeline(level).next_event(day)
+
+    async def _async_status_for(self, today: date) -> Dict[str, Any]:
+        """
+        Return the status for a day, sharing one calculation per day.
+
+        Concurrent or back-to-back refreshes for the same day await the same
+        task instead of recalculating. A failed calculation is not reused.
+
+        Args:
+            today: Date to evaluate, in the Home Assistant timezone
+        """
+        task = self._status_task
+        if (
+            task is None
+            or self._status_day != today
+            or (task.done() and (task.cancelled() or task.exception() is not None))
+        ):
+            self._status_day = today
+            task = self._status_task = self.hass.async_create_task(
+                self._calculate_status(today)
+            )
+        return await asyncio.shield(task)
+
+    async def _calculate_status(self, today: date) -> Dict[str, Any]:
+        """
+        Determine the vacation status for a given day.
+
+        Args:
+            today: Date to evaluate, in the Home Assistant timezone
 
         Returns:
             Dictionary with keys:
@@ -139,71 +535,132 @@ class SchoolHolidaysCoordinator(DataUpdateCoordinator):
             - high_vacation (bool)
             - summary (str)
         """
-        today = date.today()
-        weekday = today.isoweekday()
-
-        for vacation_data in self._school_data:
-            if self._is_date_in_vacation(today, vacation_data):
-                if vacation_data.get("HIGH", False):
-                    return {
-                        "elementary_vacation": False,
-                        "high_vacation": True,
-                        "summary": HEBREW_TEXTS["big_vacation_high"]
-                    }
-                return {
-                    "elementary_vacation": True,
-                    "high_vacation": True,
-                    "summary": vacation_data.get("SUMMARY", "Holiday")
-                }
-
-        # Friday special case for high school
-        if weekday == 5 and self.friday_high_enabled:
-            return {
-                "elementary_vacation": False,
-                "high_vacation": True,
-                "summary": HEBREW_TEXTS["no_classes_high"]
+        # Only the current and next academic years are needed to evaluate
+        # today and schedule the next transition
+        year = academic_year(today)
+        await self.engine.async_ensure_years((year, year + 1))
+        self.metrics.lookups += 1
+        calendar = self.calendar
+        status = calendar.status_for(today)._asdict()
+        for level in (LEVEL_ELEMENTARY, LEVEL_HIGH):
+            countdown = calendar.countdowns(level).countdown(today)
+            for counter, value in countdown._asdict().items():
+                status[f"{level}_{counter}"] = value
+        status["upcoming_transitions"] = [
+            {
+                "date": transition.day.isoformat(),
+                "level": transition.level,
+                "vacation": transition.vacation,
+                "summary": transition.summary,
             }
+            for transition in calendar.upcoming_transitions(
+                today, self.enabled_levels, UPCOMING_TRANSITIONS
+            )
+        ]
+        status["profiles"] = self.profile_table.status_for(today)
+        return status
 
-        # Saturday (sabbath)
-        if weekday == 6:
-            return {
-                "elementary_vacation": True,
-                "high_vacation": True,
-                "summary": HEBREW_TEXTS["sabbath"]
-            }
+    @callback
+    def _fire_transition_events(self, today: date, data: Dict[str, Any]) -> None:
+        """
+        Fire vacation started/ended events when a new day flips a level.
+
+        Nothing is fired on the first refresh or when only the options
+        changed the status within the same day. The events follow the binary
+        sensors, so ordinary weekends fire them too; those carry
+        weekend=True, as they are not part of any vacation event. An ended
+        event carries the summary of the day the vacation ended on.
+
+        Args:
+            today: Date the data was calculated for
+            data: The new coordinator payload
+        """
+        previous, previous_day = self.data, self._data_day
+        self._data_day = today
+        if not previous or previous_day is None or previous_day == today:
+            return
+
+        for level in self.enabled_levels:
+            key = f"{level}_vacation"
+            if data[key] == previous.get(key):
+                continue
+            started = data[key]
+            vacation_day = today if started else today - timedelta(days=1)
+            self.hass.bus.async_fire(
+                EVENT_VACATION_STARTED if started else EVENT_VACATION_ENDED,
+                {
+                    "entry_id": self.entry.entry_id,
+                    "level": level,
+                    "summary": data["summary"] if started else previous.get("summary"),
+                    "date": today.isoformat(),
+                    "weekend": not self.calendar.timeline(level).between(
+                        vacation_day, vacation_day
+                    ),
+                },
+            )
 
-        # Default: school day
-        return {
-            "elementary_vacation": False,
-            "high_vacation": False,
-            "summary": HEBREW_TEXTS["school_day"]
-        }
+    @callback
+    def async_invalidate_status(self) -> None:
+        """Drop the shared status calculation after the data or options changed."""
+        self._status_task = None
 
-    def _is_date_in_vacation(self, check_date: date, vacation_data: Dict[str, Any]) -> bool:
+    def next_refresh_day(self, today: date) -> date:
         """
-        Check if a given date falls within the specified vacation period.
+        Return the day the engine has to refresh this coordinator at.
 
         Args:
-            check_date: Date to check
-            vacation_data: Dictionary containing START, END, and optional SUMMARY
+            today: Date the current status was calculated for
 
         Returns:
-            True if check_date is within vacation period, False otherwise
+            Tomorrow while daily listeners are registered, otherwise the day
+            the entry's status or one of its profiles next changes
         """
-        try:
-            start_date = datetime.strptime(str(vacation_data["START"]), "%Y-%m-%d").date()
-            end_date = datetime.strptime(str(vacation_data["END"]), "%Y-%m-%d").date()
-            return start_date <= check_date <= end_date
-        except (KeyError, ValueError) as err:
-            _LOGGER.warning("Invalid vacation data format: %s", err)
-            return False
+        tomorrow = today + timedelta(days=1)
+        if self._daily_listeners:
+            return tomorrow
+        changes = [
+            day
+            for day in (
+                self.calendar.next_transition(today),
+                self.profile_table.next_change(today),
+            )
+            if day is not None
+        ]
+        return min(changes, default=tomorrow)
 
-    async def _daily_refresh_callback(self, now=None) -> None:
+    @callback
+    def async_add_daily_listener(self) -> CALLBACK_TYPE:
         """
-        Callback to refresh data daily at midnight.
+        Request a refresh at every midnight while the listener is registered.
 
-        Args:
-            now: Optional datetime passed by async_track_time_change
+        Returns:
+            Callback that removes the listener
+        """
+        self._daily_listeners += 1
+        if self._daily_listeners == 1:
+            self.engine.async_schedule()
+
+        @callback
+        def remove_listener() -> None:
+            self._daily_listeners -= 1
+
+        return remove_listener
+
+    @callback
+    def async_add_metrics_listener(self, update_callback: Callable[[], None]) -> CALLBACK_TYPE:
+        """
+        Call a callback after every refresh, successful or not.
+
+        Used by the diagnostic sensors, whose values change even when the
+        coordinator data does not.
+
+        Returns:
+            Callback removing the listener
         """
-        _LOGGER.info("Daily scheduled refresh triggered at %s", datetime.now().isoformat())
-        await self.async_refresh()
+        self._metrics_listeners.append(update_callback)
+
+        @callback
+        def remove_listener() -> None:
+            self._metrics_listeners.remove(update_callback)
+
+        return remove_listener
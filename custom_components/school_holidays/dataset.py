@@ -0,0 +1,308 @@
+"""
+Year-sharded holiday dataset for the Israel School Holidays integration.
+
+The bundled holiday data is stored as one JSON Lines shard per academic year
+(September to August) in the ``data`` directory. The first line of every
+shard is a header carrying the schema version, so shards written for another
+schema are skipped after reading a single line. Shards are only read when a
+query reaches their academic year, and all file access runs in the executor.
+
+Every shard is compiled into validated holiday records (see holiday_index.py)
+once, when it is loaded, so invalid rows are reported a single time.
+
+Rows from a remote source (see remote.py) can be laid over the shards; they
+replace the bundled data of every academic year they cover. Academic years
+with neither are generated from the Hebrew calendar (see hebrew_calendar.py).
+
+Only the academic years within SUPPORTED_YEARS_BEFORE/AFTER of the current
+one are loaded or generated; generated years that fall out of that window
+are dropped, so the compiled index and calendars stay bounded.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import logging
+import re
+from datetime import date
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, NamedTuple, Optional, Set, Tuple
+
+import voluptuous as vol
+
+from homeassistant.core import HomeAssistant
+from homeassistant.util import dt as dt_util
+
+from .const import SUPPORTED_YEARS_BEFORE, SUPPORTED_YEARS_AFTER
+from .hebrew_calendar import generate_academic_year
+from .holiday_index import HolidayRecord, RejectedRow, compile_rows
+
+_LOGGER = logging.getLogger(__name__)
+
+DATASET_SCHEMA_VERSION = 1
+DATA_DIRECTORY = Path(__file__).parent / "data"
+
+_SHARD_PATTERN = re.compile(r"^holidays-(\d{4})\.jsonl$")
+
+# The Israeli academic year starts in September
+_ACADEMIC_YEAR_FIRST_MONTH = 9
+
+
+def academic_year(day: date) -> int:
+    """
+    Return the academic year a date belongs to.
+
+    The academic year is identified by the calendar year it starts in, so
+    2026-03-01 belongs to academic year 2025 (September 2025 - August 2026).
+    """
+    return day.year if day.month >= _ACADEMIC_YEAR_FIRST_MONTH else day.year - 1
+
+
+def supported_years(today: date) -> range:
+    """Return the academic years that can be loaded or generated on a date."""
+    current = academic_year(today)
+    return range(current - SUPPORTED_YEARS_BEFORE, current + SUPPORTED_YEARS_AFTER + 1)
+
+
+class UnsupportedDates(vol.Invalid):
+    """Dates outside the academic years the dataset supports."""
+
+
+def check_supported_range(start: date, end: date) -> None:
+    """
+    Check that a date range lies within the supported academic years.
+
+    Raises:
+        UnsupportedDates: If the range reaches outside supported_years
+    """
+    years = supported_years(dt_util.now().date())
+    if academic_year(start) not in years or academic_year(end) not in years:
+        raise UnsupportedDates(
+            f"dates must be between {date(years[0], 9, 1)} and {date(years[-1] + 1, 8, 31)}"
+        )
+
+
+class CompiledYear(NamedTuple):
+    """The raw rows of one academic year and the records compiled from them."""
+
+    rows: List[Dict[str, Any]]
+    records: List[HolidayRecord]
+    rejected: List[RejectedRow]
+
+
+def _compile_year(rows: List[Dict[str, Any]], source: str) -> CompiledYear:
+    """Compile the rows of one academic year."""
+    records, rejected = compile_rows(rows, source)
+    return CompiledYear(rows, records, rejected)
+
+
+def _read_shard(path: Path) -> Optional[CompiledYear]:
+    """
+    Read and compile one shard file.
+
+    Returns:
+        The compiled shard, or None if the shard cannot be used
+    """
+    try:
+        with path.open(encoding="utf-8") as shard:
+            header = json.loads(shard.readline())
+            if header.get("schema") != DATASET_SCHEMA_VERSION:
+                _LOGGER.warning(
+                    "Skipping holiday shard %s with unsupported schema %s",
+                    path.name,
+                    header.get("schema"),
+                )
+                return None
+            rows = [json.loads(line) for line in shard if line.strip()]
+    except (OSError, ValueError, AttributeError) as err:
+        _LOGGER.warning("Skipping unreadable holiday shard %s: %s", path.name, err)
+        return None
+    return _compile_year(rows, f"holiday shard {path.name}")
+
+
+def _generate_year(year: int) -> CompiledYear:
+    """Generate and compile the rows of a year without explicit data."""
+    return _compile_year(list(generate_academic_year(year)), f"generated academic year {year}")
+
+
+class HolidayDataset:
+    """Lazily loaded holiday rows, one shard per academic year."""
+
+    def __init__(self, hass: HomeAssistant, directory: Path = DATA_DIRECTORY) -> None:
+        """
+        Initialize the dataset without reading any file.
+
+        Args:
+            hass: Home Assistant instance, used for executor jobs
+            directory: Directory holding the shard files
+        """
+        self._hass = hass
+        self._directory = directory
+        self._available: Optional[Dict[int, Path]] = None
+        self._shards: Dict[int, CompiledYear] = {}
+        self._unusable: Set[int] = set()
+        self._overlay: Dict[int, CompiledYear] = {}
+        self._overlay_rejected: List[RejectedRow] = []
+        self._generated: Dict[int, CompiledYear] = {}
+        self._lock = asyncio.Lock()
+
+    @property
+    def loaded_years(self) -> List[int]:
+        """Return the academic years currently loaded."""
+        return sorted(self._shards.keys() | self._overlay.keys() | self._generated.keys())
+
+    @property
+    def generated_years(self) -> List[int]:
+        """Return the academic years whose rows are generated, not explicit."""
+        return sorted(self._generated.keys() - self._shards.keys() - self._overlay.keys())
+
+    def _year(self, year: int) -> CompiledYear:
+        """
+        Return the data used for a loaded academic year.
+
+        Explicit rows (remote, then bundled) replace the generated rows of
+        their academic year.
+        """
+        return self._overlay.get(year) or self._shards.get(year) or self._generated[year]
+
+    def rows(self) -> List[Dict[str, Any]]:
+        """Return the loaded raw holiday rows ordered by academic year."""
+        return [row for year in self.loaded_years for row in self._year(year).rows]
+
+    def records(self) -> List[HolidayRecord]:
+        """Return the compiled holiday records ordered by academic year."""
+        return [record for year in self.loaded_years for record in self._year(year).records]
+
+    @property
+    def rejected(self) -> List[RejectedRow]:
+        """Return the rows rejected while compiling the loaded data."""
+        return [
+            *self._overlay_rejected,
+            *(entry for compiled in self._shards.values() for entry in compiled.rejected),
+        ]
+
+    def _drop_generated(self, window: range) -> bool:
+        """
+        Drop the generated years outside the supported window.
+
+        Returns:
+            True if any year was dropped
+        """
+        dropped = [year for year in self._generated if year not in window]
+        for year in dropped:
+            del self._generated[year]
+            self._unusable.discard(year)
+            _LOGGER.debug("Dropped generated holiday rows for academic year %d", year)
+        return bool(dropped)
+
+    @property
+    def has_overlay(self) -> bool:
+        """Return True if remote rows are laid over the shards."""
+        return bool(self._overlay)
+
+    def set_overlay(self, rows: Iterable[Dict[str, Any]]) -> None:
+        """
+        Replace the remote rows laid over the bundled shards.
+
+        The rows are compiled once and grouped by the academic year of their
+        start date.
+        """
+        rows = list(rows)
+        if not rows:
+            self._overlay, self._overlay_rejected = {}, []
+            return
+
+        records, self._overlay_rejected = compile_rows(rows, "the remote holiday dataset")
+        by_year: Dict[int, List[HolidayRecord]] = {}
+        for record in records:
+            by_year.setdefault(academic_year(record.start), []).append(record)
+        raw_by_year: Dict[int, List[Dict[str, Any]]] = {}
+        for row in rows:
+            try:
+                year = academic_year(date.fromisoformat(str(row["START"])))
+            except (KeyError, TypeError, ValueError):
+                continue
+            raw_by_year.setdefault(year, []).append(row)
+        self._overlay = {
+            year: CompiledYear(raw_by_year.get(year, []), year_records, [])
+            for year, year_records in by_year.items()
+        }
+
+    async def async_ensure_years(self, years: Iterable[int]) -> bool:
+        """
+        Load the shards of the given academic years if not loaded yet.
+
+        Years without a usable shard fall back to generated rows. Years
+        outside the supported window (see supported_years) are skipped.
+
+        Args:
+            years: Academic years that queries are about to reach
+
+        Returns:
+            True if rows were loaded, generated or dropped
+        """
+        async with self._lock:
+            window = supported_years(dt_util.now().date())
+            changed = self._drop_generated(window)
+            wanted = {
+                year for year in years
+                if year in window
+                and year not in self._shards
+                and year not in self._overlay
+                and year not in self._unusable
+            }
+            if not wanted:
+                return changed
+
+            available, shards, generated = await self._hass.async_add_executor_job(
+                self._load_years, wanted
+            )
+            self._available = available
+            for year, compiled in shards.items():
+                self._shards[year] = compiled
+                _LOGGER.debug(
+                    "Loaded %d holiday records for academic year %d",
+                    len(compiled.records),
+                    year,
+                )
+            for year, compiled in generated.items():
+                self._unusable.add(year)
+                self._generated[year] = compiled
+                _LOGGER.debug("Generated holiday rows for academic year %d", year)
+            return True
+
+    async def async_ensure_range(self, start: date, end: date) -> bool:
+        """Load every shard overlapping a date range."""
+        return await self.async_ensure_years(
+            range(academic_year(start), academic_year(end) + 1)
+        )
+
+    def _load_years(
+        self, years: Set[int]
+    ) -> Tuple[Dict[int, Path], Dict[int, CompiledYear], Dict[int, CompiledYear]]:
+        """
+        Read and compile the requested years, generating those without a usable shard.
+
+        Runs in the executor; the shard files are discovered on the first call.
+
+        Returns:
+            The available shard files, the compiled shards and the generated years
+        """
+        available = self._available
+        if available is None:
+            available = {}
+            if self._directory.is_dir():
+                for path in self._directory.iterdir():
+                    match = _SHARD_PATTERN.match(path.name)
+                    if match:
+                        available[int(match.group(1))] = path
+
+        shards, generated = {}, {}
+        for year in years:
+            compiled = _read_shard(available[year]) if year in available else None
+            if compiled is None:
+                generated[year] = _generate_year(year)
+            else:
+                shards[year] = compiled
+        return available, shards, generated
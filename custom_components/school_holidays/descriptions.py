@@ -0,0 +1,58 @@
+"""
+Precomputed entity descriptions for the Israel School Holidays integration.
+
+Entity names and device information only depend on the config entry and the
+selected language. They are built once per language when the entry is set
+up, and the entities read them from the coordinator instead of rebuilding
+them on every property access.
+"""
+
+from dataclasses import dataclass
+from types import MappingProxyType
+from typing import Dict, Mapping
+
+from homeassistant.helpers.entity import DeviceInfo
+
+from .const import DOMAIN, ENTITY_NAMES, LANGUAGE_OPTIONS, VERSION
+
+
+@dataclass(frozen=True, slots=True)
+class SchoolHolidaysDescriptions:
+    """Entity names and device information for one language."""
+
+    language: str
+    names: Mapping[str, str]
+    device_info: DeviceInfo
+
+    @property
+    def device_name(self) -> str:
+        """Return the localized device name."""
+        return self.names["device_name"]
+
+
+def build_descriptions(entry_id: str) -> Dict[str, SchoolHolidaysDescriptions]:
+    """
+    Build the descriptions of a config entry for every supported language.
+
+    Args:
+        entry_id: ID of the config entry the device belongs to
+
+    Returns:
+        Mapping of language code to its descriptions
+    """
+    descriptions = {}
+    for language in LANGUAGE_OPTIONS:
+        names = MappingProxyType(dict(ENTITY_NAMES.get(language, ENTITY_NAMES["he"])))
+        descriptions[language] = SchoolHolidaysDescriptions(
+            language=language,
+            names=names,
+            device_info=DeviceInfo(
+                identifiers={(DOMAIN, entry_id)},
+                name=names["device_name"],
+                manufacturer="Yuval Mejahez",
+                model="School Calendar Tracker",
+                sw_version=VERSION,
+                configuration_url="https://github.com/rt400/School-Vacation",
+            ),
+        )
+    return descriptions
@@ -0,0 +1,67 @@
+"""
+Diagnostics support for the Israel School Holidays integration.
+
+The full holiday dataset is not carried in the coordinator payload. It is
+serialized here only when a user downloads the config entry diagnostics.
+"""
+
+from typing import Any, Dict
+
+from homeassistant.components.diagnostics import async_redact_data
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import HomeAssistant
+
+from .const import DOMAIN, CONF_ICS_TOKEN
+from .coordinator import SchoolHolidaysCoordinator
+
+# The feed token grants access to the entry's iCalendar feeds
+TO_REDACT = {CONF_ICS_TOKEN}
+
+
+async def async_get_config_entry_diagnostics(
+    hass: HomeAssistant, entry: ConfigEntry
+) -> Dict[str, Any]:
+    """
+    Return diagnostics for a config entry.
+
+    Args:
+        hass: Home Assistant core instance.
+        entry: Configuration entry to describe.
+
+    Returns:
+        Dictionary with the entry settings, current status and dataset.
+    """
+    coordinator: SchoolHolidaysCoordinator = hass.data[DOMAIN][entry.entry_id]
+    calendar = coordinator.calendar
+
+    return {
+        "entry": {
+            "data": async_redact_data(dict(entry.data), TO_REDACT),
+            "options": dict(entry.options),
+        },
+        "status": coordinator.data,
+        "last_update_success": coordinator.last_update_success,
+        "last_exception": (
+            repr(coordinator.last_exception) if coordinator.last_exception else None
+        ),
+        "engine": {
+            "data_url": coordinator.engine.data_url,
+            "entries": len(coordinator.engine.views),
+            "version": coordinator.engine.version,
+            "metrics": coordinator.engine.metrics.as_dict(),
+        },
+        "metrics": coordinator.metrics.as_dict(),
+        "compiled": {
+            "loaded_years": coordinator.loaded_years,
+            "generated_years": coordinator.generated_years,
+            "segments": len(coordinator.holiday_index),
+            "days": len(calendar),
+            "first_day": calendar.first_day.isoformat() if calendar.first_day else None,
+            "last_day": calendar.last_day.isoformat() if calendar.last_day else None,
+            "rejected_rows": [
+                {"row": entry.row, "reason": entry.reason}
+                for entry in coordinator.rejected_rows
+            ],
+        },
+        "raw_data": coordinator.school_data,
+    }
@@ -0,0 +1,318 @@
+"""
+Shared calendar engine for the Israel School Holidays integration.
+
+The holiday dataset, its compiled index and calendars, the remote dataset
+revalidation and the midnight timer do not depend on any entry option other
+than the dataset URL. They are owned by one reference-counted engine per
+dataset URL, stored in hass.data[DOMAIN]. The per-entry coordinators are thin
+views on the engine that apply their own options (school levels, Friday rule,
+language), so adding config entries adds neither memory nor timers.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+from datetime import date, datetime, timedelta
+from typing import TYPE_CHECKING, Any, Dict, Iterable, List, Optional
+
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+from homeassistant.helpers.event import (
+    async_track_point_in_time,
+    async_track_time_interval,
+)
+from homeassistant.util import dt as dt_util
+
+from .const import DOMAIN, DATA_ENGINES
+from .compiled_calendar import CompiledCalendar
+from .dataset import HolidayDataset, academic_year
+from .holiday_index import HolidayIndex, RejectedRow
+from .metrics import EngineMetrics
+from .remote import RemoteDatasetSource
+
+if TYPE_CHECKING:
+    from .coordinator import SchoolHolidaysCoordinator
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class SchoolHolidaysEngine:
+    """Compiled holiday data and schedules shared by the coordinators."""
+
+    def __init__(self, hass: HomeAssistant, data_url: str) -> None:
+        """
+        Initialize the engine without loading any data.
+
+        Args:
+            hass: Home Assistant instance
+            data_url: URL of the remote dataset ("" for bundled data only)
+        """
+        self.hass = hass
+        self.data_url = data_url
+        self._views: List[SchoolHolidaysCoordinator] = []
+        self._setup_lock = asyncio.Lock()
+        self._setup_done = False
+
+        self._dataset = HolidayDataset(hass)
+        self._index: HolidayIndex = HolidayIndex([])
+        # Compiled calendars by Friday rule, built on first use
+        self._calendars: Dict[bool, CompiledCalendar] = {}
+        self._version = 0
+        self.metrics = EngineMetrics()
+
+        # Optional remote dataset, revalidated in the background
+        self._remote: Optional[RemoteDatasetSource] = None
+        self._revalidate_interval: Optional[int] = None
+        self._unsub_revalidate: Optional[CALLBACK_TYPE] = None
+
+        # One wake-up timer for every view, and the day each view waits for
+        self._unsub_wake: Optional[CALLBACK_TYPE] = None
+        self._wake_days: Dict[SchoolHolidaysCoordinator, date] = {}
+
+    @property
+    def version(self) -> int:
+        """Return a counter increased every time the data is recompiled."""
+        return self._version
+
+    @property
+    def views(self) -> List[SchoolHolidaysCoordinator]:
+        """Return the coordinators attached to the engine."""
+        return self._views
+
+    @property
+    def school_data(self) -> List[Dict[str, Any]]:
+        """Return the raw holiday rows loaded so far."""
+        return self._dataset.rows()
+
+    @property
+    def loaded_years(self) -> List[int]:
+        """Return the academic years loaded from the dataset."""
+        return self._dataset.loaded_years
+
+    @property
+    def generated_years(self) -> List[int]:
+        """Return the academic years generated from the Hebrew calendar."""
+        return self._dataset.generated_years
+
+    @property
+    def rejected_rows(self) -> List[RejectedRow]:
+        """Return the dataset rows rejected at load time."""
+        return self._dataset.rejected
+
+    @property
+    def holiday_index(self) -> HolidayIndex:
+        """Return the compiled holiday index."""
+        return self._index
+
+    def calendar_for(self, friday_high: bool) -> CompiledCalendar:
+        """Return the compiled calendar for a Friday rule, building it once."""
+        calendar = self._calendars.get(friday_high)
+        if calendar is None:
+            started = time.perf_counter()
+            calendar = self._calendars[friday_high] = CompiledCalendar(
+                self._index, friday_high
+            )
+            self.metrics.calendar_build_ms.add((time.perf_counter() - started) * 1000)
+        return calendar
+
+    async def async_setup(self) -> None:
+        """
+        Apply the cached remote dataset and load the current academic years.
+
+        Runs once, however many views query the engine concurrently, before
+        the first query is answered. The remote dataset is revalidated in the
+        background afterwards.
+        """
+        async with self._setup_lock:
+            if self._setup_done:
+                return
+            started = time.perf_counter()
+            if self.data_url:
+                self._remote = RemoteDatasetSource(self.hass, self.data_url)
+                self._dataset.set_overlay(await self._remote.async_load_cached() or ())
+            year = academic_year(dt_util.now().date())
+            await self._dataset.async_ensure_years((year, year + 1))
+            self._recompile(started)
+            self._setup_done = True
+
+        if self._remote is not None:
+            self.async_update_revalidation()
+            self.hass.async_create_background_task(
+                self.async_revalidate_dataset(), f"{DOMAIN} dataset revalidation"
+            )
+
+    @callback
+    def async_attach(self, view: SchoolHolidaysCoordinator) -> None:
+        """Attach a coordinator to the engine."""
+        self._views.append(view)
+        self.async_update_revalidation()
+
+    @callback
+    def async_detach(self, view: SchoolHolidaysCoordinator) -> bool:
+        """
+        Detach a coordinator from the engine.
+
+        Returns:
+            True if it was the last coordinator and the engine was shut down
+        """
+        self._views.remove(view)
+        self._wake_days.pop(view, None)
+        if self._views:
+            self.async_update_revalidation()
+            self.async_schedule()
+            return False
+
+        self._cancel_wake()
+        self._cancel_revalidate()
+        return True
+
+    async def async_ensure_range(self, start: date, end: date) -> None:
+        """
+        Make sure the dataset covers a date range before it is queried.
+
+        Loads any missing academic years and recompiles if needed.
+        """
+        if not self._setup_done:
+            await self.async_setup()
+        started = time.perf_counter()
+        if await self._dataset.async_ensure_range(start, end):
+            self._recompile(started)
+
+    async def async_ensure_years(self, years: Iterable[int]) -> None:
+        """Make sure the dataset covers the given academic years."""
+        if not self._setup_done:
+            await self.async_setup()
+        started = time.perf_counter()
+        if await self._dataset.async_ensure_years(years):
+            self._recompile(started)
+
+    @callback
+    def _recompile(self, started: float) -> None:
+        """
+        Rebuild the index and drop the calendars built from the old one.
+
+        Args:
+            started: time.perf_counter() value from before the dataset was
+                loaded, to measure loading and compiling together
+        """
+        self._index = HolidayIndex(self._dataset.records())
+        self._calendars.clear()
+        self._version += 1
+        self.metrics.compile_ms.add((time.perf_counter() - started) * 1000)
+
+    @callback
+    def async_update_revalidation(self) -> None:
+        """
+        Revalidate the remote dataset at the shortest interval of the views.
+
+        The timer is only re-armed when that interval changes.
+        """
+        if self._remote is None or not self._views:
+            return
+        interval = min(view.options.update_interval for view in self._views)
+        if interval == self._revalidate_interval and self._unsub_revalidate is not None:
+            return
+        self._cancel_revalidate()
+        self._revalidate_interval = interval
+        self._unsub_revalidate = async_track_time_interval(
+            self.hass, self.async_revalidate_dataset, timedelta(hours=interval)
+        )
+
+    async def async_revalidate_dataset(self, now: Optional[datetime] = None) -> None:
+        """
+        Check the remote dataset for changes and refresh every view if it changed.
+
+        Args:
+            now: Datetime passed by async_track_time_interval
+        """
+        if self._remote is None or not await self._remote.async_revalidate():
+            return
+        _LOGGER.info("Holiday dataset updated from %s", self._remote.url)
+        started = time.perf_counter()
+        self._dataset.set_overlay(self._remote.rows or ())
+        self._recompile(started)
+        await self._async_refresh_views(self._views)
+
+    @callback
+    def _cancel_revalidate(self) -> None:
+        """Cancel the periodic remote revalidation, if any."""
+        if self._unsub_revalidate is not None:
+            self._unsub_revalidate()
+            self._unsub_revalidate = None
+        self._revalidate_interval = None
+
+    @callback
+    def async_schedule(self) -> None:
+        """
+        Arm a single timer for the earliest midnight any view has to refresh at.
+
+        Every view reports the day it next changes (see next_refresh_day); the
+        timer is re-armed whenever a view refreshes.
+        """
+        today = dt_util.now().date()
+        self._wake_days = {view: view.next_refresh_day(today) for view in self._views}
+        self._cancel_wake()
+        if not self._wake_days:
+            return
+
+        next_day = min(self._wake_days.values())
+        self._unsub_wake = async_track_point_in_time(
+            self.hass, self._async_wake, dt_util.start_of_local_day(next_day)
+        )
+        _LOGGER.debug("Next school holiday status change scheduled for %s", next_day)
+
+    @callback
+    def _cancel_wake(self) -> None:
+        """Cancel the pending wake-up timer, if any."""
+        if self._unsub_wake is not None:
+            self._unsub_wake()
+            self._unsub_wake = None
+
+    async def _async_wake(self, now: datetime) -> None:
+        """
+        Refresh the views whose status changes today.
+
+        Args:
+            now: Scheduled datetime passed by async_track_point_in_time
+        """
+        self._unsub_wake = None
+        self.metrics.wake_drift_s.add((dt_util.utcnow() - now).total_seconds())
+        _LOGGER.info("Scheduled status change refresh triggered at %s", now.isoformat())
+        today = dt_util.as_local(now).date()
+        due = [view for view, day in self._wake_days.items() if day <= today]
+        await self._async_refresh_views(due)
+        self.async_schedule()
+
+    async def _async_refresh_views(self, views: List[SchoolHolidaysCoordinator]) -> None:
+        """Recalculate and refresh the given views."""
+        for view in views:
+            view.async_invalidate_status()
+        await asyncio.gather(*(view.async_refresh() for view in views))
+
+
+@callback
+def async_get_engine(hass: HomeAssistant, data_url: str) -> SchoolHolidaysEngine:
+    """
+    Return the shared engine of a dataset URL, creating it on first use.
+
+    The engine is not set up here: it loads its data when a view first
+    queries it (see async_ensure_years), so an entry restored from a status
+    snapshot does not wait for the dataset at startup.
+    """
+    engines: Dict[str, SchoolHolidaysEngine] = hass.data.setdefault(DOMAIN, {}).setdefault(
+        DATA_ENGINES, {}
+    )
+    engine = engines.get(data_url)
+    if engine is None:
+        engine = engines[data_url] = SchoolHolidaysEngine(hass, data_url)
+    return engine
+
+
+@callback
+def async_release_engine(
+    hass: HomeAssistant, engine: SchoolHolidaysEngine, view: SchoolHolidaysCoordinator
+) -> None:
+    """Detach a coordinator and drop the engine once no coordinator uses it."""
+    if engine.async_detach(view):
+        hass.data[DOMAIN][DATA_ENGINES].pop(engine.data_url, None)
@@ -0,0 +1,178 @@
+"""
+Hebrew calendar holiday generator for the Israel School Holidays integration.
+
+Derives the Israeli school holiday periods of any academic year from a pure
+Python Hebrew calendar computation (the arithmetic rules of the fixed Hebrew
+calendar, as described in Reingold & Dershowitz, "Calendrical Calculations").
+The generated rows use the same format as the dataset shards and are only
+used for academic years that have no explicit data.
+"""
+
+from __future__ import annotations
+
+from datetime import date, timedelta
+from functools import lru_cache
+from typing import Any, Dict, Tuple
+
+# Hebrew months, numbered from Nisan as in Calendrical Calculations
+NISAN = 1
+IYYAR = 2
+SIVAN = 3
+TAMMUZ = 4
+ELUL = 6
+TISHRI = 7
+MARHESHVAN = 8
+KISLEV = 9
+TEVET = 10
+ADAR = 12
+ADAR_II = 13
+
+# Ordinal (date.toordinal) of the day before 1 Tishrei, year 1
+_HEBREW_EPOCH = -1373427
+
+# Hebrew year of the Rosh Hashana that opens academic year 0
+_ACADEMIC_YEAR_OFFSET = 3761
+
+# Number of generated academic years kept in memory
+_CACHE_SIZE = 16
+
+SUMMARIES = {
+    "rosh_hashana": "ראש השנה",
+    "yom_kippur": "יום הכיפורים",
+    "between_yom_kippur_sukkot": "ימי חופשה בין יום הכיפורים לחג סוכות",
+    "sukkot": "חג סוכות",
+    "isru_chag_sukkot": "אסרו חג סוכות - יום חופש בחטיבות העליונות ובתיכונים",
+    "hanukkah": "חג החנוכה",
+    "purim": "חופשת חג פורים",
+    "pesach": "חופשת חג הפסח",
+    "independence_day": "יום העצמאות",
+    "lag_baomer": "ל\"ג בעומר - יום חופש בחטיבות העליונות ובתיכונים",
+    "shavuot": "חג השבועות",
+    "summer_high": "חופשת קיץ תיכון",
+    "summer": "חופשת קיץ",
+}
+
+
+def is_leap_year(year: int) -> bool:
+    """Return True if a Hebrew year has 13 months."""
+    return (7 * year + 1) % 19 < 7
+
+
+def _elapsed_days(year: int) -> int:
+    """Return the days from the epoch to the molad-based new year (with dehiyyot)."""
+    months_elapsed = (235 * year - 234) // 19
+    parts_elapsed = 12084 + 13753 * months_elapsed
+    days = 29 * months_elapsed + parts_elapsed // 25920
+    return days + 1 if (3 * (days + 1)) % 7 < 3 else days
+
+
+def _year_length_correction(year: int) -> int:
+    """Return the delay keeping year lengths within the allowed values."""
+    previous, current, following = (
+        _elapsed_days(year - 1),
+        _elapsed_days(year),
+        _elapsed_days(year + 1),
+    )
+    if following - current == 356:
+        return 2
+    if current - previous == 382:
+        return 1
+    return 0
+
+
+@lru_cache(maxsize=_CACHE_SIZE * 2)
+def new_year(year: int) -> int:
+    """Return the ordinal of 1 Tishrei of a Hebrew year."""
+    return _HEBREW_EPOCH + _elapsed_days(year) + _year_length_correction(year)
+
+
+def _days_in_month(year: int, month: int) -> int:
+    """Return the length of a Hebrew month."""
+    if month in (IYYAR, TAMMUZ, ELUL, TEVET, ADAR_II):
+        return 29
+    if month == ADAR and not is_leap_year(year):
+        return 29
+    year_length = new_year(year + 1) - new_year(year)
+    if month == MARHESHVAN and year_length % 10 != 5:
+        return 29
+    if month == KISLEV and year_length % 10 == 3:
+        return 29
+    return 30
+
+
+def to_gregorian(year: int, month: int, day: int) -> date:
+    """
+    Convert a Hebrew date to a Gregorian date.
+
+    Args:
+        year: Hebrew year (e.g. 5786)
+        month: Hebrew month number (NISAN = 1 ... ADAR_II = 13)
+        day: Day of the month
+    """
+    last_month = ADAR_II if is_leap_year(year) else ADAR
+    if month < TISHRI:
+        months = [*range(TISHRI, last_month + 1), *range(NISAN, month)]
+    else:
+        months = list(range(TISHRI, month))
+    offset = sum(_days_in_month(year, m) for m in months)
+    return date.fromordinal(new_year(year) + offset + day - 1)
+
+
+def _independence_day(year: int) -> date:
+    """Return Yom HaAtzmaut, moved away from Friday, Saturday and Monday."""
+    fifth_of_iyyar = to_gregorian(year, IYYAR, 5)
+    weekday = fifth_of_iyyar.isoweekday()
+    if weekday == 5:
+        return fifth_of_iyyar - timedelta(days=1)
+    if weekday == 6:
+        return fifth_of_iyyar - timedelta(days=2)
+    if weekday == 1:
+        return fifth_of_iyyar + timedelta(days=1)
+    return fifth_of_iyyar
+
+
+def _row(key: str, start: date, end: date, high_only: bool = False) -> Dict[str, Any]:
+    """Build a dataset row."""
+    row = {"START": start.isoformat(), "END": end.isoformat(), "SUMMARY": SUMMARIES[key]}
+    if high_only:
+        row["HIGH"] = "True"
+    return row
+
+
+@lru_cache(maxsize=_CACHE_SIZE)
+def generate_academic_year(academic_year: int) -> Tuple[Dict[str, Any], ...]:
+    """
+    Generate the school holiday rows of an academic year.
+
+    Args:
+        academic_year: Calendar year the academic year starts in (September)
+
+    Returns:
+        Holiday rows in dataset format, in precedence order
+    """
+    year = academic_year + _ACADEMIC_YEAR_OFFSET
+    purim_month = ADAR_II if is_leap_year(year) else ADAR
+    hanukkah = to_gregorian(year, KISLEV, 25)
+    pesach = to_gregorian(year, NISAN, 15)
+    independence_day = _independence_day(year)
+    summer_year = academic_year + 1
+
+    return (
+        _row("rosh_hashana", to_gregorian(year, TISHRI, 1) - timedelta(days=1),
+             to_gregorian(year, TISHRI, 2)),
+        _row("yom_kippur", to_gregorian(year, TISHRI, 9), to_gregorian(year, TISHRI, 10)),
+        _row("between_yom_kippur_sukkot", to_gregorian(year, TISHRI, 11),
+             to_gregorian(year, TISHRI, 13)),
+        _row("sukkot", to_gregorian(year, TISHRI, 14), to_gregorian(year, TISHRI, 22)),
+        _row("isru_chag_sukkot", to_gregorian(year, TISHRI, 23),
+             to_gregorian(year, TISHRI, 23), high_only=True),
+        _row("hanukkah", hanukkah + timedelta(days=1), hanukkah + timedelta(days=7)),
+        _row("purim", to_gregorian(year, purim_month, 14), to_gregorian(year, purim_month, 15)),
+        _row("pesach", pesach - timedelta(days=9), pesach + timedelta(days=6)),
+        _row("independence_day", independence_day, independence_day),
+        _row("lag_baomer", to_gregorian(year, IYYAR, 18), to_gregorian(year, IYYAR, 18),
+             high_only=True),
+        _row("shavuot", to_gregorian(year, SIVAN, 5), to_gregorian(year, SIVAN, 6)),
+        _row("summer_high", date(summer_year, 6, 20), date(summer_year, 6, 30), high_only=True),
+        _row("summer", date(summer_year, 7, 1), date(summer_year, 8, 31)),
+    )
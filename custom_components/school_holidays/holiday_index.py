@@ -0,0 +1,264 @@
+"""
+Holiday interval index for the Israel School Holidays integration.
+
+The raw holiday rows are compiled once, when their shard or source is loaded:
+every row is validated and normalized into a typed record (invalid rows are
+rejected and reported a single time), consecutive rows describing the same
+holiday are merged, and the records are resolved into non-overlapping
+segments by explicit priority. The segments are kept as parallel arrays of
+day ordinals, so looking up the holiday that covers a date is a single
+bisect, with no string parsing involved.
+"""
+
+from __future__ import annotations
+
+import heapq
+import logging
+from array import array
+from bisect import bisect_right
+from dataclasses import dataclass
+from datetime import date
+from typing import Any, Dict, Iterable, Iterator, List, NamedTuple, Optional, Tuple
+
+_LOGGER = logging.getLogger(__name__)
+
+DEFAULT_SUMMARY = "Holiday"
+
+_TRUE_STRINGS = frozenset({"true", "yes", "1"})
+_FALSE_STRINGS = frozenset({"false", "no", "0", ""})
+
+
+def _parse_flag(value: Any) -> bool:
+    """
+    Normalize a HIGH flag, which the dataset stores as the string "True".
+
+    Raises:
+        ValueError: If the value is not a recognizable boolean
+    """
+    if value is None or isinstance(value, bool):
+        return bool(value)
+    if isinstance(value, int) and value in (0, 1):
+        return bool(value)
+    if isinstance(value, str):
+        lowered = value.strip().lower()
+        if lowered in _TRUE_STRINGS:
+            return True
+        if lowered in _FALSE_STRINGS:
+            return False
+    raise ValueError(f"invalid HIGH flag {value!r}")
+
+
+def _parse_date(raw: Dict[str, Any], key: str) -> date:
+    """
+    Parse a mandatory ISO date field of a row.
+
+    Raises:
+        ValueError: If the field is missing or malformed
+    """
+    if key not in raw:
+        raise ValueError(f"missing {key}")
+    try:
+        return date.fromisoformat(str(raw[key]))
+    except ValueError:
+        raise ValueError(f"invalid {key} date {raw[key]!r}") from None
+
+
+@dataclass(frozen=True, slots=True)
+class HolidayRecord:
+    """A single holiday period with typed dates."""
+
+    start: date
+    end: date
+    summary: str
+    high_only: bool
+    priority: int = 0
+
+    @classmethod
+    def from_raw(cls, raw: Dict[str, Any]) -> HolidayRecord:
+        """
+        Validate and normalize a raw dataset row.
+
+        Args:
+            raw: Dictionary containing START, END, and optional SUMMARY/HIGH/PRIORITY
+
+        Raises:
+            ValueError: If the row is malformed
+        """
+        if not isinstance(raw, dict):
+            raise ValueError("row is not an object")
+        start = _parse_date(raw, "START")
+        end = _parse_date(raw, "END")
+        if end < start:
+            raise ValueError("END is before START")
+
+        summary = raw.get("SUMMARY", DEFAULT_SUMMARY)
+        if not isinstance(summary, str):
+            raise ValueError(f"invalid SUMMARY {summary!r}")
+        priority = raw.get("PRIORITY", 0)
+        if isinstance(priority, bool) or not isinstance(priority, int):
+            raise ValueError(f"invalid PRIORITY {priority!r}")
+
+        return cls(
+            start=start,
+            end=end,
+            summary=summary.strip() or DEFAULT_SUMMARY,
+            high_only=_parse_flag(raw.get("HIGH")),
+            priority=priority,
+        )
+
+
+class RejectedRow(NamedTuple):
+    """A dataset row that failed validation."""
+
+    row: Any
+    reason: str
+
+
+def compile_rows(
+    rows: Iterable[Dict[str, Any]], source: str
+) -> Tuple[List[HolidayRecord], List[RejectedRow]]:
+    """
+    Validate, normalize and merge raw dataset rows.
+
+    A row describing the same holiday (same summary, level and priority) as
+    the record right before it, and overlapping or touching it, is merged
+    into that record. Only consecutive rows are merged, so that no row
+    moves ahead of the rows listed between them (first-match precedence).
+    Invalid rows are reported in a single log message per call.
+
+    Args:
+        rows: Raw dataset rows in dataset order
+        source: Description of the rows' origin, used in the report
+
+    Returns:
+        The records in dataset order and the rejected rows
+    """
+    records: List[HolidayRecord] = []
+    rejected: List[RejectedRow] = []
+
+    for row in rows:
+        try:
+            record = HolidayRecord.from_raw(row)
+        except ValueError as err:
+            rejected.append(RejectedRow(row, str(err)))
+            continue
+
+        previous = records[-1] if records else None
+        if (
+            previous is not None
+            and (previous.summary, previous.high_only, previous.priority)
+            == (record.summary, record.high_only, record.priority)
+            and record.start.toordinal() <= previous.end.toordinal() + 1
+            and previous.start.toordinal() <= record.end.toordinal() + 1
+        ):
+            records[-1] = HolidayRecord(
+                min(previous.start, record.start),
+                max(previous.end, record.end),
+                record.summary,
+                record.high_only,
+                record.priority,
+            )
+            continue
+        records.append(record)
+
+    if rejected:
+        _LOGGER.warning(
+            "Rejected %d invalid holiday rows from %s: %s",
+            len(rejected),
+            source,
+            "; ".join(f"{entry.reason} ({entry.row!r})" for entry in rejected),
+        )
+    return records, rejected
+
+
+class HolidayIndex:
+    """
+    Sorted interval index over holiday records.
+
+    Overlapping records are resolved at build time. Every day is owned by the
+    covering record with the highest explicit priority; ties go to the first
+    record in dataset order, as with the original first-match lookup.
+    """
+
+    def __init__(self, records: Iterable[HolidayRecord]) -> None:
+        """
+        Compile the records into sorted, non-overlapping segments.
+
+        Args:
+            records: Validated holiday records in dataset order
+        """
+        self._records: List[HolidayRecord] = list(records)
+        self._starts = array("l")
+        self._ends = array("l")
+        self._owners: List[HolidayRecord] = []
+        self._build()
+
+    def _build(self) -> None:
+        """Sweep the record boundaries and keep the winning record per segment."""
+        records = self._records
+        boundaries = sorted(
+            {r.start.toordinal() for r in records}
+            | {r.end.toordinal() + 1 for r in records}
+        )
+        by_start: Dict[int, List[Tuple[int, int]]] = {}
+        for position, record in enumerate(records):
+            by_start.setdefault(record.start.toordinal(), []).append(
+                (-record.priority, position)
+            )
+
+        active: List[Tuple[int, int]] = []
+        for current, following in zip(boundaries, boundaries[1:]):
+            for rank in by_start.get(current, ()):
+                heapq.heappush(active, rank)
+            while active and records[active[0][1]].end.toordinal() < current:
+                heapq.heappop(active)
+            if not active:
+                continue
+
+            owner = records[active[0][1]]
+            if self._owners and self._owners[-1] is owner and self._ends[-1] + 1 == current:
+                self._ends[-1] = following - 1
+                continue
+            self._starts.append(current)
+            self._ends.append(following - 1)
+            self._owners.append(owner)
+
+    def __len__(self) -> int:
+        """Return the number of compiled segments."""
+        return len(self._starts)
+
+    @property
+    def records(self) -> List[HolidayRecord]:
+        """Return the source records in dataset order."""
+        return self._records
+
+    @property
+    def first_day(self) -> Optional[date]:
+        """Return the first day covered by any holiday."""
+        return date.fromordinal(self._starts[0]) if self._starts else None
+
+    @property
+    def last_day(self) -> Optional[date]:
+        """Return the last day covered by any holiday."""
+        return date.fromordinal(self._ends[-1]) if self._ends else None
+
+    def segments(self) -> Iterator[Tuple[date, date, HolidayRecord]]:
+        """Yield (first day, last day, record) for every compiled segment."""
+        for start, end, owner in zip(self._starts, self._ends, self._owners):
+            yield date.fromordinal(start), date.fromordinal(end), owner
+
+    def lookup(self, check_date: date) -> Optional[HolidayRecord]:
+        """
+        Return the holiday record covering a date.
+
+        Args:
+            check_date: Date to look up
+
+        Returns:
+            The winning HolidayRecord, or None if the date is not a holiday
+        """
+        ordinal = check_date.toordinal()
+        position = bisect_right(self._starts, ordinal) - 1
+        if position >= 0 and ordinal <= self._ends[position]:
+            return self._owners[position]
+        return None
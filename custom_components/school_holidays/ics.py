@@ -0,0 +1,212 @@
+"""
+iCalendar feed for the Israel School Holidays integration.
+
+Serves the vacation timeline of a config entry as an .ics feed per school
+level and language, for phones and external calendars to subscribe to:
+
+    /api/school_holidays/ics/<token>/<level>/<language>.ics
+
+The token is a random per-entry secret, so subscribers need no Home
+Assistant credentials. It is compared in constant time and only shown in
+the entry's options form, never in entity states. A feed is rendered once
+per version of the entry's compiled calendar, in the executor, and cached;
+repeat polls carrying the ETag in If-None-Match are answered with 304 Not
+Modified.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import logging
+import secrets
+from datetime import date, datetime, timedelta, timezone
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from aiohttp import web
+
+from homeassistant.components.http import HomeAssistantView
+from homeassistant.core import HomeAssistant
+from homeassistant.util import dt as dt_util
+
+from .const import (
+    DOMAIN,
+    VERSION,
+    CONF_ICS_TOKEN,
+    ENTITY_NAMES,
+    LANGUAGE_OPTIONS,
+    LEVEL_ELEMENTARY,
+    LEVEL_HIGH,
+)
+from .compiled_calendar import VacationEvent
+from .coordinator import SchoolHolidaysCoordinator
+from .dataset import academic_year
+
+_LOGGER = logging.getLogger(__name__)
+
+ICS_URL = "/api/school_holidays/ics/{token}/{level}/{language}.ics"
+
+# Academic years served around the current one
+FEED_YEARS_BEFORE = 1
+FEED_YEARS_AFTER = 1
+
+_MAX_LINE_OCTETS = 75
+
+
+def ics_path(token: str, level: str, language: str) -> str:
+    """Return the feed path of an entry, school level and language."""
+    return ICS_URL.format(token=token, level=level, language=language)
+
+
+def _escape(text: str) -> str:
+    """Escape a TEXT value (RFC 5545, 3.3.11)."""
+    return (
+        text.replace("\\", "\\\\")
+        .replace(";", "\\;")
+        .replace(",", "\\,")
+        .replace("\n", "\\n")
+    )
+
+
+def _fold(line: str) -> str:
+    """Fold a content line at 75 octets without splitting UTF-8 characters."""
+    if len(line.encode("utf-8")) <= _MAX_LINE_OCTETS:
+        return line
+    parts: List[str] = []
+    current, size, limit = [], 0, _MAX_LINE_OCTETS
+    for char in line:
+        octets = len(char.encode("utf-8"))
+        if size + octets > limit:
+            parts.append("".join(current))
+            # Continuation lines start with a space, which counts
+            current, size, limit = [], 0, _MAX_LINE_OCTETS - 1
+        current.append(char)
+        size += octets
+    parts.append("".join(current))
+    return "\r\n ".join(parts)
+
+
+def _lines(
+    events: Iterable[VacationEvent], uid_prefix: str, name: str, language: str
+) -> Iterator[str]:
+    """Yield the content lines of a calendar, one event at a time."""
+    stamp = datetime.now(timezone.utc).strftime("%Y%m%dT%H%M%SZ")
+    yield "BEGIN:VCALENDAR"
+    yield "VERSION:2.0"
+    yield f"PRODID:-//Israel School Holidays//{VERSION}//{language.upper()}"
+    yield "CALSCALE:GREGORIAN"
+    yield "METHOD:PUBLISH"
+    yield f"X-WR-CALNAME:{_escape(name)}"
+    for event in events:
+        yield "BEGIN:VEVENT"
+        yield f"UID:{uid_prefix}-{event.start:%Y%m%d}@{DOMAIN}"
+        yield f"DTSTAMP:{stamp}"
+        yield f"DTSTART;VALUE=DATE:{event.start:%Y%m%d}"
+        yield f"DTEND;VALUE=DATE:{event.end + timedelta(days=1):%Y%m%d}"
+        yield f"SUMMARY:{_escape(event.summary)}"
+        yield "TRANSP:TRANSPARENT"
+        yield "END:VEVENT"
+    yield "END:VCALENDAR"
+
+
+def _etag_matches(etag: str, if_none_match: str) -> bool:
+    """
+    Return whether an If-None-Match header lists an ETag.
+
+    The header is a comma-separated list of (possibly weak) ETags, or "*".
+    """
+    for candidate in if_none_match.split(","):
+        candidate = candidate.strip()
+        if candidate.startswith("W/"):
+            candidate = candidate[2:]
+        if candidate in ("*", etag):
+            return True
+    return False
+
+
+def render_ics(
+    events: List[VacationEvent], uid_prefix: str, name: str, language: str
+) -> bytes:
+    """
+    Render vacation events as an iCalendar document (executor).
+
+    Args:
+        events: Sorted vacation events
+        uid_prefix: Prefix making event UIDs unique per entry and level
+        name: Calendar name
+        language: Language code of the feed
+
+    Returns:
+        The UTF-8 encoded document with CRLF line endings
+    """
+    return "".join(
+        f"{_fold(line)}\r\n" for line in _lines(events, uid_prefix, name, language)
+    ).encode("utf-8")
+
+
+class SchoolHolidaysIcsView(HomeAssistantView):
+    """Serve the cached iCalendar feeds of the config entries."""
+
+    url = ICS_URL
+    name = f"api:{DOMAIN}:ics"
+    requires_auth = False
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the view with an empty cache."""
+        self._hass = hass
+        # (entry id, level, language) -> (calendar version, ETag, body)
+        self._cache: Dict[Tuple[str, str, str], Tuple[Any, str, bytes]] = {}
+
+    def _coordinator(self, token: str) -> Optional[SchoolHolidaysCoordinator]:
+        """Return the coordinator whose entry owns a feed token."""
+        for value in self._hass.data.get(DOMAIN, {}).values():
+            if isinstance(value, SchoolHolidaysCoordinator) and secrets.compare_digest(
+                value.entry.data.get(CONF_ICS_TOKEN, "").encode(), token.encode()
+            ):
+                return value
+        return None
+
+    async def get(
+        self, request: web.Request, token: str, level: str, language: str
+    ) -> web.Response:
+        """Return the feed, or 304 if the subscriber's copy is current."""
+        coordinator = self._coordinator(token)
+        if (
+            coordinator is None
+            or level not in (LEVEL_ELEMENTARY, LEVEL_HIGH)
+            or language not in LANGUAGE_OPTIONS
+        ):
+            return web.Response(status=404)
+
+        year = academic_year(dt_util.now().date())
+        start = date(year - FEED_YEARS_BEFORE, 9, 1)
+        end = date(year + FEED_YEARS_AFTER + 1, 8, 31)
+        await coordinator.async_ensure_range(start, end)
+
+        entry_id = coordinator.entry.entry_id
+        key = (entry_id, level, language)
+        version = coordinator.calendar_version
+        cached = self._cache.get(key)
+        if cached is None or cached[0] != version:
+            events = coordinator.calendar.timeline(level).between(start, end)
+            body = await self._hass.async_add_executor_job(
+                render_ics,
+                events,
+                f"{entry_id}-{level}",
+                ENTITY_NAMES[language][f"{level}_calendar"],
+                language,
+            )
+            etag = f'"{hashlib.sha1(body, usedforsecurity=False).hexdigest()[:20]}"'
+            # Drop the feeds of removed entries while at it
+            entries = self._hass.data.get(DOMAIN, {})
+            for stale in [key for key in self._cache if key[0] not in entries]:
+                del self._cache[stale]
+            cached = self._cache[key] = (version, etag, body)
+            _LOGGER.debug("Rendered the %s %s feed (%d events)", level, language, len(events))
+
+        _, etag, body = cached
+        headers = {"ETag": etag, "Cache-Control": "private, max-age=3600"}
+        if _etag_matches(etag, request.headers.get("If-None-Match", "")):
+            return web.Response(status=304, headers=headers)
+        return web.Response(
+            body=body, content_type="text/calendar", charset="utf-8", headers=headers
+        )
@@ -0,0 +1,147 @@
+"""
+Long-term statistics import for the Israel School Holidays integration.
+
+The recorder only keeps the live entity states, so vacation history exists
+only for the days Home Assistant was running, and is purged after the
+retention window. This module writes daily vacation and school day counts of
+whole academic years (past or future) as external long-term statistics,
+computed from the entry's compiled per-day calendar: one pass over the
+calendar and one batched recorder call per academic year and statistic.
+
+Each statistic has one point per day at local midnight. The state is the
+day's count (0 or 1) and the sum is the running total. The running total
+continues from the day before the first imported year, so importing years
+in chronological order keeps the sums continuous.
+"""
+
+from __future__ import annotations
+
+import logging
+from datetime import date, datetime, timedelta
+from typing import Any, Dict, Iterable, List, Tuple
+
+from homeassistant.components.recorder import get_instance
+from homeassistant.components.recorder.models import StatisticData, StatisticMetaData
+from homeassistant.components.recorder.statistics import (
+    async_add_external_statistics,
+    statistics_during_period,
+)
+from homeassistant.const import UnitOfTime
+from homeassistant.core import HomeAssistant
+from homeassistant.util import dt as dt_util
+
+from .const import DOMAIN
+from .compiled_calendar import is_vacation
+from .coordinator import SchoolHolidaysCoordinator
+
+_LOGGER = logging.getLogger(__name__)
+
+# Counters imported per enabled school level
+COUNTER_VACATION_DAYS = "vacation_days"
+COUNTER_SCHOOL_DAYS = "school_days"
+STATISTIC_COUNTERS = (COUNTER_VACATION_DAYS, COUNTER_SCHOOL_DAYS)
+
+
+def statistic_id(entry_id: str, level: str, counter: str) -> str:
+    """Return the external statistic ID of an entry's level counter."""
+    return f"{DOMAIN}:{entry_id.lower()}_{level}_{counter}"
+
+
+async def _async_last_sums(
+    hass: HomeAssistant, statistic_ids: Iterable[str], before: date
+) -> Dict[str, float]:
+    """
+    Return the running totals of the day before a date (0 if not imported).
+
+    Args:
+        hass: Home Assistant instance
+        statistic_ids: Statistics to look up
+        before: First day that is about to be imported
+    """
+    statistic_ids = set(statistic_ids)
+    rows = await get_instance(hass).async_add_executor_job(
+        statistics_during_period,
+        hass,
+        dt_util.start_of_local_day(before - timedelta(days=1)),
+        dt_util.start_of_local_day(before),
+        statistic_ids,
+        "hour",
+        None,
+        {"sum"},
+    )
+    sums = {statistic: 0.0 for statistic in statistic_ids}
+    for statistic, points in rows.items():
+        if points and points[-1].get("sum") is not None:
+            sums[statistic] = points[-1]["sum"]
+    return sums
+
+
+async def async_import_statistics(
+    hass: HomeAssistant,
+    coordinator: SchoolHolidaysCoordinator,
+    first_year: int,
+    last_year: int,
+) -> Dict[str, Any]:
+    """
+    Import the daily counts of a range of academic years.
+
+    Args:
+        hass: Home Assistant instance
+        coordinator: Coordinator of the entry whose calendar is imported
+        first_year: First academic year (the year it starts in)
+        last_year: Last academic year (inclusive)
+
+    Returns:
+        The statistic IDs and the totals imported for every academic year
+    """
+    await coordinator.async_ensure_range(date(first_year, 9, 1), date(last_year + 1, 8, 31))
+    calendar = coordinator.calendar
+    names = coordinator.descriptions.names
+    entry_id = coordinator.entry.entry_id
+
+    statistics: Dict[Tuple[str, str], StatisticMetaData] = {
+        (level, counter): {
+            "source": DOMAIN,
+            "statistic_id": statistic_id(entry_id, level, counter),
+            "name": names[f"{level}_{counter}"],
+            "unit_of_measurement": UnitOfTime.DAYS,
+            "has_mean": False,
+            "has_sum": True,
+        }
+        for level in coordinator.enabled_levels
+        for counter in STATISTIC_COUNTERS
+    }
+    sums = await _async_last_sums(
+        hass,
+        (metadata["statistic_id"] for metadata in statistics.values()),
+        date(first_year, 9, 1),
+    )
+
+    years: Dict[str, Dict[str, int]] = {}
+    for year in range(first_year, last_year + 1):
+        start = date(year, 9, 1)
+        statuses = calendar.evaluate_range(start, date(year + 1, 8, 31))
+        midnights: List[datetime] = [
+            dt_util.start_of_local_day(start + timedelta(days=offset))
+            for offset in range(len(statuses))
+        ]
+        totals = years[str(year)] = {}
+        for (level, counter), metadata in statistics.items():
+            wanted = counter == COUNTER_VACATION_DAYS
+            running = sums[metadata["statistic_id"]]
+            points: List[StatisticData] = []
+            for midnight, status in zip(midnights, statuses):
+                value = 1.0 if is_vacation(status, level) == wanted else 0.0
+                running += value
+                points.append({"start": midnight, "state": value, "sum": running})
+            totals[f"{level}_{counter}"] = int(running - sums[metadata["statistic_id"]])
+            sums[metadata["statistic_id"]] = running
+            async_add_external_statistics(hass, metadata, points)
+
+    _LOGGER.info(
+        "Imported school holiday statistics for academic years %d-%d", first_year, last_year
+    )
+    return {
+        "statistic_ids": [metadata["statistic_id"] for metadata in statistics.values()],
+        "academic_years": years,
+    }
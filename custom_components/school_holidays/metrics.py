@@ -0,0 +1,97 @@
+"""
+Runtime instrumentation for the Israel School Holidays integration.
+
+Counters and timings kept in memory while the integration runs: how long
+refreshes and dataset compilations take, how many day statuses an entry
+evaluates, how late the midnight wake-up timer fires, and which errors
+refreshes failed with. They are exposed by the diagnostic sensors (disabled
+by default) and the config entry diagnostics, so hot-path cost and failures
+can be inspected without debug logging.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from typing import Any, Dict, Optional
+
+
+@dataclass(slots=True)
+class TimingStat:
+    """Count, last, mean and maximum of a repeated measurement."""
+
+    count: int = 0
+    last: Optional[float] = None
+    total: float = 0.0
+    maximum: float = 0.0
+
+    def add(self, value: float) -> None:
+        """Record one measurement."""
+        self.count += 1
+        self.last = value
+        self.total += value
+        self.maximum = max(self.maximum, value)
+
+    @property
+    def mean(self) -> Optional[float]:
+        """Return the mean of the measurements, or None before the first."""
+        return self.total / self.count if self.count else None
+
+    def as_dict(self) -> Dict[str, Any]:
+        """Return the rounded statistics."""
+        return {
+            "count": self.count,
+            "last": None if self.last is None else round(self.last, 3),
+            "mean": None if self.mean is None else round(self.mean, 3),
+            "max": round(self.maximum, 3),
+        }
+
+
+@dataclass(slots=True)
+class EngineMetrics:
+    """Measurements of the shared engine (see engine.py)."""
+
+    # Loading and compiling the dataset into the holiday index, in ms
+    compile_ms: TimingStat = field(default_factory=TimingStat)
+    # Building a per-day calendar from the index, in ms
+    calendar_build_ms: TimingStat = field(default_factory=TimingStat)
+    # How late the wake-up timer fired after its scheduled time, in seconds
+    wake_drift_s: TimingStat = field(default_factory=TimingStat)
+
+    def as_dict(self) -> Dict[str, Any]:
+        """Return the measurements for diagnostics."""
+        return {
+            "compile_ms": self.compile_ms.as_dict(),
+            "calendar_build_ms": self.calendar_build_ms.as_dict(),
+            "wake_drift_s": self.wake_drift_s.as_dict(),
+        }
+
+
+@dataclass(slots=True)
+class RefreshMetrics:
+    """Measurements of one coordinator (config entry)."""
+
+    refresh_ms: TimingStat = field(default_factory=TimingStat)
+    # Day statuses evaluated for refreshes and service calls
+    lookups: int = 0
+    errors: Dict[str, int] = field(default_factory=dict)
+    last_error: Optional[str] = None
+
+    @property
+    def error_count(self) -> int:
+        """Return the number of failed refreshes."""
+        return sum(self.errors.values())
+
+    def add_error(self, err: BaseException) -> None:
+        """Count a failed refresh by exception type."""
+        name = type(err).__name__
+        self.errors[name] = self.errors.get(name, 0) + 1
+        self.last_error = f"{name}: {err}"
+
+    def as_dict(self) -> Dict[str, Any]:
+        """Return the measurements for diagnostics."""
+        return {
+            "refresh_ms": self.refresh_ms.as_dict(),
+            "lookups": self.lookups,
+            "errors": dict(self.errors),
+            "last_error": self.last_error,
+        }
@@ -0,0 +1,163 @@
+"""
+Override layers for the Israel School Holidays integration.
+
+Overrides are local exceptions entered by the user on top of the dataset:
+extra vacation days, make-up school days and strike days. They are stored in
+the config entry options and applied by the entry's compiled calendar after
+the holiday and weekday rules; a change only recompiles the days it touches
+(see CompiledCalendar.update_overrides).
+
+Overrides must lie within the academic years the dataset supports. New
+overrides outside them are rejected; stored ones that have aged out of the
+window are skipped when the entry's options are resolved.
+"""
+
+from __future__ import annotations
+
+import logging
+from datetime import date
+from typing import TYPE_CHECKING, Any, Dict, Iterable, List, NamedTuple, Optional, Tuple
+
+import voluptuous as vol
+
+from homeassistant.helpers import config_validation as cv
+
+from .const import (
+    HEBREW_TEXTS,
+    LEVEL_ELEMENTARY,
+    LEVEL_HIGH,
+    OVERRIDE_VACATION,
+    OVERRIDE_SCHOOL_DAY,
+    OVERRIDE_STRIKE,
+    OVERRIDE_TYPES,
+    OVERRIDE_LEVEL_ALL,
+)
+from .dataset import UnsupportedDates, check_supported_range
+
+if TYPE_CHECKING:
+    from .compiled_calendar import DayStatus
+
+_LOGGER = logging.getLogger(__name__)
+
+DEFAULT_SUMMARIES = {
+    OVERRIDE_VACATION: HEBREW_TEXTS["extra_vacation"],
+    OVERRIDE_SCHOOL_DAY: HEBREW_TEXTS["makeup_day"],
+    OVERRIDE_STRIKE: HEBREW_TEXTS["strike"],
+}
+
+
+def coerce_date(value: Any) -> date:
+    """Accept dates, ISO dates and ISO timestamps (as sent by YAML editors)."""
+    if isinstance(value, date):
+        return value
+    try:
+        return date.fromisoformat(str(value)[:10])
+    except ValueError:
+        raise vol.Invalid(f"invalid date {value!r}") from None
+
+
+OVERRIDE_SCHEMA = vol.Schema({
+    vol.Required("start"): coerce_date,
+    vol.Optional("end"): coerce_date,
+    vol.Required("type"): vol.In(OVERRIDE_TYPES),
+    vol.Optional("level", default=OVERRIDE_LEVEL_ALL): vol.In(
+        (OVERRIDE_LEVEL_ALL, LEVEL_ELEMENTARY, LEVEL_HIGH)
+    ),
+    vol.Optional("summary"): cv.string,
+})
+
+OVERRIDES_SCHEMA = vol.All(cv.ensure_list, [OVERRIDE_SCHEMA])
+
+
+class Override(NamedTuple):
+    """A local exception to the calendar (end is inclusive)."""
+
+    start: date
+    end: date
+    kind: str
+    level: str
+    summary: str
+
+    def apply(self, status: DayStatus) -> DayStatus:
+        """Return a day's status with the override applied."""
+        vacation = self.kind != OVERRIDE_SCHOOL_DAY
+        return status._replace(
+            elementary_vacation=(
+                vacation if self.level != LEVEL_HIGH else status.elementary_vacation
+            ),
+            high_vacation=vacation if self.level != LEVEL_ELEMENTARY else status.high_vacation,
+            summary=self.summary,
+        )
+
+    def as_option(self) -> Dict[str, str]:
+        """Return the JSON-serializable option value of the override."""
+        return {
+            "start": self.start.isoformat(),
+            "end": self.end.isoformat(),
+            "type": self.kind,
+            "level": self.level,
+            "summary": self.summary,
+        }
+
+
+def build_override(
+    start: date,
+    end: Optional[date],
+    kind: str,
+    level: str = OVERRIDE_LEVEL_ALL,
+    summary: Optional[str] = None,
+) -> Override:
+    """
+    Build an override, filling in the defaults.
+
+    Raises:
+        vol.Invalid: If the override ends before it starts
+        UnsupportedDates: If it reaches outside the supported academic years
+    """
+    end = end or start
+    if end < start:
+        raise vol.Invalid(f"override ending {end} starts after it ends")
+    check_supported_range(start, end)
+    return Override(start, end, kind, level, summary or DEFAULT_SUMMARIES[kind])
+
+
+def parse_overrides(raw: Any, skip_unsupported: bool = False) -> Tuple[Override, ...]:
+    """
+    Validate the overrides option and build the overrides.
+
+    Args:
+        raw: Option value (a list of overrides)
+        skip_unsupported: Skip overrides outside the supported academic
+            years instead of rejecting the option (for stored options)
+
+    Raises:
+        vol.Invalid: If the option is malformed
+    """
+    overrides = []
+    for item in OVERRIDES_SCHEMA(raw or []):
+        try:
+            overrides.append(
+                build_override(
+                    item["start"], item.get("end"), item["type"], item["level"],
+                    item.get("summary"),
+                )
+            )
+        except UnsupportedDates as err:
+            if not skip_unsupported:
+                raise
+            _LOGGER.debug("Skipping override starting %s: %s", item["start"], err)
+    return tuple(overrides)
+
+
+def overrides_to_option(overrides: Iterable[Override]) -> List[Dict[str, str]]:
+    """Return the JSON-serializable option value of a list of overrides."""
+    return [override.as_option() for override in overrides]
+
+
+def overrides_by_day(overrides: Iterable[Override]) -> Dict[int, Tuple[Override, ...]]:
+    """Return the overrides covering each day ordinal, in application order."""
+    by_day: Dict[int, Tuple[Override, ...]] = {}
+    for override in overrides:
+        for ordinal in range(override.start.toordinal(), override.end.toordinal() + 1):
+            by_day[ordinal] = by_day.get(ordinal, ()) + (override,)
+    return by_day
@@ -0,0 +1,293 @@
+"""
+School profiles for the Israel School Holidays integration.
+
+A profile models a school calendar that differs from the national one, such
+as a sector or a local council: it follows one school level of the entry's
+calendar, minus the holidays it removes, plus the days off it adds. All the
+profiles of an entry are compiled together into one array holding a bitmask
+per day (one bit per profile), so evaluating every profile for a date is a
+single array read and adding profiles does not add work to a refresh.
+
+Like overrides, profile changes must lie within the academic years the
+dataset supports; stored changes that have aged out of the window are
+skipped.
+"""
+
+from __future__ import annotations
+
+import logging
+from array import array
+from bisect import bisect_right
+from dataclasses import dataclass
+from datetime import date, timedelta
+from typing import Any, Dict, List, Mapping, Optional, Tuple
+
+import voluptuous as vol
+
+from homeassistant.helpers import config_validation as cv
+
+from .const import HEBREW_TEXTS, LEVEL_ELEMENTARY, LEVEL_HIGH
+from .compiled_calendar import CompiledCalendar, VacationEvent, evaluate_day
+from .dataset import UnsupportedDates, check_supported_range
+from .overrides import coerce_date
+
+_LOGGER = logging.getLogger(__name__)
+
+# One bit per profile in an array("L") item
+MAX_PROFILES = 32
+
+_WEEKDAY_RULE_PERIOD = 7
+
+CHANGE_SCHEMA = vol.Schema({
+    vol.Required("start"): coerce_date,
+    vol.Optional("end"): coerce_date,
+    vol.Optional("summary"): cv.string,
+})
+
+PROFILE_SCHEMA = vol.Schema({
+    vol.Optional("name"): cv.string,
+    vol.Optional("level", default=LEVEL_ELEMENTARY): vol.In((LEVEL_ELEMENTARY, LEVEL_HIGH)),
+    vol.Optional("add", default=list): [CHANGE_SCHEMA],
+    vol.Optional("remove", default=list): [CHANGE_SCHEMA],
+})
+
+PROFILES_SCHEMA = vol.All(
+    vol.Schema({cv.slug: PROFILE_SCHEMA}),
+    vol.Length(max=MAX_PROFILES),
+)
+
+
+@dataclass(frozen=True, slots=True)
+class Profile:
+    """A named school calendar derived from one level of the base calendar."""
+
+    key: str
+    name: str
+    level: str
+    additions: Tuple[VacationEvent, ...]
+    removals: Tuple[VacationEvent, ...]
+
+
+def _to_events(
+    changes: List[Dict[str, Any]], default_summary: str, skip_unsupported: bool
+) -> Tuple[VacationEvent, ...]:
+    """Convert validated profile changes to events (end defaults to start)."""
+    events = []
+    for change in changes:
+        start = change["start"]
+        end = change.get("end", start)
+        if end < start:
+            raise vol.Invalid(f"change ending {end} starts after it ends")
+        try:
+            check_supported_range(start, end)
+        except UnsupportedDates as err:
+            if not skip_unsupported:
+                raise
+            _LOGGER.debug("Skipping profile change starting %s: %s", start, err)
+            continue
+        events.append(VacationEvent(start, end, change.get("summary", default_summary)))
+    return tuple(events)
+
+
+def parse_profiles(raw: Mapping[str, Any], skip_unsupported: bool = False) -> Tuple[Profile, ...]:
+    """
+    Validate the profiles option and build the profiles.
+
+    Args:
+        raw: Option value (profiles by key)
+        skip_unsupported: Skip changes outside the supported academic years
+            instead of rejecting the option (for stored options)
+
+    Raises:
+        vol.Invalid: If the option is malformed
+    """
+    return tuple(
+        Profile(
+            key=key,
+            name=config.get("name", key),
+            level=config["level"],
+            additions=_to_events(config["add"], config.get("name", key), skip_unsupported),
+            removals=_to_events(
+                config["remove"], HEBREW_TEXTS["school_day"], skip_unsupported
+            ),
+        )
+        for key, config in PROFILES_SCHEMA(dict(raw or {})).items()
+    )
+
+
+def profiles_to_option(profiles: Tuple[Profile, ...]) -> Dict[str, Any]:
+    """Return the JSON-serializable option value describing the profiles."""
+    def changes(events: Tuple[VacationEvent, ...]) -> List[Dict[str, str]]:
+        return [
+            {
+                "start": event.start.isoformat(),
+                "end": event.end.isoformat(),
+                "summary": event.summary,
+            }
+            for event in events
+        ]
+
+    return {
+        profile.key: {
+            "name": profile.name,
+            "level": profile.level,
+            "add": changes(profile.additions),
+            "remove": changes(profile.removals),
+        }
+        for profile in profiles
+    }
+
+
+class ProfileTable:
+    """Per-day bitmask of the profiles that are on vacation."""
+
+    __slots__ = (
+        "calendar", "revision", "profiles", "_rule_masks", "_origin", "_masks", "_transitions"
+    )
+
+    def __init__(self, calendar: CompiledCalendar, profiles: Tuple[Profile, ...]) -> None:
+        """
+        Evaluate every profile for every day in one sweep.
+
+        Args:
+            calendar: Compiled calendar of the entry's Friday rule
+            profiles: Profiles of the entry, in bit order
+        """
+        self.calendar = calendar
+        self.revision = calendar.revision
+        self.profiles = profiles
+        self._origin = 0
+        self._masks = array("L")
+        self._transitions: List[int] = []
+
+        level_masks = {LEVEL_ELEMENTARY: 0, LEVEL_HIGH: 0}
+        for bit, profile in enumerate(profiles):
+            level_masks[profile.level] |= 1 << bit
+
+        def mask_of(status) -> int:
+            return (
+                (level_masks[LEVEL_ELEMENTARY] if status.elementary_vacation else 0)
+                | (level_masks[LEVEL_HIGH] if status.high_vacation else 0)
+            )
+
+        # Weekday rules alone, by date.weekday(), for removed holidays and
+        # days outside the table
+        monday = date(2024, 1, 1)
+        self._rule_masks = tuple(
+            mask_of(evaluate_day(monday + timedelta(days=offset), None, calendar.friday_high))
+            for offset in range(_WEEKDAY_RULE_PERIOD)
+        )
+
+        # Count the additions/removals of every profile starting or ending
+        # on each day; only these days change the active masks
+        changes: Dict[int, List[Tuple[int, int, int]]] = {}
+        first = last = None
+        for bit, profile in enumerate(profiles):
+            for kind, events in ((0, profile.removals), (1, profile.additions)):
+                for event in events:
+                    start, end = event.start.toordinal(), event.end.toordinal()
+                    changes.setdefault(start, []).append((bit, kind, 1))
+                    changes.setdefault(end + 1, []).append((bit, kind, -1))
+                    first = start if first is None else min(first, start)
+                    last = end if last is None else max(last, end)
+        if calendar.first_day is not None and calendar.last_day is not None:
+            table_first, table_last = calendar.first_day.toordinal(), calendar.last_day.toordinal()
+            first = table_first if first is None else min(first, table_first)
+            last = table_last if last is None else max(last, table_last)
+        if not profiles or first is None:
+            return
+
+        counts = [[0] * len(profiles), [0] * len(profiles)]
+        active = [0, 0]  # removal mask, addition mask
+        masks = []
+        statuses = calendar.evaluate_range(date.fromordinal(first), date.fromordinal(last))
+        for ordinal, status in enumerate(statuses, first):
+            for bit, kind, delta in changes.get(ordinal, ()):
+                counts[kind][bit] += delta
+                if counts[kind][bit]:
+                    active[kind] |= 1 << bit
+                else:
+                    active[kind] &= ~(1 << bit)
+            removed, added = active
+            masks.append(
+                (mask_of(status) & ~removed)
+                # Ordinal 1 is a Monday, so this is date.weekday()
+                | (self._rule_masks[(ordinal - 1) % _WEEKDAY_RULE_PERIOD] & removed)
+                | added
+            )
+
+        self._origin = first
+        self._masks = array("L", masks)
+        self._build_transitions()
+
+    def _build_transitions(self) -> None:
+        """Record every ordinal whose mask differs from the previous day."""
+        origin, end = self._origin, self._origin + len(self._masks)
+        transitions = self._transitions
+        if self.mask_for(date.fromordinal(origin - 1)) != self._masks[0]:
+            transitions.append(origin)
+        for offset in range(1, len(self._masks)):
+            if self._masks[offset] != self._masks[offset - 1]:
+                transitions.append(origin + offset)
+        if self.mask_for(date.fromordinal(end)) != self._masks[-1]:
+            transitions.append(end)
+
+    def mask_for(self, day: date) -> int:
+        """Return the bitmask of the profiles on vacation on a date."""
+        offset = day.toordinal() - self._origin
+        if 0 <= offset < len(self._masks):
+            return self._masks[offset]
+        return self._rule_masks[day.weekday()]
+
+    def summary_for(self, profile: Profile, day: date) -> str:
+        """Return the summary of a profile's day."""
+        for event in profile.additions:
+            if event.start <= day <= event.end:
+                return event.summary
+        for event in profile.removals:
+            if event.start <= day <= event.end:
+                return evaluate_day(day, None, self.calendar.friday_high).summary
+        return self.calendar.status_for(day).summary
+
+    def status_for(self, day: date) -> Dict[str, Dict[str, Any]]:
+        """
+        Return the vacation flag and summary of every profile on a date.
+
+        Args:
+            day: Date to evaluate
+
+        Returns:
+            Dictionary keyed by profile key with "vacation" and "summary"
+        """
+        mask = self.mask_for(day)
+        return {
+            profile.key: {
+                "vacation": bool(mask >> bit & 1),
+                "summary": self.summary_for(profile, day),
+            }
+            for bit, profile in enumerate(self.profiles)
+        }
+
+    def next_change(self, day: date) -> Optional[date]:
+        """
+        Return the first day after the given date on which any profile changes.
+
+        Args:
+            day: Date to search forward from
+        """
+        if not self.profiles:
+            return None
+        ordinal = day.toordinal()
+        if self._masks and self._origin - 1 <= ordinal < self._origin + len(self._masks):
+            position = bisect_right(self._transitions, ordinal)
+            if position < len(self._transitions):
+                return date.fromordinal(self._transitions[position])
+
+        current = self.mask_for(day)
+        probe = day
+        for _ in range(_WEEKDAY_RULE_PERIOD):
+            probe += timedelta(days=1)
+            if self.mask_for(probe) != current:
+                return probe
+        return None
+
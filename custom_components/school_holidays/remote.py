@@ -0,0 +1,130 @@
+"""
+Remote dataset source for the Israel School Holidays integration.
+
+Updated holiday data is fetched from a configurable URL using conditional
+requests (ETag / If-Modified-Since) over Home Assistant's shared aiohttp
+session. The last good response is kept in a Home Assistant Store, so
+startup reads the cached copy without any network access and the
+integration keeps working offline.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import logging
+from typing import Any, Dict, List, Optional
+
+import aiohttp
+
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.aiohttp_client import async_get_clientsession
+from homeassistant.helpers.storage import Store
+
+from .const import DOMAIN
+
+_LOGGER = logging.getLogger(__name__)
+
+STORAGE_VERSION = 1
+REQUEST_TIMEOUT = aiohttp.ClientTimeout(total=30)
+
+
+def _validate_rows(payload: Any) -> List[Dict[str, Any]]:
+    """
+    Check the shape of a downloaded dataset.
+
+    Raises:
+        ValueError: If the payload is not a list of holiday rows
+    """
+    if not isinstance(payload, list):
+        raise ValueError("dataset is not a list")
+    for row in payload:
+        if not isinstance(row, dict) or "START" not in row or "END" not in row:
+            raise ValueError(f"invalid holiday row: {row!r}")
+    return payload
+
+
+class RemoteDatasetSource:
+    """Holiday rows fetched from a URL and cached in a Store."""
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        url: str,
+        session: Optional[aiohttp.ClientSession] = None,
+    ) -> None:
+        """
+        Initialize the source.
+
+        Args:
+            hass: Home Assistant instance
+            url: URL of a JSON list of holiday rows (same format as data.json)
+            session: Session to fetch with (Home Assistant's shared session by
+                default); the benchmarks pass their own to reach a local server
+        """
+        self._hass = hass
+        self.url = url
+        self._session = session
+        # Only names the Store file, so a non-cryptographic digest is enough
+        url_hash = hashlib.sha1(url.encode(), usedforsecurity=False).hexdigest()[:12]
+        self._store: Store = Store(hass, STORAGE_VERSION, f"{DOMAIN}.remote_{url_hash}")
+        self._etag: Optional[str] = None
+        self._last_modified: Optional[str] = None
+        self.rows: Optional[List[Dict[str, Any]]] = None
+
+    async def async_load_cached(self) -> Optional[List[Dict[str, Any]]]:
+        """Load the cached copy from storage, without network access."""
+        cached = await self._store.async_load()
+        if not cached or cached.get("url") != self.url:
+            return None
+        try:
+            self.rows = _validate_rows(cached.get("rows"))
+        except ValueError as err:
+            _LOGGER.warning("Ignoring invalid cached holiday dataset: %s", err)
+            return None
+        self._etag = cached.get("etag")
+        self._last_modified = cached.get("last_modified")
+        return self.rows
+
+    async def async_revalidate(self) -> bool:
+        """
+        Fetch the dataset if it changed since the cached copy.
+
+        Returns:
+            True if new rows were downloaded and cached
+        """
+        headers = {}
+        if self.rows is not None:
+            if self._etag:
+                headers["If-None-Match"] = self._etag
+            if self._last_modified:
+                headers["If-Modified-Since"] = self._last_modified
+
+        session = self._session or async_get_clientsession(self._hass)
+        try:
+            async with session.get(self.url, headers=headers, timeout=REQUEST_TIMEOUT) as response:
+                if response.status == 304:
+                    _LOGGER.debug("Holiday dataset at %s not modified", self.url)
+                    return False
+                response.raise_for_status()
+                rows = _validate_rows(await response.json(content_type=None))
+                etag = response.headers.get("ETag")
+                last_modified = response.headers.get("Last-Modified")
+        except (aiohttp.ClientError, asyncio.TimeoutError) as err:
+            _LOGGER.warning("Unable to fetch holiday dataset from %s: %s", self.url, err)
+            return False
+        except ValueError as err:
+            _LOGGER.warning("Invalid holiday dataset from %s: %s", self.url, err)
+            return False
+
+        changed = rows != self.rows
+        self.rows = rows
+        self._etag = etag
+        self._last_modified = last_modified
+        await self._store.async_save({
+            "url": self.url,
+            "etag": etag,
+            "last_modified": last_modified,
+            "rows": rows,
+        })
+        return changed
@@ -2,13 +2,21 @@
 Sensor platform for Israel School Holidays integration.
 
 Creates a sensor entity that provides a summary of school holidays
-in Israel. Uses data from the SchoolHolidaysCoordinator.
+in Israel, and countdown sensors (school days until summer, vacation days
+left, days until the next vacation) for each enabled school level. Uses data
+from the SchoolHolidaysCoordinator. Diagnostic sensors (disabled by default)
+report the refresh and dataset metrics (see metrics.py).
 """
 
 import logging
-from typing import Optional
+from typing import Any, Callable, Dict, Optional, Tuple
 
-from homeassistant.components.sensor import SensorEntity
+from homeassistant.components.sensor import (
+    SensorDeviceClass,
+    SensorEntity,
+    SensorStateClass,
+)
+from homeassistant.const import EntityCategory, UnitOfTime
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
@@ -18,14 +26,41 @@ from homeassistant.helpers.entity import DeviceInfo
 from .const import (
     DOMAIN,
     SENSOR_TYPES,
-    ENTITY_NAMES,
-    VERSION,
+    COUNTDOWN_SENSOR_TYPES,
+    METRIC_SENSOR_TYPES,
+    LEVEL_ELEMENTARY,
+    LEVEL_HIGH,
 )
 from .coordinator import SchoolHolidaysCoordinator
+from .metrics import TimingStat
 
 _LOGGER = logging.getLogger(__name__)
 
 
+def _timing(stat: TimingStat) -> Tuple[Optional[float], Dict[str, Any]]:
+    """Return the last measurement as the value and the rest as attributes."""
+    stats = stat.as_dict()
+    return stats.pop("last"), stats
+
+
+# Value and attributes of each diagnostic sensor
+_METRIC_VALUES: Dict[
+    str, Callable[[SchoolHolidaysCoordinator], Tuple[Any, Dict[str, Any]]]
+] = {
+    "refresh_duration": lambda coordinator: _timing(coordinator.metrics.refresh_ms),
+    "compile_duration": lambda coordinator: _timing(coordinator.engine.metrics.compile_ms),
+    "wake_drift": lambda coordinator: _timing(coordinator.engine.metrics.wake_drift_s),
+    "status_lookups": lambda coordinator: (coordinator.metrics.lookups, {}),
+    "refresh_errors": lambda coordinator: (
+        coordinator.metrics.error_count,
+        {
+            "errors": dict(coordinator.metrics.errors),
+            "last_error": coordinator.metrics.last_error,
+        },
+    ),
+}
+
+
 async def async_setup_entry(
     hass: HomeAssistant,
     entry: ConfigEntry,
@@ -41,16 +76,30 @@ async def async_setup_entry(
     """
     coordinator: SchoolHolidaysCoordinator = hass.data[DOMAIN][entry.entry_id]
 
-    # Ensure coordinator has initial data before creating entities
-    await coordinator.async_config_entry_first_refresh()
-
     entities = [SchoolHolidaysSensor(coordinator, "summary", entry)]
+
+    enabled_levels = {
+        LEVEL_ELEMENTARY: coordinator.elementary_enabled,
+        LEVEL_HIGH: coordinator.high_enabled,
+    }
+    entities.extend(
+        SchoolHolidaysCountdownSensor(coordinator, sensor_type, entry)
+        for sensor_type, sensor_info in COUNTDOWN_SENSOR_TYPES.items()
+        if enabled_levels[sensor_info["level"]]
+    )
+    entities.extend(
+        SchoolHolidaysMetricSensor(coordinator, sensor_type, entry)
+        for sensor_type in METRIC_SENSOR_TYPES
+    )
     async_add_entities(entities)
 
 
 class SchoolHolidaysSensor(CoordinatorEntity, SensorEntity):
     """Representation of a school holidays summary sensor."""
 
+    # Volatile or derived attributes that should not create new recorder rows
+    _unrecorded_attributes = frozenset({"last_update", "language", "upcoming_transitions"})
+
     def __init__(
         self,
         coordinator: SchoolHolidaysCoordinator,
@@ -70,10 +119,7 @@ class SchoolHolidaysSensor(CoordinatorEntity, SensorEntity):
         self._entry = entry
         self._coordinator = coordinator
 
-        language = coordinator.language
-        entity_names = ENTITY_NAMES.get(language, ENTITY_NAMES["he"])
         self.entity_id = "sensor.school_summary"
-        self._attr_name = entity_names[sensor_type]
         self._attr_unique_id = f"{entry.entry_id}_{sensor_type}"
         self._attr_icon = SENSOR_TYPES[sensor_type]["icon"]
         self._attr_device_class = SENSOR_TYPES[sensor_type]["device_class"]
@@ -81,24 +127,12 @@ class SchoolHolidaysSensor(CoordinatorEntity, SensorEntity):
     @property
     def name(self) -> str:
         """Return the sensor name according to the selected language."""
-        language = self._coordinator.language
-        entity_names = ENTITY_NAMES.get(language, ENTITY_NAMES["he"])
-        return entity_names[self._sensor_type]
+        return self._coordinator.descriptions.names[self._sensor_type]
 
     @property
     def device_info(self) -> DeviceInfo:
         """Return information about the device this sensor belongs to."""
-        language = self._coordinator.language
-        entity_names = ENTITY_NAMES.get(language, ENTITY_NAMES["he"])
-
-        return DeviceInfo(
-            identifiers={(DOMAIN, self._entry.entry_id)},
-            name=entity_names["device_name"],
-            manufacturer="Yuval Mejahez",
-            model="School Calendar Tracker",
-            sw_version=VERSION,
-            configuration_url="https://github.com/rt400/School-Vacation",
-        )
+        return self._coordinator.descriptions.device_info
 
     @property
     def native_value(self) -> Optional[str]:
@@ -117,7 +151,8 @@ class SchoolHolidaysSensor(CoordinatorEntity, SensorEntity):
         """
         Return additional state attributes for the sensor.
 
-        Includes elementary/high school vacation status, last update, and language.
+        Includes elementary/high school vacation status, the next vacation
+        starts/ends, last update, and language.
         """
         if not self.coordinator.data:
             return {}
@@ -125,7 +160,8 @@ class SchoolHolidaysSensor(CoordinatorEntity, SensorEntity):
         return {
             "elementary_vacation": self.coordinator.data.get("elementary_vacation"),
             "high_vacation": self.coordinator.data.get("high_vacation"),
-            "last_update": self.coordinator.data.get("last_update"),
+            "upcoming_transitions": self.coordinator.data.get("upcoming_transitions"),
+            "last_update": self._coordinator.last_update.isoformat(),
             "language": self._coordinator.language,
         }
 
@@ -133,3 +169,142 @@ class SchoolHolidaysSensor(CoordinatorEntity, SensorEntity):
     def available(self) -> bool:
         """Return True if the sensor is available."""
         return self.coordinator.last_update_success
+
+
+class SchoolHolidaysCountdownSensor(CoordinatorEntity, SensorEntity):
+    """
+    Countdown sensor for one school level, in days.
+
+    Values change every day, so while one of these sensors is enabled the
+    coordinator refreshes at every midnight. They are disabled by default.
+    """
+
+    _attr_entity_registry_enabled_default = False
+    _attr_native_unit_of_measurement = UnitOfTime.DAYS
+
+    def __init__(
+        self,
+        coordinator: SchoolHolidaysCoordinator,
+        sensor_type: str,
+        entry: ConfigEntry
+    ) -> None:
+        """
+        Initialize the countdown sensor.
+
+        Args:
+            coordinator: The coordinator instance providing data updates
+            sensor_type: Key of COUNTDOWN_SENSOR_TYPES
+            entry: The associated config entry
+        """
+        super().__init__(coordinator)
+        self._sensor_type = sensor_type
+        self._entry = entry
+        self._coordinator = coordinator
+
+        self.entity_id = f"sensor.{sensor_type}"
+        self._attr_unique_id = f"{entry.entry_id}_{sensor_type}"
+        self._attr_icon = COUNTDOWN_SENSOR_TYPES[sensor_type]["icon"]
+
+    async def async_added_to_hass(self) -> None:
+        """Ask the coordinator for daily refreshes while this sensor exists."""
+        await super().async_added_to_hass()
+        self.async_on_remove(self._coordinator.async_add_daily_listener())
+
+    @property
+    def name(self) -> str:
+        """Return the sensor name according to the selected language."""
+        return self._coordinator.descriptions.names[self._sensor_type]
+
+    @property
+    def device_info(self) -> DeviceInfo:
+        """Return information about the device this sensor belongs to."""
+        return self._coordinator.descriptions.device_info
+
+    @property
+    def native_value(self) -> Optional[int]:
+        """Return the number of days, or None if the dataset does not reach it."""
+        if not self.coordinator.data:
+            return None
+        return self.coordinator.data.get(self._sensor_type)
+
+    @property
+    def available(self) -> bool:
+        """Return True if the sensor is available."""
+        return self.coordinator.last_update_success
+
+
+class SchoolHolidaysMetricSensor(CoordinatorEntity, SensorEntity):
+    """
+    Diagnostic sensor reporting one refresh or dataset metric.
+
+    Metrics change on every refresh, including refreshes that leave the
+    coordinator data unchanged or fail, so these sensors are updated by a
+    metrics listener of the coordinator. They are disabled by default.
+    """
+
+    _attr_entity_category = EntityCategory.DIAGNOSTIC
+    _attr_entity_registry_enabled_default = False
+    # Running statistics would add a recorder row on every refresh
+    _unrecorded_attributes = frozenset({"count", "mean", "max", "errors", "last_error"})
+
+    def __init__(
+        self,
+        coordinator: SchoolHolidaysCoordinator,
+        sensor_type: str,
+        entry: ConfigEntry
+    ) -> None:
+        """
+        Initialize the diagnostic sensor.
+
+        Args:
+            coordinator: The coordinator instance whose metrics are reported
+            sensor_type: Key of METRIC_SENSOR_TYPES
+            entry: The associated config entry
+        """
+        super().__init__(coordinator)
+        self._sensor_type = sensor_type
+        self._entry = entry
+        self._coordinator = coordinator
+
+        self.entity_id = f"sensor.school_holidays_{sensor_type}"
+        self._attr_unique_id = f"{entry.entry_id}_{sensor_type}"
+        self._attr_icon = METRIC_SENSOR_TYPES[sensor_type]["icon"]
+        unit = METRIC_SENSOR_TYPES[sensor_type]["unit"]
+        if unit is None:
+            self._attr_state_class = SensorStateClass.TOTAL_INCREASING
+        else:
+            self._attr_native_unit_of_measurement = unit
+            self._attr_device_class = SensorDeviceClass.DURATION
+            self._attr_state_class = SensorStateClass.MEASUREMENT
+
+    async def async_added_to_hass(self) -> None:
+        """Update the sensor after every refresh of the coordinator."""
+        await super().async_added_to_hass()
+        self.async_on_remove(
+            self._coordinator.async_add_metrics_listener(self.async_write_ha_state)
+        )
+
+    @property
+    def name(self) -> str:
+        """Return the sensor name according to the selected language."""
+        return self._coordinator.descriptions.names[self._sensor_type]
+
+    @property
+    def device_info(self) -> DeviceInfo:
+        """Return information about the device this sensor belongs to."""
+        return self._coordinator.descriptions.device_info
+
+    @property
+    def native_value(self) -> Optional[float]:
+        """Return the current value of the metric."""
+        return _METRIC_VALUES[self._sensor_type](self._coordinator)[0]
+
+    @property
+    def extra_state_attributes(self) -> Dict[str, Any]:
+        """Return the running statistics of the metric."""
+        return _METRIC_VALUES[self._sensor_type](self._coordinator)[1]
+
+    @property
+    def available(self) -> bool:
+        """Return True; metrics stay readable when a refresh fails."""
+        return True
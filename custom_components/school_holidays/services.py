@@ -0,0 +1,247 @@
+"""
+Services for the Israel School Holidays integration.
+
+evaluate_dates returns the elementary/high vacation status and summary of a
+list of dates or a date range in one response, evaluated against the
+compiled calendar of a config entry.
+
+add_override and remove_override edit the override layers of a config entry
+(extra vacation, make-up school day, strike). They update the entry options,
+which are applied in place without reloading the entry.
+
+import_statistics writes the daily vacation and school day counts of whole
+academic years to long-term statistics (see long_term_statistics.py).
+"""
+
+from datetime import date
+from typing import Dict, Tuple
+
+import voluptuous as vol
+
+from homeassistant.core import (
+    HomeAssistant,
+    ServiceCall,
+    ServiceResponse,
+    SupportsResponse,
+)
+from homeassistant.exceptions import ServiceValidationError
+from homeassistant.helpers import config_validation as cv
+from homeassistant.util import dt as dt_util
+
+from .const import (
+    DOMAIN,
+    SERVICE_EVALUATE_DATES,
+    ATTR_CONFIG_ENTRY_ID,
+    ATTR_DATES,
+    ATTR_START_DATE,
+    ATTR_END_DATE,
+    MAX_EVALUATE_DAYS,
+    SERVICE_ADD_OVERRIDE,
+    SERVICE_REMOVE_OVERRIDE,
+    ATTR_TYPE,
+    ATTR_LEVEL,
+    ATTR_SUMMARY,
+    CONF_OVERRIDES,
+    LEVEL_ELEMENTARY,
+    LEVEL_HIGH,
+    OVERRIDE_TYPES,
+    OVERRIDE_LEVEL_ALL,
+    SERVICE_IMPORT_STATISTICS,
+    ATTR_START_YEAR,
+    ATTR_END_YEAR,
+    MAX_IMPORT_YEARS,
+)
+from .coordinator import SchoolHolidaysCoordinator
+from .dataset import check_supported_range, supported_years
+from .long_term_statistics import async_import_statistics
+from .overrides import Override, build_override, overrides_to_option
+
+EVALUATE_DATES_SCHEMA = vol.All(
+    vol.Schema({
+        vol.Optional(ATTR_CONFIG_ENTRY_ID): cv.string,
+        vol.Exclusive(ATTR_DATES, "selection"): vol.All(
+            cv.ensure_list, [cv.date], vol.Length(min=1, max=MAX_EVALUATE_DAYS)
+        ),
+        vol.Inclusive(ATTR_START_DATE, "range"): cv.date,
+        vol.Inclusive(ATTR_END_DATE, "range"): cv.date,
+    }),
+    cv.has_at_least_one_key(ATTR_DATES, ATTR_START_DATE),
+)
+
+ADD_OVERRIDE_SCHEMA = vol.Schema({
+    vol.Optional(ATTR_CONFIG_ENTRY_ID): cv.string,
+    vol.Required(ATTR_START_DATE): cv.date,
+    vol.Optional(ATTR_END_DATE): cv.date,
+    vol.Required(ATTR_TYPE): vol.In(OVERRIDE_TYPES),
+    vol.Optional(ATTR_LEVEL, default=OVERRIDE_LEVEL_ALL): vol.In(
+        (OVERRIDE_LEVEL_ALL, LEVEL_ELEMENTARY, LEVEL_HIGH)
+    ),
+    vol.Optional(ATTR_SUMMARY): cv.string,
+})
+
+REMOVE_OVERRIDE_SCHEMA = vol.Schema({
+    vol.Optional(ATTR_CONFIG_ENTRY_ID): cv.string,
+    vol.Required(ATTR_START_DATE): cv.date,
+    vol.Optional(ATTR_END_DATE): cv.date,
+    vol.Optional(ATTR_TYPE): vol.In(OVERRIDE_TYPES),
+})
+
+IMPORT_STATISTICS_SCHEMA = vol.Schema({
+    vol.Optional(ATTR_CONFIG_ENTRY_ID): cv.string,
+    vol.Required(ATTR_START_YEAR): vol.All(vol.Coerce(int), vol.Range(min=1900, max=2200)),
+    vol.Optional(ATTR_END_YEAR): vol.All(vol.Coerce(int), vol.Range(min=1900, max=2200)),
+})
+
+
+def _get_coordinator(hass: HomeAssistant, call: ServiceCall) -> SchoolHolidaysCoordinator:
+    """Return the coordinator a service call targets (the first entry by default)."""
+    coordinators: Dict[str, SchoolHolidaysCoordinator] = {
+        key: value
+        for key, value in hass.data.get(DOMAIN, {}).items()
+        if isinstance(value, SchoolHolidaysCoordinator)
+    }
+    entry_id = call.data.get(ATTR_CONFIG_ENTRY_ID)
+    if entry_id is None:
+        if not coordinators:
+            raise ServiceValidationError("No Israel School Holidays entry is loaded")
+        return next(iter(coordinators.values()))
+    if entry_id not in coordinators:
+        raise ServiceValidationError(f"Unknown Israel School Holidays entry: {entry_id}")
+    return coordinators[entry_id]
+
+
+async def _async_evaluate_dates(hass: HomeAssistant, call: ServiceCall) -> ServiceResponse:
+    """Handle the evaluate_dates service call."""
+    coordinator = _get_coordinator(hass, call)
+
+    if ATTR_DATES in call.data:
+        dates = call.data[ATTR_DATES]
+        _check_span(min(dates), max(dates))
+        return {"dates": await coordinator.async_evaluate_dates(dates)}
+
+    start: date = call.data[ATTR_START_DATE]
+    end: date = call.data[ATTR_END_DATE]
+    if end < start:
+        raise ServiceValidationError("end_date must not be before start_date")
+    _check_span(start, end)
+    return {"dates": await coordinator.async_evaluate_range(start, end)}
+
+
+def _check_span(first: date, last: date) -> None:
+    """
+    Validate the span of the dates an evaluate_dates call reaches.
+
+    Raises:
+        ServiceValidationError: If the dates are too far apart or outside the
+            academic years the dataset supports
+    """
+    if (last - first).days >= MAX_EVALUATE_DAYS:
+        raise ServiceValidationError(f"Dates are limited to a span of {MAX_EVALUATE_DAYS} days")
+    try:
+        check_supported_range(first, last)
+    except vol.Invalid as err:
+        raise ServiceValidationError(str(err)) from err
+
+
+def _set_overrides(
+    hass: HomeAssistant,
+    coordinator: SchoolHolidaysCoordinator,
+    overrides: Tuple[Override, ...],
+) -> None:
+    """Store the overrides in the entry options; the update listener applies them."""
+    entry = coordinator.entry
+    hass.config_entries.async_update_entry(
+        entry, options={**entry.options, CONF_OVERRIDES: overrides_to_option(overrides)}
+    )
+
+
+def _async_add_override(hass: HomeAssistant, call: ServiceCall) -> None:
+    """Handle the add_override service call."""
+    coordinator = _get_coordinator(hass, call)
+    try:
+        override = build_override(
+            call.data[ATTR_START_DATE],
+            call.data.get(ATTR_END_DATE),
+            call.data[ATTR_TYPE],
+            call.data[ATTR_LEVEL],
+            call.data.get(ATTR_SUMMARY),
+        )
+    except vol.Invalid as err:
+        raise ServiceValidationError(str(err)) from err
+    _set_overrides(hass, coordinator, (*coordinator.options.overrides, override))
+
+
+def _async_remove_override(hass: HomeAssistant, call: ServiceCall) -> None:
+    """Handle the remove_override service call (removes overlapping overrides)."""
+    coordinator = _get_coordinator(hass, call)
+    start: date = call.data[ATTR_START_DATE]
+    end: date = call.data.get(ATTR_END_DATE, start)
+    kind = call.data.get(ATTR_TYPE)
+
+    kept = tuple(
+        override
+        for override in coordinator.options.overrides
+        if override.end < start
+        or override.start > end
+        or (kind is not None and override.kind != kind)
+    )
+    if len(kept) == len(coordinator.options.overrides):
+        raise ServiceValidationError("No matching override found")
+    _set_overrides(hass, coordinator, kept)
+
+
+async def _async_import_statistics(hass: HomeAssistant, call: ServiceCall) -> ServiceResponse:
+    """Handle the import_statistics service call."""
+    coordinator = _get_coordinator(hass, call)
+    if "recorder" not in hass.config.components:
+        raise ServiceValidationError("The recorder integration is not loaded")
+
+    first_year: int = call.data[ATTR_START_YEAR]
+    last_year: int = call.data.get(ATTR_END_YEAR, first_year)
+    if last_year < first_year:
+        raise ServiceValidationError("end_year must not be before start_year")
+    if last_year - first_year >= MAX_IMPORT_YEARS:
+        raise ServiceValidationError(f"At most {MAX_IMPORT_YEARS} academic years can be imported")
+    years = supported_years(dt_util.now().date())
+    if first_year not in years or last_year not in years:
+        raise ServiceValidationError(
+            f"Only academic years {years[0]} to {years[-1]} can be imported"
+        )
+    return await async_import_statistics(hass, coordinator, first_year, last_year)
+
+
+def async_setup_services(hass: HomeAssistant) -> None:
+    """Register the integration services."""
+
+    async def async_evaluate_dates(call: ServiceCall) -> ServiceResponse:
+        return await _async_evaluate_dates(hass, call)
+
+    async def async_add_override(call: ServiceCall) -> None:
+        _async_add_override(hass, call)
+
+    async def async_remove_override(call: ServiceCall) -> None:
+        _async_remove_override(hass, call)
+
+    async def async_import_statistics_service(call: ServiceCall) -> ServiceResponse:
+        return await _async_import_statistics(hass, call)
+
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_EVALUATE_DATES,
+        async_evaluate_dates,
+        schema=EVALUATE_DATES_SCHEMA,
+        supports_response=SupportsResponse.ONLY,
+    )
+    hass.services.async_register(
+        DOMAIN, SERVICE_ADD_OVERRIDE, async_add_override, schema=ADD_OVERRIDE_SCHEMA
+    )
+    hass.services.async_register(
+        DOMAIN, SERVICE_REMOVE_OVERRIDE, async_remove_override, schema=REMOVE_OVERRIDE_SCHEMA
+    )
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_IMPORT_STATISTICS,
+        async_import_statistics_service,
+        schema=IMPORT_STATISTICS_SCHEMA,
+        supports_response=SupportsResponse.OPTIONAL,
+    )
@@ -0,0 +1,133 @@
+"""
+Persisted status snapshots for the Israel School Holidays integration.
+
+After every successful refresh the coordinator saves its payload, and the
+current or next vacation of each school level, to a Home Assistant Store.
+At startup an entry whose snapshot was taken today with the same options
+restores it right away, so its entities have a state before the dataset is
+loaded; the real calculation then runs in the background.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+from datetime import date
+from typing import Any, Dict, NamedTuple, Optional
+
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.storage import Store
+
+from .const import DOMAIN, VERSION
+from .compiled_calendar import VacationEvent
+
+_LOGGER = logging.getLogger(__name__)
+
+STORAGE_VERSION = 1
+# Refreshes in quick succession (option changes) are written once
+SAVE_DELAY = 10  # seconds
+
+
+class StatusSnapshot(NamedTuple):
+    """The coordinator payload and upcoming vacations of one day."""
+
+    day: date
+    data: Dict[str, Any]
+    # Current or next vacation by school level (None past the dataset)
+    events: Dict[str, Optional[VacationEvent]]
+
+
+def _options_fingerprint(entry: ConfigEntry) -> str:
+    """Return a digest of the entry options the snapshot was calculated with."""
+    options = json.dumps(dict(entry.options), sort_keys=True, default=str)
+    return hashlib.sha1(options.encode(), usedforsecurity=False).hexdigest()
+
+
+def _event_to_dict(event: Optional[VacationEvent]) -> Optional[Dict[str, str]]:
+    """Return the stored form of a vacation event."""
+    if event is None:
+        return None
+    return {
+        "start": event.start.isoformat(),
+        "end": event.end.isoformat(),
+        "summary": event.summary,
+    }
+
+
+def _event_from_dict(raw: Optional[Dict[str, str]]) -> Optional[VacationEvent]:
+    """Rebuild a stored vacation event."""
+    if raw is None:
+        return None
+    return VacationEvent(
+        date.fromisoformat(raw["start"]), date.fromisoformat(raw["end"]), raw["summary"]
+    )
+
+
+class StatusSnapshotStore:
+    """Store holding the last status snapshot of one config entry."""
+
+    def __init__(self, hass: HomeAssistant, entry: ConfigEntry) -> None:
+        """
+        Initialize the store.
+
+        Args:
+            hass: Home Assistant instance
+            entry: Config entry the snapshots belong to
+        """
+        self._entry = entry
+        self._store: Store = Store(
+            hass, STORAGE_VERSION, f"{DOMAIN}.snapshot_{entry.entry_id}"
+        )
+
+    async def async_load(self, today: date) -> Optional[StatusSnapshot]:
+        """
+        Load the snapshot if it is still valid.
+
+        Args:
+            today: Current date in the Home Assistant timezone
+
+        Returns:
+            The snapshot, or None if there is none, it was taken on another
+            day, with other options or by another integration version
+        """
+        stored = await self._store.async_load()
+        if (
+            not isinstance(stored, dict)
+            or stored.get("day") != today.isoformat()
+            or stored.get("version") != VERSION
+            or stored.get("options") != _options_fingerprint(self._entry)
+        ):
+            return None
+        try:
+            if not isinstance(stored["data"], dict):
+                raise TypeError("data is not a dictionary")
+            return StatusSnapshot(
+                today,
+                stored["data"],
+                {level: _event_from_dict(raw) for level, raw in stored["events"].items()},
+            )
+        except (AttributeError, KeyError, TypeError, ValueError) as err:
+            _LOGGER.warning("Ignoring invalid status snapshot: %s", err)
+            return None
+
+    @callback
+    def async_save(self, snapshot: StatusSnapshot) -> None:
+        """Save a snapshot after a short delay, replacing any pending save."""
+        self._store.async_delay_save(
+            lambda: {
+                "day": snapshot.day.isoformat(),
+                "version": VERSION,
+                "options": _options_fingerprint(self._entry),
+                "data": snapshot.data,
+                "events": {
+                    level: _event_to_dict(event) for level, event in snapshot.events.items()
+                },
+            },
+            SAVE_DELAY,
+        )
+
+    async def async_remove(self) -> None:
+        """Delete the stored snapshot."""
+        await self._store.async_remove()
@@ -0,0 +1,105 @@
+"""
+Websocket API for the Israel School Holidays integration.
+
+Dashboard cards showing a month or a school year ask for a per-day status
+grid with ``school_holidays/month`` instead of computing it client-side:
+
+    {"type": "school_holidays/month", "year": 2026, "month": 3}
+    {"type": "school_holidays/month", "year": 2026}   (academic year 2026-2027)
+
+Grids are cached by the entry's coordinator until the dataset or the
+options it was computed with change (see async_status_grid), so repeat
+dashboard loads are answered from memory. Only the academic years the
+dataset supports (see supported_years) can be requested, so dashboards
+cannot make the engine load arbitrary years.
+"""
+
+from __future__ import annotations
+
+import calendar
+from datetime import date
+from typing import Any, Dict, Optional
+
+import voluptuous as vol
+
+from homeassistant.components import websocket_api
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.util import dt as dt_util
+
+from .const import DOMAIN, ATTR_CONFIG_ENTRY_ID
+from .coordinator import SchoolHolidaysCoordinator
+from .dataset import academic_year, supported_years
+
+WS_TYPE_MONTH = f"{DOMAIN}/month"
+
+
+@callback
+def async_setup_websocket_api(hass: HomeAssistant) -> None:
+    """Register the websocket commands once, independent of config entries."""
+    websocket_api.async_register_command(hass, websocket_month)
+
+
+def _find_coordinator(
+    hass: HomeAssistant, entry_id: Optional[str]
+) -> Optional[SchoolHolidaysCoordinator]:
+    """Return the coordinator of an entry (the first entry by default)."""
+    for key, value in hass.data.get(DOMAIN, {}).items():
+        if isinstance(value, SchoolHolidaysCoordinator) and entry_id in (None, key):
+            return value
+    return None
+
+
+@websocket_api.websocket_command(
+    {
+        vol.Required("type"): WS_TYPE_MONTH,
+        vol.Optional(ATTR_CONFIG_ENTRY_ID): str,
+        vol.Required("year"): vol.All(int, vol.Range(min=1900, max=2200)),
+        vol.Optional("month"): vol.All(int, vol.Range(min=1, max=12)),
+    }
+)
+@websocket_api.async_response
+async def websocket_month(
+    hass: HomeAssistant,
+    connection: websocket_api.ActiveConnection,
+    msg: Dict[str, Any],
+) -> None:
+    """
+    Return the elementary/high status and summary of every day of a period.
+
+    The period is a calendar month if "month" is given, otherwise the
+    academic year starting in September of "year". Periods outside the
+    supported academic years are answered with an error.
+    """
+    coordinator = _find_coordinator(hass, msg.get(ATTR_CONFIG_ENTRY_ID))
+    if coordinator is None:
+        connection.send_error(
+            msg["id"], websocket_api.ERR_NOT_FOUND, "No matching Israel School Holidays entry"
+        )
+        return
+
+    year = msg["year"]
+    if "month" in msg:
+        month = msg["month"]
+        start = date(year, month, 1)
+        end = date(year, month, calendar.monthrange(year, month)[1])
+    else:
+        start, end = date(year, 9, 1), date(year + 1, 8, 31)
+
+    years = supported_years(dt_util.now().date())
+    if academic_year(start) not in years:
+        connection.send_error(
+            msg["id"],
+            websocket_api.ERR_INVALID_FORMAT,
+            f"Only academic years {years[0]} to {years[-1]} are supported",
+        )
+        return
+
+    connection.send_result(
+        msg["id"],
+        {
+            ATTR_CONFIG_ENTRY_ID: coordinator.entry.entry_id,
+            "start": start.isoformat(),
+            "end": end.isoformat(),
+            "days": await coordinator.async_status_grid(start, end),
+        },
+    )